@@ -1,14 +1,21 @@
-from core.application_controller import ApplicationController
-from PyQt5.QtWidgets import QApplication
-from data.readers import LasLazReader
-from ui.main_window import MainWindow
-from core.logger import Logger
 import sys
 
 def main():
+    # Karo ve toplu iş havuzları (spawn) bu modülü yeniden içe aktarır;
+    # Qt ve arayüz modülleri yalnızca uygulama başlarken yüklenir
+    from core.application_controller import ApplicationController
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import QCoreApplication, Qt
+    from data.readers import PointCloudReader
+    from ui.main_window import MainWindow
+    from core.logger import Logger
+
+    # QtWebEngine sonradan (görünümler kurulurken) yüklendiği için
+    # OpenGL bağlam paylaşımı QApplication'dan önce açılmalıdır
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     app_logger = Logger()
-    reader_instance = LasLazReader() 
+    reader_instance = PointCloudReader()
     app_controller = ApplicationController(
         basic_reader=reader_instance, 
         metadata_extractor=reader_instance,
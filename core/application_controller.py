@@ -2,8 +2,10 @@ from data.data_handler import IBasicReader, IMetadataExtractor, IDataSampler
 from core.controllers.process_controller import ProcessController
 from core.controllers.data_controller import DataController
 from core.controllers.io_controller import IOController
+from core.job_scheduler import JobScheduler
 from PyQt5.QtCore import QObject, pyqtSignal
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
+from core.render_utils import RenderUtils
 from core.enums import Dimensions
 from core.logger import Logger
 import os
@@ -40,6 +42,13 @@ class ApplicationController(QObject):
     # Export Sinyalleri
     export_success_signal = pyqtSignal(str)
 
+    # İş Paneli Sinyalleri
+    job_added_signal = pyqtSignal(dict)
+    job_changed_signal = pyqtSignal(dict)
+
+    # Renk rampasının kapsadığı yüzdelik aralığı
+    COLOR_RANGE = (0.02, 0.98)
+
     def __init__(
         self,
         basic_reader: IBasicReader,
@@ -51,11 +60,16 @@ class ApplicationController(QObject):
 
         super().__init__(parent)
         self.logger = logger
+        # Tüm denetleyiciler aynı sınırlı iş havuzunu paylaşır
+        self.scheduler = JobScheduler(parent=self)
         self.data_controller = DataController(
-            basic_reader, metadata_extractor, data_sampler, logger
+            basic_reader, metadata_extractor, data_sampler, logger, self.scheduler
+        )
+        self.process_controller = ProcessController(
+            self.data_controller, logger, self.scheduler
         )
-        self.process_controller = ProcessController(self.data_controller, logger)
-        self.io_controller = IOController(self.data_controller, logger)
+        self.io_controller = IOController(self.data_controller, logger, self.scheduler)
+        self._camera_state: Optional[Dict[str, Any]] = None
 
         self._connect_signals()
 
@@ -63,6 +77,8 @@ class ApplicationController(QObject):
         # --- DataController Sinyalleri ---
         self.data_controller.file_loaded.connect(self._on_file_loaded)
         self.data_controller.file_removed.connect(self._on_layer_removed)
+        self.data_controller.layer_refined.connect(self._on_layer_refined)
+        self.data_controller.lod_ready.connect(self._update_lod_layer)
         self.data_controller.progress_update.connect(self.progress_update_signal)
         self.data_controller.status_message.connect(self.ui_status_message_signal)
 
@@ -78,6 +94,10 @@ class ApplicationController(QObject):
         self.io_controller.progress_update.connect(self.progress_update_signal)
         self.io_controller.status_message.connect(self.ui_status_message_signal)
 
+        # --- JobScheduler Sinyalleri ---
+        self.scheduler.job_added.connect(self.job_added_signal)
+        self.scheduler.job_changed.connect(self.job_changed_signal)
+
         # --- Loglama Sinyalleri ---
         for controller in [
             self.data_controller,
@@ -92,23 +112,48 @@ class ApplicationController(QObject):
         else:
             self.log_info_signal.emit(message)
 
+    def cancel_running_operations(self):
+        cancelled = (
+            self.scheduler.cancel_all() + self.data_controller.cancel_db_operations()
+        )
+        if cancelled:
+            self.ui_status_message_signal.emit(f"Cancelling {cancelled} operation(s)...", 0)
+        else:
+            self.ui_status_message_signal.emit("No running operation to cancel.", 3000)
+
+    def get_jobs(self) -> List[Dict[str, Any]]:
+        return self.scheduler.jobs()
+
     def start_file_loading(self, file_path: str):
         self.data_controller.load_file(file_path)
 
-    def start_merge_process(self, file_paths: list):
-        self.data_controller.merge_layers(file_paths)
+    def start_merge_process(
+        self,
+        file_paths: list,
+        output_path: str,
+        output_format: Optional[str] = None,
+        threads: Optional[int] = None,
+    ):
+        self.data_controller.merge_layers(file_paths, output_path, output_format, threads)
 
     def handle_remove_layer(self, file_path: str):
         self.data_controller.remove_layer(file_path)
 
     def start_filter_process(
-        self, file_path: str, tool_name: str, user_params: Dict[str, Any]
+        self,
+        file_path: str,
+        tool_name: str,
+        user_params: Dict[str, Any],
+        tiling: Optional[Dict[str, Any]] = None,
     ):
-        self.process_controller.apply_filter(file_path, tool_name, user_params)
+        self.process_controller.apply_filter(file_path, tool_name, user_params, tiling)
 
     def handle_remove_stage(self, file_path: str, stage_index: int):
         self.process_controller.remove_stage(file_path, stage_index)
 
+    def handle_toggle_stage(self, file_path: str, stage_index: int, is_active: bool):
+        self.process_controller.toggle_stage(file_path, stage_index, is_active)
+
     def start_stats_process(self, file_path: str):
         self.process_controller.calculate_statistics(file_path)
 
@@ -119,8 +164,14 @@ class ApplicationController(QObject):
         self.data_controller.active_layer_path = file_path
         self.handle_single_click(file_path, os.path.basename(file_path))
 
-    def start_export_process(self, file_path: str, save_path: str):
-        self.io_controller.export_layer(file_path, save_path)
+    def start_export_process(
+        self,
+        file_path: str,
+        save_path: str,
+        output_format: Optional[str] = None,
+        threads: Optional[int] = None,
+    ):
+        self.io_controller.export_layer(file_path, save_path, output_format, threads)
 
     def save_pipeline(self, file_path: str, save_path: str):
         self.io_controller.save_pipeline(file_path, save_path)
@@ -130,7 +181,73 @@ class ApplicationController(QObject):
 
     def get_layer_data(self, file_path: str) -> Optional[Any]:
         context = self.data_controller.get_layer(file_path)
-        return context.current_render_data if context else None
+        if not context:
+            return None
+        if context.lod_render_data is not None and not context.stages:
+            return context.lod_render_data
+        return context.current_render_data
+
+    def get_distributions(self, file_path: str) -> Dict[str, Any]:
+        """Katmanın aktif zinciri için boyut çizelgeleri (DimensionSketch)."""
+        context = self.data_controller.get_layer(file_path)
+        return context.get_distributions() if context else {}
+
+    def get_point_spacing(self, file_path: str) -> Optional[float]:
+        """Katmanın ortalama XY nokta aralığı (karo tamponu önerisi için)."""
+        context = self.data_controller.get_layer(file_path)
+        return context.get_point_spacing() if context else None
+
+    def get_color_range(self, file_path: str, style_name: str) -> Optional[Tuple[float, float]]:
+        """
+        Sürekli renk rampasının sınırları (%2 - %98). Katman çizelgelerinden
+        okunur; LOD düğümleri değişse de rampa sabit kalır. Kategorik ve RGB
+        stillerde None döner.
+        """
+        if style_name in (Dimensions.CLASSIFICATION, Dimensions.RGB):
+            return None
+        dimension = Dimensions.INTENSITY if style_name == Dimensions.INTENSITY else Dimensions.Z
+
+        sketch = self.get_distributions(file_path).get(dimension.value)
+        if sketch is None or sketch.count == 0:
+            return None
+        low, high = (float(v) for v in sketch.quantiles(self.COLOR_RANGE))
+        if low == high:
+            high += 0.001
+        return low, high
+
+    def handle_camera_change(self, camera_state: Dict[str, Any]):
+        self._camera_state = camera_state
+        for file_path in self.data_controller.get_layer_paths():
+            self._update_lod_layer(file_path)
+
+    def _update_lod_layer(self, file_path: str):
+        context = self.data_controller.get_layer(file_path)
+        if (
+            not context
+            or context.octree is None
+            or context.stages
+            or not context.is_visible
+            or self._camera_state is None
+        ):
+            return
+
+        keys = context.octree.select_nodes(
+            self._camera_state["planes"],
+            self._camera_state["position"],
+            RenderUtils.MAX_VISIBLE_POINTS,
+        )
+        if not keys or keys == context.lod_node_keys:
+            return
+
+        try:
+            render_data = context.octree.load_render_data(keys)
+        except Exception as e:
+            self.logger.error(f"LOD nodes could not be loaded: {e}")
+            return
+
+        context.lod_node_keys = keys
+        context.lod_render_data = render_data
+        self._refresh_layer_view(file_path)
 
     def handle_single_click(self, file_path: str, file_name: str):
         context = self.data_controller.get_layer(file_path)
@@ -212,8 +329,25 @@ class ApplicationController(QObject):
             current_style = getattr(context, "active_style", Dimensions.Z)
             self.render_data_signal.emit(file_path, current_style, False)
 
-    def start_batch_process(self, file_path: str, stages: list):
-        self.process_controller.apply_batch_process(file_path, stages)
+    def _on_layer_refined(self, file_path: str):
+        context = self.data_controller.get_layer(file_path)
+        if context and context.is_visible:
+            self._refresh_layer_view(file_path)
+
+    def start_batch_process(
+        self,
+        file_path: str,
+        stages: list,
+        export_path: Optional[str] = None,
+        output_format: Optional[str] = None,
+        threads: Optional[int] = None,
+    ):
+        self.process_controller.apply_batch_process(
+            file_path, stages, export_path, output_format, threads
+        )
+
+    def start_multi_file_batch(self, input_paths: list, stages: list, options: dict):
+        self.process_controller.apply_batch_to_files(input_paths, stages, **options)
 
     def _on_file_loaded(self, file_path: str, file_name: str):
         self.file_load_success_signal.emit(file_path, file_name)
@@ -0,0 +1,254 @@
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional
+from data.writers import WriterFactory, CopcWriter
+from core.pipeline_process import terminate_pool
+from dataclasses import dataclass
+import multiprocessing
+import traceback
+import json
+import os
+
+
+def _temp_path(output_path: str) -> str:
+    folder, name = os.path.split(output_path)
+    return os.path.join(folder, f".part_{name}")
+
+
+def _process_file(input_path: str, pipeline_config: list, output_path: str) -> int:
+    """
+    Tek bir dosyayı ayrı bir işlemde çalıştırır. Çıktı önce geçici adla
+    yazılır; yarım kalan dosyalar sonraki çalıştırmada tamamlanmış sayılmaz.
+    """
+    import pdal
+    temp_path = _temp_path(output_path)
+
+    stages = [input_path] + pipeline_config[:-1]
+    writer_stage = dict(pipeline_config[-1], filename=temp_path)
+    stages.append(writer_stage)
+
+    try:
+        count = pdal.Pipeline(json.dumps(stages)).execute()
+        os.replace(temp_path, output_path)
+        return count
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+@dataclass
+class BatchFileResult:
+    input_path: str
+    output_path: str
+    status: bool = False
+    count: int = 0
+    attempts: int = 0
+    skipped: bool = False
+    error: str = ""
+
+
+class BatchEngine:
+    """
+    Aynı aşama listesini çok sayıda LAS/LAZ dosyasına süreç havuzu ile
+    uygular. Her dosya kendi işleminde tek bir PDAL pipeline'ı olarak
+    çalışır; hatalı dosyalar max_retries kez yeniden denenir.
+    Qt'ye bağımlı değildir; arayüz ve komut satırı aynı motoru kullanır.
+    """
+
+    INPUT_EXTENSIONS = (".las", ".laz")
+    CANCELLED = "Cancelled"
+    DEFAULT_TEMPLATE = "{stem}_processed{ext}"
+
+    def __init__(
+        self,
+        stage_configs: List[dict],
+        output_dir: str,
+        naming_template: str = DEFAULT_TEMPLATE,
+        output_format: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        max_retries: int = 1,
+        skip_existing: bool = False,
+        threads: Optional[int] = None,
+    ):
+        self.stage_configs = stage_configs
+        self.output_dir = output_dir
+        self.naming_template = naming_template or self.DEFAULT_TEMPLATE
+        self.output_format = output_format or WriterFactory.LAS
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.max_retries = max(0, max_retries)
+        self.skip_existing = skip_existing
+        # COPC yazıcısının dosya başına iş parçacığı sayısı; None ise çekirdekler
+        # paralel dosyalara bölünür
+        self.threads = max(1, threads) if threads else None
+        self._validate_template()
+
+    @staticmethod
+    def collect_files(folder: str, recursive: bool = False) -> List[str]:
+        """Klasördeki LAS/LAZ dosyalarını sıralı olarak döndürür."""
+        files = []
+        for root, dirs, names in os.walk(folder):
+            for name in names:
+                if name.lower().endswith(BatchEngine.INPUT_EXTENSIONS):
+                    files.append(os.path.join(root, name))
+            if not recursive:
+                break
+        return sorted(files)
+
+    def _validate_template(self):
+        try:
+            self.naming_template.format(stem="a", name="a.las", ext=".las", index=0)
+        except (KeyError, IndexError, ValueError) as e:
+            raise ValueError(
+                f"Invalid naming template '{self.naming_template}'. "
+                "Available fields: {stem}, {name}, {ext}, {index}"
+            ) from e
+
+    def output_path_for(self, input_path: str, index: int) -> str:
+        name = os.path.basename(input_path)
+        stem, ext = os.path.splitext(name)
+        if stem.lower().endswith(".copc"):
+            stem = stem[:-5]
+
+        if self.output_format == WriterFactory.COPC:
+            ext = CopcWriter.EXTENSION
+
+        file_name = self.naming_template.format(stem=stem, name=name, ext=ext, index=index)
+        return os.path.join(self.output_dir, file_name)
+
+    def _build_pipeline(self, output_path: str) -> list:
+        writer = WriterFactory.create(self.output_format, output_path)
+        # Paralellik dosya düzeyindedir; yazıcı iş parçacıkları çekirdeklere bölünür
+        threads = self.threads or max(1, (os.cpu_count() or 1) // self.max_workers)
+        writer_stage = writer.build_stage(output_path, threads=threads)
+        stages = []
+        for stage_conf in self.stage_configs:
+            if isinstance(stage_conf, list):
+                stages.extend(stage_conf)
+            else:
+                stages.append(stage_conf)
+        return stages + [writer_stage]
+
+    def plan(self, input_paths: List[str]) -> List[BatchFileResult]:
+        results = [
+            BatchFileResult(path, self.output_path_for(path, i))
+            for i, path in enumerate(input_paths)
+        ]
+
+        outputs = [os.path.normcase(os.path.abspath(r.output_path)) for r in results]
+        if len(set(outputs)) != len(outputs):
+            raise ValueError(
+                "Naming template produces duplicate output names. "
+                "Include {stem} or {index} in the template."
+            )
+        inputs = {os.path.normcase(os.path.abspath(p)) for p in input_paths}
+        if inputs.intersection(outputs):
+            raise ValueError("Output files would overwrite input files.")
+        return results
+
+    def run(
+        self,
+        input_paths: List[str],
+        progress_callback: Optional[Callable[[int, int, BatchFileResult], None]] = None,
+        cancel_callback: Optional[Callable[[], bool]] = None,
+    ) -> List[BatchFileResult]:
+        results = self.plan(input_paths)
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        total = len(results)
+        done = 0
+        pending: List[BatchFileResult] = []
+        for result in results:
+            if self.skip_existing and os.path.exists(result.output_path):
+                result.status = True
+                result.skipped = True
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total, result)
+            else:
+                pending.append(result)
+
+        # Qt uygulamasında fork güvenli değildir; işlemler temiz başlatılır
+        context = multiprocessing.get_context("spawn")
+        executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+        running: Dict = {}
+
+        try:
+            while pending or running:
+                if cancel_callback and cancel_callback():
+                    for result in pending + list(running.values()):
+                        result.error = self.CANCELLED
+                    # Sonlandırılan işlemler geçici dosyalarını silemez
+                    terminate_pool(executor)
+                    for result in running.values():
+                        temp_path = _temp_path(result.output_path)
+                        if os.path.exists(temp_path):
+                            os.remove(temp_path)
+                    break
+
+                while pending and len(running) < self.max_workers * 2:
+                    result = pending.pop(0)
+                    result.attempts += 1
+                    future = executor.submit(
+                        _process_file,
+                        result.input_path,
+                        self._build_pipeline(result.output_path),
+                        result.output_path,
+                    )
+                    running[future] = result
+
+                completed, _ = wait(list(running), timeout=0.5, return_when=FIRST_COMPLETED)
+                broken = False
+                for future in completed:
+                    result = running.pop(future)
+                    retry_limit = self.max_retries
+                    try:
+                        result.count = future.result()
+                        result.status = True
+                        result.error = ""
+                    except BrokenProcessPool as e:
+                        broken = True
+                        result.error = f"Worker process crashed: {e}"
+                        # Havuz çöktüğünde hangi dosyanın sebep olduğu bilinmez;
+                        # aynı anda çalışan dosyalara en az bir deneme daha tanınır
+                        retry_limit = max(self.max_retries, 1)
+                    except Exception as e:
+                        result.error = "".join(
+                            traceback.format_exception_only(type(e), e)
+                        ).strip()
+
+                    if not result.status and result.attempts <= retry_limit:
+                        pending.append(result)
+                        continue
+
+                    done += 1
+                    if progress_callback:
+                        progress_callback(done, total, result)
+
+                if broken:
+                    # Çöken bir işlem tüm havuzu bozar; kalan işler yeni havuzda sürer
+                    for future, result in running.items():
+                        result.attempts -= 1
+                        pending.append(result)
+                    running.clear()
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers, mp_context=context
+                    )
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return results
+
+    @staticmethod
+    def summarize(results: List[BatchFileResult]) -> Dict[str, int]:
+        return {
+            "total": len(results),
+            "succeeded": sum(1 for r in results if r.status and not r.skipped),
+            "skipped": sum(1 for r in results if r.skipped),
+            "failed": sum(
+                1 for r in results
+                if r.attempts and not r.status and r.error != BatchEngine.CANCELLED
+            ),
+            "cancelled": sum(1 for r in results if r.error == BatchEngine.CANCELLED),
+            "points": sum(r.count for r in results),
+        }
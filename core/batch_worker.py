@@ -0,0 +1,45 @@
+from core.batch_engine import BatchEngine, BatchFileResult
+from core.cancellable_worker import CancellableWorker
+from PyQt5.QtCore import pyqtSignal
+from typing import List
+import traceback
+
+
+class BatchFilesWorker(CancellableWorker):
+    """
+    BatchEngine'i arayüzü kilitlemeden arka planda çalıştırır. İptalde
+    cancelled yerine iptal edilen dosya sayısını içeren özet yayınlanır.
+    """
+
+    finished = pyqtSignal(dict)  # özet
+    error = pyqtSignal(str)
+    progress = pyqtSignal(int)
+    file_finished = pyqtSignal(str, bool, str)  # input_path, status, message
+
+    def __init__(self, engine: BatchEngine, input_paths: List[str]):
+        super().__init__()
+        self.engine = engine
+        self.input_paths = input_paths
+
+    def _on_file_done(self, done: int, total: int, result: BatchFileResult):
+        if result.skipped:
+            message = f"skipped (exists): {result.output_path}"
+        elif result.status:
+            message = f"{result.count:,} points -> {result.output_path}"
+        else:
+            message = f"failed after {result.attempts} attempt(s): {result.error}"
+
+        self.file_finished.emit(result.input_path, result.status, message)
+        self.progress.emit(int(done / total * 100) if total else 100)
+
+    def run(self):
+        try:
+            self.progress.emit(0)
+            results = self.engine.run(
+                self.input_paths,
+                progress_callback=self._on_file_done,
+                cancel_callback=lambda: self.is_interrupted,
+            )
+            self.finished.emit(BatchEngine.summarize(results))
+        except Exception as e:
+            self.error.emit(f"Batch processing failed: {e}\n{traceback.format_exc()}")
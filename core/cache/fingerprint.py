@@ -0,0 +1,25 @@
+from typing import Optional, Tuple
+import hashlib
+import os
+
+
+class Fingerprint:
+    """
+    Dosyaların değişip değişmediğini anlamak için kullanılan
+    anahtar üretim yardımcıları.
+    """
+
+    @staticmethod
+    def file_key(file_path: str) -> Optional[Tuple[str, int, int]]:
+        """(mutlak yol, mtime_ns, boyut) üçlüsünü döndürür; dosya yoksa None."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def key_hash(key: Tuple[str, int, int]) -> str:
+        """file_key çıktısını dosya adı olarak kullanılabilir bir özete çevirir."""
+        raw = "|".join(str(part) for part in key)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
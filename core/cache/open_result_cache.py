@@ -0,0 +1,54 @@
+from typing import Dict, Any, Optional, Tuple
+from collections import OrderedDict
+from core.render_utils import RenderUtils
+import threading
+
+
+class OpenResultCache:
+    """
+    Açılan dosyaların tek geçişte üretilen sonuçlarını (render örneği,
+    metadata, özet, WGS84 bounds) bellekte tutar.
+    """
+
+    MAX_BYTES = 512 * 1024 * 1024
+
+    _entries: "OrderedDict[Tuple[str, int, int], Tuple[Dict[str, Any], int]]" = OrderedDict()
+    _total_bytes = 0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _estimate_bytes(result: Dict[str, Any]) -> int:
+        return RenderUtils.render_data_nbytes(result.get("sample_data") or {})
+
+    @classmethod
+    def get(cls, key: Optional[Tuple[str, int, int]]) -> Optional[Dict[str, Any]]:
+        if key is None:
+            return None
+
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return None
+            cls._entries.move_to_end(key)
+            return dict(entry[0])
+
+    @classmethod
+    def put(cls, key: Optional[Tuple[str, int, int]], result: Dict[str, Any]):
+        if key is None or not result.get("status"):
+            return
+
+        size = cls._estimate_bytes(result)
+        if size > cls.MAX_BYTES:
+            return
+
+        with cls._lock:
+            old = cls._entries.pop(key, None)
+            if old is not None:
+                cls._total_bytes -= old[1]
+
+            cls._entries[key] = (dict(result), size)
+            cls._total_bytes += size
+
+            while cls._total_bytes > cls.MAX_BYTES and cls._entries:
+                _, (_, evicted_size) = cls._entries.popitem(last=False)
+                cls._total_bytes -= evicted_size
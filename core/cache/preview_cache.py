@@ -0,0 +1,132 @@
+from core.database.connection import CACHE_DIR
+from core.cache.fingerprint import Fingerprint
+from typing import Dict, Any, Optional, Tuple
+from core.render_utils import RenderUtils
+from core.enums import Dimensions
+import numpy as np
+import threading
+import os
+
+
+class PreviewCache:
+    """
+    Açılan dosyaların metadata'sını ve önizleme örneğini app.db yanında
+    kalıcı olarak saklar. Önizlemeler memory-map ile açılabilen .npy
+    dosyalarıdır; toplam boyut MAX_BYTES'ı aşarsa en eski kayıtlar silinir.
+    """
+
+    MAX_BYTES = 2 * 1024 * 1024 * 1024
+    PREVIEW_DIR = os.path.join(CACHE_DIR, "previews")
+    # Saklanan dizinin biçimi değişince eski kayıtlar eşleşmesin diye artırılır
+    FORMAT_VERSION = 2
+
+    _repository: Optional["Repository"] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def _get_repository(cls) -> "Repository":
+        with cls._lock:
+            if cls._repository is None:
+                from core.database.repository import Repository
+
+                cls._repository = Repository()
+            return cls._repository
+
+    @staticmethod
+    def _remove_files(paths: list):
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _sample_to_array(sample_data: Dict[str, Any]) -> Optional[np.ndarray]:
+        # Tam PDAL dizisi (dönüşler, GpsTime, ek boyutlar) olduğu gibi saklanır;
+        # aksi halde önbellekten açılan katman soğuk açılıştan farklı olurdu
+        points = sample_data.get(RenderUtils.POINTS_KEY)
+        if isinstance(points, np.ndarray) and points.dtype.names:
+            return np.ascontiguousarray(points)
+
+        fields = [
+            (key.value, value)
+            for key, value in sample_data.items()
+            if isinstance(key, Dimensions) and isinstance(value, np.ndarray)
+        ]
+        if not fields:
+            return None
+
+        count = len(fields[0][1])
+        array = np.empty(count, dtype=[(name, value.dtype) for name, value in fields])
+        for name, value in fields:
+            array[name] = value
+        return array
+
+    @classmethod
+    def _cache_key(cls, key: Tuple[str, int, int]) -> str:
+        return Fingerprint.key_hash(tuple(key) + (cls.FORMAT_VERSION,))
+
+    @classmethod
+    def get(cls, key: Optional[Tuple[str, int, int]]) -> Optional[Dict[str, Any]]:
+        if key is None:
+            return None
+
+        try:
+            entry = cls._get_repository().get_cache_entry(cls._cache_key(key))
+            if not entry:
+                return None
+
+            preview_path = entry["preview_path"]
+            if not os.path.exists(preview_path):
+                cls._get_repository().delete_cache_entry(entry["cache_key"])
+                return None
+
+            array = np.load(preview_path, mmap_mode="r")
+            return {
+                "status": True,
+                "bounds": entry["bounds"],
+                "full_metadata": entry["full_metadata"],
+                "summary_metadata": entry["summary_metadata"],
+                "sample_data": RenderUtils.to_render_data(array),
+            }
+        except Exception:
+            return None
+
+    @classmethod
+    def put(cls, key: Optional[Tuple[str, int, int]], result: Dict[str, Any]):
+        if key is None or not result.get("status"):
+            return
+
+        array = cls._sample_to_array(result.get("sample_data") or {})
+        if array is None or array.nbytes > cls.MAX_BYTES:
+            return
+
+        try:
+            cache_key = cls._cache_key(key)
+            os.makedirs(cls.PREVIEW_DIR, exist_ok=True)
+            preview_path = os.path.join(cls.PREVIEW_DIR, f"{cache_key}.npy")
+
+            # Yarım yazılmış dosyaların okunmaması için önce geçici dosyaya yaz
+            temp_path = f"{preview_path}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                np.save(f, array)
+            os.replace(temp_path, preview_path)
+
+            repository = cls._get_repository()
+            stale_paths = repository.save_cache_entry(
+                {
+                    "cache_key": cache_key,
+                    "file_path": key[0],
+                    "file_mtime_ns": key[1],
+                    "file_size": key[2],
+                    "full_metadata": result["full_metadata"],
+                    "summary_metadata": result["summary_metadata"],
+                    "bounds": result["bounds"],
+                    "preview_path": preview_path,
+                    "preview_bytes": array.nbytes,
+                }
+            )
+            cls._remove_files(stale_paths)
+            cls._remove_files(repository.evict_cache_entries(cls.MAX_BYTES))
+        except Exception as e:
+            print(f"Preview cache write warning: {e}")
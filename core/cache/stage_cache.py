@@ -0,0 +1,120 @@
+from core.database.connection import CACHE_DIR
+from typing import Dict, Any, Optional
+from collections import OrderedDict
+from core.render_utils import RenderUtils
+import numpy as np
+import threading
+import tempfile
+import atexit
+import shutil
+import os
+
+
+class StageCache:
+    """
+    Tüm katmanların aşama çıktıları için ortak, bayt bütçeli LRU önbellek.
+    Bellek bütçesi aşıldığında en eski çıktılar silinmek yerine geçici
+    dizindeki .npy dosyalarına yazılır ve memory-map ile geri bağlanır;
+    böylece geç aşamalardaki değişiklikler kaynak dosyayı yeniden okumaz.
+    """
+
+    MAX_MEMORY_BYTES = 2 * 1024 * 1024 * 1024
+    MAX_DISK_BYTES = 20 * 1024 * 1024 * 1024
+    SPILL_ROOT = os.path.join(CACHE_DIR, "stages")
+
+    # id(stage) -> {"stage", "nbytes", "spill_path"}
+    _entries: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+    _memory_bytes = 0
+    _disk_bytes = 0
+    _spill_dir: Optional[str] = None
+    _lock = threading.RLock()
+
+    @classmethod
+    def _get_spill_dir(cls) -> str:
+        if cls._spill_dir is None:
+            os.makedirs(cls.SPILL_ROOT, exist_ok=True)
+            # Her oturum kendi dizinini kullanır ve çıkışta temizler
+            cls._spill_dir = tempfile.mkdtemp(prefix="session_", dir=cls.SPILL_ROOT)
+            atexit.register(shutil.rmtree, cls._spill_dir, True)
+        return cls._spill_dir
+
+    @classmethod
+    def store(cls, stage: Any, render_data: Dict[str, Any]):
+        with cls._lock:
+            cls.release(stage)
+            stage.cached_data = render_data
+            if render_data is None:
+                return
+
+            nbytes = RenderUtils.render_data_nbytes(render_data)
+            cls._entries[id(stage)] = {
+                "stage": stage,
+                "nbytes": nbytes,
+                "spill_path": None,
+            }
+            cls._memory_bytes += nbytes
+            cls._enforce_budget()
+
+    @classmethod
+    def touch(cls, stage: Any):
+        with cls._lock:
+            if id(stage) in cls._entries:
+                cls._entries.move_to_end(id(stage))
+
+    @classmethod
+    def release(cls, stage: Any):
+        with cls._lock:
+            entry = cls._entries.pop(id(stage), None)
+            if entry is None:
+                return
+
+            stage.cached_data = None
+            if entry["spill_path"]:
+                cls._disk_bytes -= entry["nbytes"]
+                cls._remove_file(entry["spill_path"])
+            else:
+                cls._memory_bytes -= entry["nbytes"]
+
+    @staticmethod
+    def _remove_file(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    @classmethod
+    def _spill(cls, key: int, entry: Dict[str, Any]) -> bool:
+        stage = entry["stage"]
+        points = (stage.cached_data or {}).get(RenderUtils.POINTS_KEY)
+        if not isinstance(points, np.ndarray):
+            return False
+
+        try:
+            path = os.path.join(cls._get_spill_dir(), f"{key}.npy")
+            np.save(path, points)
+            stage.cached_data = RenderUtils.to_render_data(np.load(path, mmap_mode="r"))
+        except Exception as e:
+            print(f"Stage cache spill warning: {e}")
+            return False
+
+        entry["spill_path"] = path
+        cls._memory_bytes -= entry["nbytes"]
+        cls._disk_bytes += entry["nbytes"]
+        return True
+
+    @classmethod
+    def _enforce_budget(cls):
+        # Bellekteki en eski çıktılar diske taşınır; en yenisi her zaman bellekte kalır
+        for key in list(cls._entries.keys())[:-1]:
+            if cls._memory_bytes <= cls.MAX_MEMORY_BYTES:
+                break
+            entry = cls._entries[key]
+            if entry["spill_path"] is None and not cls._spill(key, entry):
+                cls.release(entry["stage"])
+
+        for key in list(cls._entries.keys()):
+            if cls._disk_bytes <= cls.MAX_DISK_BYTES:
+                break
+            entry = cls._entries[key]
+            if entry["spill_path"] is not None:
+                cls.release(entry["stage"])
@@ -0,0 +1,64 @@
+from core.database.connection import CACHE_DIR
+from typing import Optional
+import threading
+import os
+
+
+class StageOutputStore:
+    """
+    Karolu çalıştırılan aşamaların tam çıktısını (yalnızca önizleme örneğini
+    değil) zincir anahtarıyla LAZ dosyası olarak saklar. Dışa aktarma,
+    istatistik ve model işleri pipeline'ı kaynaktan yeniden çalıştırmak yerine
+    bu dosyadan devam eder; toplam boyut MAX_BYTES'ı aşarsa en eski
+    çıktılar silinir.
+    """
+
+    MAX_BYTES = 100 * 1024 * 1024 * 1024
+    STORE_DIR = os.path.join(CACHE_DIR, "stage_outputs")
+    EXTENSION = ".laz"
+
+    _lock = threading.Lock()
+
+    @classmethod
+    def path(cls, key: Optional[str]) -> Optional[str]:
+        if key is None:
+            return None
+        os.makedirs(cls.STORE_DIR, exist_ok=True)
+        return os.path.join(cls.STORE_DIR, f"{key}{cls.EXTENSION}")
+
+    @classmethod
+    def exists(cls, path: Optional[str]) -> bool:
+        if not path or not os.path.exists(path):
+            return False
+        try:
+            # Son erişim zamanı LRU temizliğinde kullanılır
+            os.utime(path)
+        except OSError:
+            pass
+        return True
+
+    @classmethod
+    def evict(cls, keep: Optional[str] = None):
+        with cls._lock:
+            entries = []
+            for name in os.listdir(cls.STORE_DIR):
+                path = os.path.join(cls.STORE_DIR, name)
+                if not name.endswith(cls.EXTENSION) or path == keep:
+                    continue
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            if keep and os.path.exists(keep):
+                total += os.path.getsize(keep)
+            for _, size, path in sorted(entries):
+                if total <= cls.MAX_BYTES:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
@@ -0,0 +1,113 @@
+from core.database.connection import CACHE_DIR
+from typing import Dict, Any, Optional, List
+from core.render_utils import RenderUtils
+import numpy as np
+import threading
+import hashlib
+import json
+import os
+
+
+class StageResultStore:
+    """
+    Aşama çıktılarını içerik anahtarıyla diskte saklar. Anahtar; kaynak dosya
+    parmak izi, girdi türü ve sırasıyla uygulanan aşama konfigürasyonlarından
+    zincirleme üretilir. Aynı ön eke sahip pipeline'lar katmanlar ve
+    oturumlar arasında PDAL çalıştırmadan sonucu yeniden kullanır.
+    """
+
+    MAX_BYTES = 10 * 1024 * 1024 * 1024
+    STORE_DIR = os.path.join(CACHE_DIR, "stage_results")
+
+    # Sonucu etkilemeyen, yalnızca loglama için kullanılan alanlar
+    IGNORED_KEYS = ("tag",)
+
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _canonical(config: Any) -> Any:
+        if isinstance(config, dict):
+            return {
+                k: StageResultStore._canonical(v)
+                for k, v in config.items()
+                if k not in StageResultStore.IGNORED_KEYS
+            }
+        if isinstance(config, list):
+            return [StageResultStore._canonical(v) for v in config]
+        return config
+
+    @staticmethod
+    def chain_key(parent_key: Optional[str], stage_configs: List[Any]) -> Optional[str]:
+        """Üst anahtarın ardından verilen aşamalar uygulandığında oluşan anahtar."""
+        if parent_key is None:
+            return None
+
+        key = parent_key
+        for config in stage_configs:
+            payload = json.dumps(
+                StageResultStore._canonical(config),
+                sort_keys=True,
+                separators=(",", ":"),
+                default=str,
+            )
+            key = hashlib.sha1(f"{key}|{payload}".encode("utf-8")).hexdigest()
+        return key
+
+    @classmethod
+    def _path(cls, key: str) -> str:
+        return os.path.join(cls.STORE_DIR, f"{key}.npy")
+
+    @classmethod
+    def get(cls, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        if key is None:
+            return None
+
+        path = cls._path(key)
+        try:
+            points = np.load(path, mmap_mode="r")
+            # Son erişim zamanı LRU temizliğinde kullanılır
+            os.utime(path)
+            return RenderUtils.to_render_data(points)
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def put(cls, key: Optional[str], render_data: Dict[str, Any]):
+        points = render_data.get(RenderUtils.POINTS_KEY)
+        if key is None or not isinstance(points, np.ndarray) or points.nbytes > cls.MAX_BYTES:
+            return
+
+        try:
+            os.makedirs(cls.STORE_DIR, exist_ok=True)
+            path = cls._path(key)
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                np.save(f, points)
+            os.replace(temp_path, path)
+            cls._evict()
+        except Exception as e:
+            print(f"Stage result store write warning: {e}")
+
+    @classmethod
+    def _evict(cls):
+        with cls._lock:
+            entries = []
+            for name in os.listdir(cls.STORE_DIR):
+                if not name.endswith(".npy"):
+                    continue
+                path = os.path.join(cls.STORE_DIR, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= cls.MAX_BYTES:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
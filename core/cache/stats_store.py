@@ -0,0 +1,78 @@
+from core.database.connection import CACHE_DIR
+from typing import Dict, Any, Optional
+import threading
+import json
+import os
+
+
+class StatsStore:
+    """
+    Hesaplanan istatistik sonuçlarını (çizelgeler dahil) zincir anahtarıyla
+    diskte JSON olarak saklar. Anahtar LayerContext.get_pipeline_key()'dir;
+    dosya veya aktif aşamalar değişince anahtar da değiştiği için eski
+    sonuçlar kendiliğinden geçersiz kalır.
+    """
+
+    MAX_BYTES = 256 * 1024 * 1024
+    STORE_DIR = os.path.join(CACHE_DIR, "stats")
+
+    _lock = threading.Lock()
+
+    @classmethod
+    def _path(cls, key: str) -> str:
+        return os.path.join(cls.STORE_DIR, f"{key}.json")
+
+    @classmethod
+    def get(cls, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        if key is None:
+            return None
+
+        path = cls._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                result = json.load(f)
+            # Son erişim zamanı LRU temizliğinde kullanılır
+            os.utime(path)
+            return result
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def put(cls, key: Optional[str], stats_data: Dict[str, Any]):
+        if key is None or not stats_data.get("statistic"):
+            return
+
+        try:
+            os.makedirs(cls.STORE_DIR, exist_ok=True)
+            path = cls._path(key)
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(stats_data, f, default=str)
+            os.replace(temp_path, path)
+            cls._evict()
+        except Exception as e:
+            print(f"Stats store write warning: {e}")
+
+    @classmethod
+    def _evict(cls):
+        with cls._lock:
+            entries = []
+            for name in os.listdir(cls.STORE_DIR):
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(cls.STORE_DIR, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= cls.MAX_BYTES:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
@@ -0,0 +1,46 @@
+from core.pipeline_process import PipelineProcess
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+from typing import List, Optional
+import numpy as np
+
+
+class CancellableWorker(QObject):
+    """
+    İptal edilebilir işçilerin ortak tabanı. cancel() arayüz iş parçacığından
+    doğrudan çağrılır (işçinin olay döngüsü meşgul olduğundan sinyal ile
+    değil); bayrak parça sınırlarında okunur, kesilemeyen pipeline'lar ise
+    execute_pipeline ile ayrı işlemde çalıştırılıp sonlandırılır.
+
+    İptal edilen işçi finished/error yerine cancelled yayınlar.
+    """
+
+    cancelled = pyqtSignal()
+    # run() hangi yoldan çıkarsa çıksın en son yayınlanır (JobScheduler için)
+    done = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.is_interrupted = False
+
+    def cancel(self):
+        self.is_interrupted = True
+
+    @pyqtSlot()
+    def execute(self):
+        try:
+            self.run()
+        finally:
+            self.done.emit()
+
+    def execute_pipeline(
+        self,
+        stages: list,
+        input_array: Optional[np.ndarray] = None,
+        want_arrays: bool = True,
+        fields: Optional[List[str]] = None,
+        stats: Optional[dict] = None,
+    ) -> dict:
+        return PipelineProcess(stages, input_array, want_arrays, fields, stats).run(
+            cancel_callback=lambda: self.is_interrupted
+        )
+
@@ -0,0 +1,208 @@
+"""
+Arayüz olmadan çalışan komut satırı girişi. PyQt5/pyvista yüklemez;
+kayıtlı bir pipeline JSON'unu veya app.db'deki bir batch preset'ini
+BatchEngine ile dosyalara uygular.
+
+    python -m core.cli list-presets
+    python -m core.cli run --preset "Ground Only" tiles/ -o out/ --workers 8
+    python -m core.cli run --pipeline pipeline.json a.laz b.laz -o out/
+"""
+
+from core.batch_engine import BatchEngine
+from data.writers import WriterFactory
+from typing import List, Optional
+import argparse
+import json
+import sys
+import os
+
+EXIT_OK = 0
+EXIT_FAILED_FILES = 1
+EXIT_USAGE = 2
+EXIT_INTERRUPTED = 130
+
+
+class CliError(Exception):
+    pass
+
+
+def _strip_io_stages(stages: list) -> list:
+    # Uygulamanın kaydettiği pipeline'lar kendi okuyucu/yazıcısını içerir;
+    # girdi ve çıktı her dosya için BatchEngine tarafından eklenir
+    return [
+        stage for stage in stages
+        if isinstance(stage, dict)
+        and not str(stage.get("type", "")).startswith(("readers.", "writers."))
+    ]
+
+
+def _stages_from_tools(items: list) -> list:
+    from core.pipeline_builder import PipelineBuilder
+    import core.tools.implementations  # noqa: F401  (araçları kaydeder)
+
+    configs = []
+    for item in items:
+        tool_name = item.get("tool_name")
+        stage = PipelineBuilder.create_stage(tool_name, item.get("params") or {})
+        if stage is None:
+            raise CliError(f"Could not build stage for tool '{tool_name}'.")
+        configs.append(stage.config)
+    return configs
+
+
+def load_pipeline_file(path: str) -> list:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise CliError(f"Could not read pipeline file '{path}': {e}")
+
+    if isinstance(data, dict):
+        data = data.get("pipeline", [])
+    if not isinstance(data, list):
+        raise CliError(f"Pipeline file '{path}' must contain a list of stages.")
+
+    # Batch kuyruğu biçimi ([{"tool_name", "params"}]) de kabul edilir
+    if data and all(isinstance(item, dict) and "tool_name" in item for item in data):
+        return _stages_from_tools(data)
+    return _strip_io_stages(data)
+
+
+def load_preset(name_or_id: str) -> list:
+    from core.database.repository import Repository
+
+    presets = Repository().get_all_presets()
+    for preset in presets:
+        if preset["name"] == name_or_id or str(preset["id"]) == name_or_id:
+            return _stages_from_tools(preset["config"])
+    raise CliError(f"Batch preset not found: {name_or_id}")
+
+
+def collect_inputs(inputs: List[str], recursive: bool) -> List[str]:
+    files = []
+    for path in inputs:
+        if os.path.isdir(path):
+            files.extend(BatchEngine.collect_files(path, recursive))
+        elif os.path.isfile(path):
+            files.append(path)
+        else:
+            raise CliError(f"Input not found: {path}")
+    return files
+
+
+def _cmd_list_presets(args) -> int:
+    from core.database.repository import Repository
+
+    for preset in Repository().get_all_presets():
+        tools = " -> ".join(item.get("tool_name", "?") for item in preset["config"])
+        print(f"{preset['id']:>4}  {preset['name']}  [{tools}]")
+    return EXIT_OK
+
+
+def _cmd_run(args) -> int:
+    stages = load_preset(args.preset) if args.preset else load_pipeline_file(args.pipeline)
+    if not stages:
+        raise CliError("Pipeline has no processing stages.")
+
+    files = collect_inputs(args.inputs, args.recursive)
+    if not files:
+        raise CliError("No LAS/LAZ input files found.")
+
+    try:
+        engine = BatchEngine(
+            stages,
+            args.output_dir,
+            naming_template=args.template,
+            output_format=args.format,
+            max_workers=args.workers,
+            max_retries=args.retries,
+            skip_existing=args.skip_existing,
+            threads=args.threads,
+        )
+    except ValueError as e:
+        raise CliError(str(e))
+
+    def on_file_done(done, total, result):
+        if result.skipped:
+            state = "SKIP"
+        elif result.status:
+            state = "OK"
+        else:
+            state = "FAIL"
+        line = f"[{done}/{total}] {state} {result.input_path}"
+        if result.status and not result.skipped:
+            line += f" ({result.count:,} points)"
+        elif result.error:
+            line += f": {result.error}"
+        print(line, flush=True)
+
+    try:
+        results = engine.run(files, progress_callback=on_file_done)
+    except ValueError as e:
+        raise CliError(str(e))
+
+    summary = BatchEngine.summarize(results)
+    print(
+        f"Done. Succeeded: {summary['succeeded']}, Skipped: {summary['skipped']}, "
+        f"Failed: {summary['failed']}, Points Written: {summary['points']:,}"
+    )
+    return EXIT_FAILED_FILES if summary["failed"] else EXIT_OK
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m core.cli",
+        description="Run PDAL Desktop Toolkit pipelines without the GUI.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    presets = commands.add_parser("list-presets", help="List batch presets stored in app.db.")
+    presets.set_defaults(handler=_cmd_list_presets)
+
+    run = commands.add_parser("run", help="Apply a pipeline or preset to LAS/LAZ files.")
+    source = run.add_mutually_exclusive_group(required=True)
+    source.add_argument("--pipeline", help="Saved pipeline or batch queue JSON file.")
+    source.add_argument("--preset", help="Batch preset name or id from app.db.")
+    run.add_argument("inputs", nargs="+", help="Input files or folders.")
+    run.add_argument("-o", "--output-dir", required=True, help="Output folder.")
+    run.add_argument(
+        "--template",
+        default=BatchEngine.DEFAULT_TEMPLATE,
+        help="Output file name template ({stem}, {name}, {ext}, {index}).",
+    )
+    run.add_argument(
+        "--format",
+        choices=sorted(WriterFactory.WRITERS),
+        default=WriterFactory.LAS,
+        help="Output format.",
+    )
+    run.add_argument("--workers", type=int, default=None, help="Files processed in parallel.")
+    run.add_argument(
+        "--threads",
+        type=int,
+        default=None,
+        help="COPC writer threads per file (default: cores divided by --workers).",
+    )
+    run.add_argument("--retries", type=int, default=1, help="Retries per failed file.")
+    run.add_argument("--recursive", action="store_true", help="Include subfolders.")
+    run.add_argument(
+        "--skip-existing", action="store_true", help="Skip files whose output already exists."
+    )
+    run.set_defaults(handler=_cmd_run)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except CliError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return EXIT_USAGE
+    except KeyboardInterrupt:
+        print("Interrupted.", file=sys.stderr)
+        return EXIT_INTERRUPTED
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,15 @@
-from data.data_handler import IBasicReader, IMetadataExtractor, IDataSampler
+from data.data_handler import IBasicReader, IMetadataExtractor, IDataSampler, IPointCloudOpener
 from core.database.workers import DbImportWorker, DbLoadWorker
-from PyQt5.QtCore import QObject, pyqtSignal, QThread
+from PyQt5.QtCore import QObject, pyqtSignal
+from core.job_scheduler import JobScheduler
 from core.layer_context import LayerContext
+from core.octree_worker import OctreeWorker
+from core.render_utils import RenderUtils
 from core.read_worker import ReaderWorker
+from core.octree import OctreeIndex
 from core.merge_worker import MergeWorker
 from typing import Dict, Optional, List
+from core.enums import JobPriority
 from core.logger import Logger
 import numpy as np
 import json
@@ -13,12 +18,21 @@ import os
 class DataController(QObject):
     
     file_loaded = pyqtSignal(str, str) # file_path, file_name
+    layer_refined = pyqtSignal(str)    # file_path
+    lod_ready = pyqtSignal(str)        # file_path
     file_removed = pyqtSignal(str)     # file_path
     progress_update = pyqtSignal(int)
     status_message = pyqtSignal(str, int)
     log_message = pyqtSignal(str, str) # level, message
 
-    def __init__(self, reader: IBasicReader, extractor: IMetadataExtractor, sampler: IDataSampler, logger: Logger):
+    def __init__(
+        self,
+        reader: IBasicReader,
+        extractor: IMetadataExtractor,
+        sampler: IDataSampler,
+        logger: Logger,
+        scheduler: Optional[JobScheduler] = None,
+    ):
         super().__init__()
         self.basic_reader = reader
         self.metadata_extractor = extractor
@@ -28,15 +42,21 @@ class DataController(QObject):
         self._data_cache: Dict[str, LayerContext] = {}
         self.active_layer_path: Optional[str] = None
         
-        # Thread referansları
-        self.reader_thread = None
-        self.merge_thread = None
+        # Arka plan işleri ortak zamanlayıcıda çalışır; dosya başına işçiler
+        # katman kaldırılırken iptal edilebilsin diye tutulur
+        self.scheduler = scheduler or JobScheduler(parent=self)
+        self._reader_jobs: Dict[str, ReaderWorker] = {}
+        self._octree_jobs: Dict[str, OctreeWorker] = {}
+        self.merge_worker = None
         self.db_import_thread = None
         self.db_load_thread = None
 
     def get_layer(self, file_path: str) -> Optional[LayerContext]:
         return self._data_cache.get(file_path)
 
+    def get_layer_paths(self) -> List[str]:
+        return list(self._data_cache.keys())
+
     def load_file(self, file_path: str):
         if not file_path: return
 
@@ -44,30 +64,39 @@ class DataController(QObject):
         self.status_message.emit(f"Loading: {file_name}...", 0)
         self.progress_update.emit(-1)
 
-        self.reader_thread = QThread()
-        self.reader_worker = ReaderWorker(
+        worker = ReaderWorker(
             file_path=file_path,
             basic_reader=self.basic_reader,
             metadata_extractor=self.metadata_extractor,
             data_sampler=self.data_sampler,
             logger=self.logger
         )
-        self.reader_worker.moveToThread(self.reader_thread)
-        
-        self.reader_thread.started.connect(self.reader_worker.run)
-        self.reader_worker.finished.connect(self._on_load_finished)
-        self.reader_worker.error.connect(self._on_worker_error)
-        self.reader_worker.progress.connect(self.progress_update.emit)
-        
-        self.reader_worker.finished.connect(self.reader_thread.quit)
-        self.reader_worker.finished.connect(self.reader_worker.deleteLater)
-        self.reader_thread.finished.connect(self.reader_thread.deleteLater)
-        self.reader_thread.start()
+        self._reader_jobs[file_path] = worker
+
+        worker.finished.connect(self._on_load_finished)
+        worker.level_ready.connect(self._on_preview_level)
+        worker.error.connect(self._on_worker_error)
+        worker.cancelled.connect(self._on_worker_cancelled)
+        worker.progress.connect(self.progress_update.emit)
+        worker.done.connect(lambda: self._release_job(self._reader_jobs, file_path, worker))
+        self.scheduler.submit(worker, f"Open: {file_name}", JobPriority.INTERACTIVE, file_path)
+
+    @staticmethod
+    def _release_job(jobs: Dict, file_path: str, worker):
+        # Aynı dosya yeniden açıldıysa yeni işin kaydı silinmez
+        if jobs.get(file_path) is worker:
+            del jobs[file_path]
 
     def _on_load_finished(self, file_path: str, bounds: dict, full_meta: dict, summary_meta: dict, sample_data: dict):
         file_name = os.path.basename(file_path)
-        context = LayerContext(file_path, summary_meta, full_meta)
+        reader_config = (
+            self.basic_reader.get_reader_config(file_path)
+            if isinstance(self.basic_reader, IPointCloudOpener)
+            else None
+        )
+        context = LayerContext(file_path, summary_meta, full_meta, reader_config=reader_config)
         context.current_render_data = sample_data
+        context.source_render_data = sample_data
         context.bounds = bounds
         self._data_cache[file_path] = context
         self.active_layer_path = file_path
@@ -76,6 +105,61 @@ class DataController(QObject):
         self.file_loaded.emit(file_path, file_name)
         self.progress_update.emit(100)
 
+        self._build_lod_index(context)
+
+    def _build_lod_index(self, context: LayerContext):
+        readers_las = (
+            (context.full_metadata or {})
+            .get("metadata", {})
+            .get("metadata", {})
+            .get("readers.las", {})
+        )
+        if (
+            context.is_database
+            # COPC/EPT zaten kendi hiyerarşisini taşır
+            or context.reader_config.get("type") != "readers.las"
+            or context.file_path in self._octree_jobs
+            or readers_las.get("count", 0) <= RenderUtils.LOD_MIN_POINTS
+            or readers_las.get("minx") is None
+        ):
+            return
+
+        worker = OctreeWorker(context.file_path, context.reader_config, readers_las)
+        file_path = context.file_path
+        self._octree_jobs[file_path] = worker
+
+        worker.finished.connect(self._on_lod_index_ready)
+        worker.error.connect(lambda msg: self.log_message.emit("WARNING", msg))
+        worker.done.connect(lambda: self._release_job(self._octree_jobs, file_path, worker))
+        # Dizin yalnızca görüntülemeyi hızlandırır; katman işlerini bekletmez
+        self.scheduler.submit(
+            worker, f"LOD index: {os.path.basename(file_path)}", JobPriority.BACKGROUND
+        )
+
+    def _on_lod_index_ready(self, file_path: str, index_dir: str):
+        context = self._data_cache.get(file_path)
+        if not context:
+            return
+
+        try:
+            context.octree = OctreeIndex(index_dir)
+        except Exception as e:
+            self.log_message.emit("WARNING", f"LOD index could not be opened: {e}")
+            return
+
+        self.logger.info(f"LOD index ready: {os.path.basename(file_path)}")
+        self.lod_ready.emit(file_path)
+
+    def _on_preview_level(self, file_path: str, sample_data: dict):
+        context = self._data_cache.get(file_path)
+        # Kullanıcı filtre uyguladıysa ham önizleme sonucu ezmemeli
+        if not context or context.stages:
+            return
+
+        context.current_render_data = sample_data
+        context.source_render_data = sample_data
+        self.layer_refined.emit(file_path)
+
     def _detect_srid(self, layer: LayerContext) -> str:
         if not layer or not layer.full_metadata:
             return "4326"
@@ -101,7 +185,10 @@ class DataController(QObject):
         raw_data = layer.current_render_data
         data_to_write = None
 
-        if isinstance(raw_data, dict):
+        if isinstance(raw_data, dict) and isinstance(raw_data.get(RenderUtils.POINTS_KEY), np.ndarray):
+            # Tüm boyutları taşıyan orijinal dizi varsa kayıpsız olarak yazılır
+            data_to_write = raw_data[RenderUtils.POINTS_KEY]
+        elif isinstance(raw_data, dict):
             valid_items = []
             for k, v in raw_data.items():
                 if hasattr(v, 'dtype'):
@@ -149,6 +236,7 @@ class DataController(QObject):
         self.db_load_thread.signals.progress.connect(self.progress_update.emit)
         self.db_load_thread.signals.finished.connect(self._on_db_load_finished)
         self.db_load_thread.signals.error.connect(self._on_worker_error)
+        self.db_load_thread.signals.cancelled.connect(self._on_worker_cancelled)
         self.db_load_thread.start()
 
     def _on_db_load_finished(self, payload):
@@ -181,6 +269,7 @@ class DataController(QObject):
         )
 
         context.current_render_data = payload['data']
+        context.source_render_data = payload['data']
         context.bounds = payload['bounds']
         context.is_database = True
 
@@ -191,27 +280,81 @@ class DataController(QObject):
         self.status_message.emit("Layer loaded from Database.", 3000)
         self.progress_update.emit(100)
 
-    def merge_layers(self, file_paths: List[str], output_name="Merged"):
-        if not file_paths: return
-        self.status_message.emit(f"Merging {len(file_paths)} layers...", 0)
+    def merge_layers(
+        self,
+        file_paths: List[str],
+        output_path: str,
+        output_format: Optional[str] = None,
+        threads: Optional[int] = None,
+    ):
+        if not file_paths or not output_path: return
+
+        # Katmanlar kaynak dosyalarından okunur; veritabanı katmanlarının dosyası yoktur
+        contexts = [self._data_cache.get(path) for path in file_paths]
+        contexts = [context for context in contexts if context and not context.is_database]
+        if len(contexts) < len(file_paths):
+            self.log_message.emit("WARNING", "Database layers are skipped while merging.")
+        if len(contexts) < 2:
+            self.log_message.emit("ERROR", "At least two file layers are required to merge.")
+            return
+
+        target = os.path.abspath(output_path)
+        if any(os.path.abspath(context.file_path) == target for context in contexts):
+            self.log_message.emit("ERROR", "Merge output cannot overwrite one of its inputs.")
+            return
+        if output_path in self._data_cache:
+            self.remove_layer(output_path)
+
+        total_points = sum(
+            points for points in ((c.metadata or {}).get("points") for c in contexts)
+            if isinstance(points, int)
+        )
+        self.status_message.emit(f"Merging {len(contexts)} layers...", 0)
         self.progress_update.emit(-1)
 
-        self.merge_thread = QThread()
-        self.merge_worker = MergeWorker(file_paths, output_name=output_name)
-        self.merge_worker.moveToThread(self.merge_thread)
-        
-        self.merge_thread.started.connect(self.merge_worker.run)
+        self.merge_worker = MergeWorker(
+            [context.reader_config for context in contexts],
+            output_path,
+            self.metadata_extractor,
+            self.data_sampler,
+            total_points=total_points,
+            output_format=output_format,
+            threads=threads,
+        )
         self.merge_worker.finished.connect(self._on_load_finished)
         self.merge_worker.error.connect(self._on_worker_error)
+        self.merge_worker.cancelled.connect(self._on_worker_cancelled)
         self.merge_worker.progress.connect(self.progress_update.emit)
-        
-        self.merge_worker.finished.connect(self.merge_thread.quit)
-        self.merge_worker.finished.connect(self.merge_worker.deleteLater)
-        self.merge_thread.finished.connect(self.merge_thread.deleteLater)
-        self.merge_thread.start()
+        self.scheduler.submit(
+            self.merge_worker,
+            f"Merge: {len(contexts)} layer(s) -> {os.path.basename(output_path)}",
+            JobPriority.EXPORT,
+            output_path,
+        )
+
+    def cancel_db_operations(self) -> int:
+        """
+        Veritabanı aktarım/yükleme işlerini iptal eder. Bunlar kendi
+        QThread'lerinde çalışır; diğer işler JobScheduler üzerinden iptal edilir.
+        """
+        count = 0
+        for thread in (self.db_import_thread, self.db_load_thread):
+            try:
+                if thread is not None and thread.isRunning() and not thread.isInterruptionRequested():
+                    thread.cancel()
+                    count += 1
+            except RuntimeError:
+                pass
+        return count
 
     def remove_layer(self, file_path: str):
+        for jobs in (self._reader_jobs, self._octree_jobs):
+            worker = jobs.get(file_path)
+            if worker:
+                self.scheduler.cancel(worker)
+
         if file_path in self._data_cache:
+            self._data_cache[file_path].release_cache()
             del self._data_cache[file_path]
             if self.active_layer_path == file_path:
                 self.active_layer_path = None
@@ -221,6 +364,12 @@ class DataController(QObject):
         worker.signals.progress.connect(self.progress_update.emit)
         worker.signals.error.connect(self._on_worker_error)
         worker.signals.finished.connect(lambda msg: self.status_message.emit(msg, 5000))
+        worker.signals.cancelled.connect(self._on_worker_cancelled)
+
+    def _on_worker_cancelled(self):
+        self.progress_update.emit(0)
+        self.log_message.emit("WARNING", "Data operation cancelled by user.")
+        self.status_message.emit("Operation cancelled.", 5000)
 
     def _on_worker_error(self, error_msg: str):
         self.progress_update.emit(0)
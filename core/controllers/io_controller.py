@@ -1,8 +1,10 @@
 from core.controllers.data_controller import DataController
-from data.writers import PipelineWriter, MetadataWriter
-from PyQt5.QtCore import QObject, pyqtSignal, QThread
-from core.database.repository import Repository
+from data.writers import PipelineWriter, MetadataWriter, WriterFactory
+from core.job_scheduler import JobScheduler
+from PyQt5.QtCore import QObject, pyqtSignal
 from core.export_worker import ExportWorker
+from typing import Optional
+from core.enums import JobPriority
 from core.logger import Logger
 import json
 import os
@@ -13,14 +15,29 @@ class IOController(QObject):
     status_message = pyqtSignal(str, int)
     log_message = pyqtSignal(str, str) # level, message
 
-    def __init__(self, data_controller: DataController, logger: Logger):
+    def __init__(self, data_controller: DataController, logger: Logger, scheduler: Optional[JobScheduler] = None):
         super().__init__()
         self.data_controller = data_controller
         self.logger = logger
-        self.export_thread = None
-        self.repository = Repository()
-
-    def export_layer(self, file_path: str, save_path: str):
+        self.scheduler = scheduler or JobScheduler(parent=self)
+        self._repository = None
+
+    @property
+    def repository(self):
+        # Veritabanı bağlantısı başlangıcı yavaşlatmasın diye ilk kullanımda açılır
+        if self._repository is None:
+            from core.database.repository import Repository
+
+            self._repository = Repository()
+        return self._repository
+
+    def export_layer(
+        self,
+        file_path: str,
+        save_path: str,
+        output_format: Optional[str] = None,
+        threads: Optional[int] = None,
+    ):
         context = self.data_controller.get_layer(file_path)
         if not context:
             self.log_message.emit("WARNING", f"Export failed: Layer not found {file_path}")
@@ -33,14 +50,21 @@ class IOController(QObject):
         file_name = os.path.basename(file_path)
         pipeline_config = context.get_full_pipeline_json()
         
-        self.log_message.emit("INFO", f"Exporting layer: '{file_name}' to '{save_path}'")
-        self._start_export_worker(save_path, pipeline_config)
+        output_format = output_format or WriterFactory.detect_format(save_path)
+        writer_options = {"threads": threads} if threads else {}
+
+        self.log_message.emit(
+            "INFO", f"Exporting layer: '{file_name}' to '{save_path}' ({output_format.upper()})"
+        )
+        self._start_export_worker(
+            save_path, pipeline_config, output_format, writer_options, layer_path=file_path
+        )
 
     def save_pipeline(self, file_path: str, save_path: str):
         context = self.data_controller.get_layer(file_path)
         if not context: return
             
-        pipeline_json = context.get_full_pipeline_json()
+        pipeline_json = context.get_pipeline_definition()
         writer = PipelineWriter()
         result = writer.write(save_path, pipeline_json)
 
@@ -71,31 +95,35 @@ class IOController(QObject):
             error_msg = result.get("error")
             self.log_message.emit("ERROR", f"Metadata save failed: {error_msg}")
 
-    def _start_export_worker(self, save_path: str, pipeline_config: list):
+    def _start_export_worker(
+        self,
+        save_path: str,
+        pipeline_config: list,
+        output_format: Optional[str] = None,
+        writer_options: Optional[dict] = None,
+        layer_path: Optional[str] = None,
+    ):
         self.progress_update.emit(1)
         self.status_message.emit("Exporting layer...", 0)
 
-        if self.export_thread is not None and self.export_thread.isRunning():
-            try:
-                self.export_thread.quit()
-                self.export_thread.wait()
-            except RuntimeError:
-                pass
-
-        self.export_thread = QThread()
-        self.export_worker = ExportWorker(save_path, pipeline_config)
-        self.export_worker.moveToThread(self.export_thread)
-        
-        self.export_thread.started.connect(self.export_worker.run)
+        self.export_worker = ExportWorker(
+            save_path, pipeline_config, output_format, writer_options
+        )
         self.export_worker.finished.connect(self._on_export_finished)
         self.export_worker.error.connect(self._on_worker_error)
+        self.export_worker.cancelled.connect(self._on_export_cancelled)
         self.export_worker.progress.connect(self.progress_update.emit)
-        
-        self.export_worker.finished.connect(self.export_thread.quit)
-        self.export_worker.finished.connect(self.export_worker.deleteLater)
-        self.export_thread.finished.connect(self.export_thread.deleteLater)
-        
-        self.export_thread.start()
+        self.scheduler.submit(
+            self.export_worker,
+            f"Export: {os.path.basename(save_path)}",
+            JobPriority.EXPORT,
+            layer_path,
+        )
+
+    def _on_export_cancelled(self):
+        self.progress_update.emit(0)
+        self.status_message.emit("Export cancelled.", 5000)
+        self.log_message.emit("WARNING", "Export cancelled; partial output removed.")
 
     def _on_export_finished(self, message: str):
         self.progress_update.emit(100)
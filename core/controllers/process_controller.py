@@ -1,12 +1,25 @@
 from core.controllers.data_controller import DataController
-from PyQt5.QtCore import QObject, pyqtSignal, QThread
+from PyQt5.QtCore import QObject, pyqtSignal
 from core.pipeline_builder import PipelineBuilder
 from core.layer_context import PipelineStage
+from core.cache.stage_result_store import StageResultStore
+from core.cache.stage_cache import StageCache
+from core.cache.stats_store import StatsStore
+from core.cache.stage_output_store import StageOutputStore
+from data.writers import WriterFactory
+from core.job_scheduler import JobScheduler
+from core.batch_worker import BatchFilesWorker
+from core.batch_engine import BatchEngine
 from core.filter_worker import FilterWorker
+from core.tiled_executor import TiledExecutor
 from core.model_worker import ModelWorker
 from core.stats_worker import StatsWorker
-from typing import Dict, Any, Optional
+from core.quantile_sketch import DimensionSketch
+from core.stats_engine import HeaderStats
+from typing import Dict, Any, Optional, List
+from core.enums import JobPriority
 from core.logger import Logger
+import uuid
 import os
 
 class ProcessController(QObject):
@@ -21,15 +34,27 @@ class ProcessController(QObject):
     status_message = pyqtSignal(str, int)
     log_message = pyqtSignal(str, str) # level, message
 
-    def __init__(self, data_controller:DataController, logger:Logger):
+    def __init__(self, data_controller:DataController, logger:Logger, scheduler: Optional[JobScheduler] = None):
         super().__init__()
         self.data_controller = data_controller
         self.logger = logger
-        self.filter_thread = None
-        self.stats_thread = None
-        self.model_thread = None
-
-    def apply_filter(self, file_path:str, tool_name:str, user_params:Dict[str, Any]):
+        self.filter_worker = None
+        self.stats_worker = None
+        # İstatistiğin başlatıldığı andaki zincir anahtarı; çizelgeler buna göre saklanır
+        self._stats_pipeline_key: Optional[str] = None
+        # Nokta geçişi sürerken gösterilen başlık istatistikleri
+        self._stats_header: Optional[Dict[str, Any]] = None
+        self.model_worker = None
+        self.batch_worker = None
+        self.scheduler = scheduler or JobScheduler(parent=self)
+
+    def apply_filter(
+        self,
+        file_path: str,
+        tool_name: str,
+        user_params: Dict[str, Any],
+        tiling: Optional[Dict[str, Any]] = None,
+    ):
         context = self.data_controller.get_layer(file_path)
         if not context:
             self.log_message.emit("WARNING", f"Layer not found: {file_path}")
@@ -40,12 +65,35 @@ class ProcessController(QObject):
             self.log_message.emit("ERROR", f"Could not create stage for '{tool_name}'.")
             return
         
+        if tiling:
+            bounds = context.get_native_bounds()
+            if context.is_database or bounds is None:
+                self.log_message.emit(
+                    "WARNING", "Tiled processing needs a file layer with header bounds; running untiled."
+                )
+                tiling = None
+            else:
+                # Önceki aşamalar her karoda tampon bölgesiyle yeniden çalışır
+                upstream = TiledExecutor.order_dependent_stages(
+                    context.get_full_pipeline_json()[1:]
+                )
+                if upstream:
+                    self.log_message.emit(
+                        "WARNING",
+                        "Tiled processing needs point-wise upstream stages "
+                        f"(found: {', '.join(upstream)}); running untiled.",
+                    )
+                    tiling = None
+                else:
+                    tiling = {**tiling, "bounds": bounds}
+
         previous_data = context.get_latest_data()
         
         pipeline_config = []
         input_data = None
         
-        if previous_data is not None:
+        # Karolu çalıştırma önizleme örneğine değil dosyanın tamamına uygulanır
+        if previous_data is not None and not tiling:
             self.log_message.emit("INFO", f"Filter Running (Cached): {new_stage.display_text}...")
             
             if isinstance(new_stage.config, list):
@@ -54,8 +102,11 @@ class ProcessController(QObject):
                 pipeline_config = [new_stage.config]
 
             input_data = previous_data
+            parent_key = context.get_latest_key()
+            upstream_configs = []
         else:
-            self.log_message.emit("INFO", f"Filter Running (Full): {new_stage.display_text}...")
+            mode = "Full, Tiled" if tiling else "Full"
+            self.log_message.emit("INFO", f"Filter Running ({mode}): {new_stage.display_text}...")
             
             pipeline_config = context.get_full_pipeline_json()
             if isinstance(new_stage.config, list):
@@ -64,8 +115,26 @@ class ProcessController(QObject):
                 pipeline_config.append(new_stage.config)
                 
             input_data = None
-
-        self._start_filter_worker(file_path, pipeline_config, new_stage, input_data=input_data)
+            parent_key = context.get_source_key(from_reader=True)
+            upstream_configs = context.get_active_configs()
+
+        chain = upstream_configs + [new_stage.config]
+        if tiling:
+            # İşçi sayısı sonucu etkilemez; karo sonuçları sırayla birleştirilir
+            chain.append({"tile_size": tiling["tile_size"], "buffer": tiling["buffer"]})
+        result_key = StageResultStore.chain_key(parent_key, chain)
+        if tiling:
+            # Tam çıktı diske yazılır; sonraki tam veri işleri oradan devam eder
+            tiling["output_path"] = StageOutputStore.path(result_key or uuid.uuid4().hex)
+            tiling["writer_options"] = context.get_las_layout()
+        self._start_filter_worker(
+            file_path,
+            pipeline_config,
+            new_stage,
+            input_data=input_data,
+            result_key=result_key,
+            tiling=tiling,
+        )
         
     def remove_stage(self, file_path:str, stage_index:int):
         context = self.data_controller.get_layer(file_path)
@@ -75,50 +144,108 @@ class ProcessController(QObject):
         if 0 <= stage_index < len(context.stages):
             stage_name = context.stages[stage_index].name
             context.remove_stage(stage_index)
-
-            for stage in context.stages:
-                stage.cached_data = None
-            
-            self.log_message.emit("INFO", f"Stage '{stage_name}' removed. Recalculating pipeline...")
-            new_pipeline = context.get_full_pipeline_json()
-            self._start_filter_worker(file_path, new_pipeline, stage_object=None)
+            # Silinen aşamadan öncekiler geçerli kalır; sonrakiler yeniden hesaplanır
+            context.invalidate_from(stage_index)
+            self._recompute_from(file_path, stage_index, f"Stage '{stage_name}' removed.")
         else:
             self.log_message.emit("WARNING", "Stage index out of bounds.")
 
+    def toggle_stage(self, file_path: str, stage_index: int, is_active: bool):
+        context = self.data_controller.get_layer(file_path)
+        if not context:
+            return
+
+        if not 0 <= stage_index < len(context.stages):
+            self.log_message.emit("WARNING", "Stage index out of bounds.")
+            return
+
+        stage = context.stages[stage_index]
+        if stage.is_active == is_active:
+            return
+
+        stage.is_active = is_active
+        # Aşamanın kendi çıktısı girdisi değişmediği için geçerli kalır;
+        # yeniden etkinleştirildiğinde doğrudan oradan devam edilir
+        context.invalidate_from(stage_index + 1)
+
+        state = "enabled" if is_active else "disabled"
+        self._recompute_from(file_path, stage_index + 1, f"Stage '{stage.name}' {state}.")
+
+    def _recompute_from(self, file_path: str, stage_index: int, reason: str):
+        context = self.data_controller.get_layer(file_path)
+        if not context:
+            return
+
+        input_data, downstream, input_key = context.get_resume_point(stage_index)
+
+        if input_data is None:
+            self.log_message.emit("INFO", f"{reason} Recalculating pipeline...")
+            new_pipeline = context.get_full_pipeline_json()
+            result_key = StageResultStore.chain_key(
+                context.get_source_key(from_reader=True), context.get_active_configs()
+            )
+            self._start_filter_worker(
+                file_path, new_pipeline, stage_object=None, result_key=result_key
+            )
+            return
+
+        if not downstream:
+            context.current_render_data = input_data
+            self.log_message.emit("INFO", f"{reason} Restored from cache.")
+            self.layer_updated.emit(file_path)
+            return
+
+        self.log_message.emit(
+            "INFO", f"{reason} Re-running {len(downstream)} downstream stage(s) from cache..."
+        )
+        pipeline_config = [stage.config for stage in downstream]
+        result_key = StageResultStore.chain_key(input_key, pipeline_config)
+        self._start_filter_worker(
+            file_path,
+            pipeline_config,
+            stage_object=None,
+            input_data=input_data,
+            result_key=result_key,
+        )
+
     def calculate_statistics(self, file_path:str):
         context = self.data_controller.get_layer(file_path)
         if not context: return
 
+        self._supersede(self.stats_worker, self._on_stats_finished)
+        self._stats_pipeline_key = context.get_pipeline_key()
+        self._stats_header = None
+
+        # Aynı dosya ve aşama zinciri için daha önce hesaplanan sonuç
+        cached = StatsStore.get(self._stats_pipeline_key)
+        if cached is not None:
+            cached["cached"] = True
+            self._publish_stats(file_path, cached, "Statistics loaded from cache.")
+            return
+
+        # Aşamasız dosyalarda sayı, sınırlar, dönüş dağılımı ve CRS başlıktan
+        # hemen gösterilir; ortalama/varyans/yüzdelikler için geçiş arkada sürer
+        if not context.get_active_configs() and not context.is_database:
+            self._stats_header = HeaderStats.from_metadata(context.full_metadata, context.metadata)
+            if self._stats_header is not None:
+                self.stats_ready.emit(file_path, dict(self._stats_header, partial=True))
+
         pipeline_config = context.get_full_pipeline_json()
-        pipeline_config.append({
-            "type":"filters.stats",
-            "enumerate": "Classification"
-        })
         self.status_message.emit("Calculating statistics...", 0)
         self.progress_update.emit(10)
 
-        if self.stats_thread is not None:
-            try:
-                if self.stats_thread.isRunning():
-                    self.stats_thread.quit()
-                    self.stats_thread.wait()
-            except RuntimeError:
-                self.stats_thread = None
-
-        self.stats_thread = QThread()
-        self.stats_worker = StatsWorker(file_path, pipeline_config)
-        self.stats_worker.moveToThread(self.stats_thread)
-        
-        self.stats_thread.started.connect(self.stats_worker.run)
-        self.stats_worker.finished.connect(self._on_stats_finished)
-        self.stats_worker.error.connect(self._on_worker_error)
-        self.stats_worker.progress.connect(self.progress_update.emit)
-        
-        self.stats_worker.finished.connect(self.stats_thread.quit)
-        self.stats_worker.finished.connect(self.stats_worker.deleteLater)
-        self.stats_thread.finished.connect(self.stats_thread.deleteLater)
-        self.stats_thread.finished.connect(lambda: setattr(self, 'stats_thread', None))
-        self.stats_thread.start()
+        # Özet metadata'da sayı bilinmiyorsa "N/A" olabilir; ilerleme o zaman belirsizdir
+        points = (context.metadata or {}).get("points")
+        self.stats_worker = StatsWorker(
+            file_path, pipeline_config, total_points=points if isinstance(points, int) else 0
+        )
+        self._start_worker(
+            self.stats_worker,
+            self._on_stats_finished,
+            f"Statistics: {os.path.basename(file_path)}",
+            JobPriority.STATS,
+            file_path,
+        )
 
     def generate_model(self, file_path:str, params:dict):
         context = self.data_controller.get_layer(file_path)
@@ -145,26 +272,24 @@ class ProcessController(QObject):
         self.progress_update.emit(10)
         self.log_message.emit("INFO", f"Starting model generation ({output_type}) -> {save_path}")
 
-        if self.model_thread is not None and self.model_thread.isRunning():
-            self.model_thread.quit()
-            self.model_thread.wait()
-
-        self.model_thread = QThread()
+        self._supersede(self.model_worker, self._on_model_finished)
         self.model_worker = ModelWorker(pipeline_config, save_path)
-        self.model_worker.moveToThread(self.model_thread)
-        
-        self.model_thread.started.connect(self.model_worker.run)
-        self.model_worker.finished.connect(self._on_model_finished)
-        self.model_worker.error.connect(self._on_worker_error)
-        self.model_worker.progress.connect(self.progress_update.emit)
-        
-        self.model_worker.finished.connect(self.model_thread.quit)
-        self.model_worker.finished.connect(self.model_worker.deleteLater)
-        self.model_thread.finished.connect(self.model_thread.deleteLater)
-        
-        self.model_thread.start()
-
-    def apply_batch_process(self, file_path: str, stages: list):
+        self._start_worker(
+            self.model_worker,
+            self._on_model_finished,
+            f"Elevation model: {os.path.basename(save_path)}",
+            JobPriority.EXPORT,
+            file_path,
+        )
+
+    def apply_batch_process(
+        self,
+        file_path: str,
+        stages: list,
+        export_path: Optional[str] = None,
+        output_format: Optional[str] = None,
+        threads: Optional[int] = None,
+    ):
         context = self.data_controller.get_layer(file_path)
         if not context:
             return
@@ -174,6 +299,7 @@ class ProcessController(QObject):
             return
 
         full_pipeline_config = context.get_full_pipeline_json()
+        batch_configs = [stage.config for stage in stages]
 
         stage_names = []
         for i, stage in enumerate(stages):
@@ -182,24 +308,117 @@ class ProcessController(QObject):
             
             full_pipeline_config.append(tagged_config)
             stage_names.append(stage.name)
+
+        if export_path:
+            # Yazıcı noktaları olduğu gibi geçirir; sonuç hem katmana hem dosyaya gider
+            writer = WriterFactory.create(output_format, export_path)
+            full_pipeline_config.append(writer.build_stage(export_path, threads=threads))
+            stage_names.append(f"Export ({os.path.basename(export_path)})")
+            # Dosya yazımı bir yan etkidir; önbellekten dönülürse dosya oluşmaz
+            result_key = None
+        else:
+            result_key = StageResultStore.chain_key(
+                context.get_source_key(from_reader=True),
+                context.get_active_configs() + batch_configs,
+            )
         
         self.log_message.emit("INFO", "=== Batch Process Started ===")
         self.log_message.emit("INFO", f"Queue: {' -> '.join(stage_names)}")
         
-        self._start_filter_worker(file_path, full_pipeline_config, stage_object=stages)
+        self._start_filter_worker(
+            file_path, full_pipeline_config, stage_object=stages, result_key=result_key
+        )
+
+    def apply_batch_to_files(
+        self,
+        input_paths: List[str],
+        stages: list,
+        output_dir: str,
+        naming_template: Optional[str] = None,
+        output_format: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        max_retries: int = 1,
+        skip_existing: bool = False,
+        threads: Optional[int] = None,
+    ):
+        if not stages:
+            self.log_message.emit("WARNING", "Batch queue is empty.")
+            return
+
+        if not input_paths:
+            self.log_message.emit("WARNING", "No input files selected for batch processing.")
+            return
+
+        if self.scheduler.is_active(self.batch_worker):
+            self.log_message.emit("WARNING", "A multi-file batch is already running.")
+            return
+
+        try:
+            engine = BatchEngine(
+                [stage.config for stage in stages],
+                output_dir,
+                naming_template=naming_template,
+                output_format=output_format,
+                max_workers=max_workers,
+                max_retries=max_retries,
+                skip_existing=skip_existing,
+                threads=threads,
+            )
+            engine.plan(input_paths)
+        except ValueError as e:
+            self.log_message.emit("ERROR", str(e))
+            return
 
-    def _start_filter_worker(self, file_path: str, pipeline_config: list, stage_object: Optional[PipelineStage], input_data: dict = None):
+        self.log_message.emit("INFO", "=== Multi-File Batch Started ===")
+        self.log_message.emit(
+            "INFO",
+            f"{len(input_paths)} file(s), {engine.max_workers} worker(s): "
+            f"{' -> '.join(stage.name for stage in stages)}",
+        )
+        self.status_message.emit("Running multi-file batch...", 0)
+        self.progress_update.emit(1)
+
+        self.batch_worker = BatchFilesWorker(engine, input_paths)
+        self.batch_worker.file_finished.connect(self._on_batch_file_finished)
+        self._start_worker(
+            self.batch_worker,
+            self._on_batch_files_finished,
+            f"Multi-file batch: {len(input_paths)} file(s)",
+            JobPriority.EXPORT,
+        )
+
+    def _on_batch_file_finished(self, input_path: str, status: bool, message: str):
+        level = "INFO" if status else "ERROR"
+        self.log_message.emit(level, f"{os.path.basename(input_path)}: {message}")
+
+    def _on_batch_files_finished(self, summary: dict):
+        self.progress_update.emit(100)
+        if summary["cancelled"]:
+            self.status_message.emit("Multi-file batch cancelled.", 5000)
+        else:
+            self.status_message.emit("Multi-file batch completed.", 5000)
+        self.log_message.emit(
+            "INFO",
+            f"=== Multi-File Batch Completed === Succeeded: {summary['succeeded']}, "
+            f"Skipped: {summary['skipped']}, Failed: {summary['failed']}, "
+            f"Cancelled: {summary['cancelled']}, Points Written: {summary['points']:,}",
+        )
+
+    def _start_filter_worker(
+        self,
+        file_path: str,
+        pipeline_config: list,
+        stage_object: Optional[PipelineStage],
+        input_data: dict = None,
+        result_key: Optional[str] = None,
+        tiling: Optional[Dict[str, Any]] = None,
+    ):
         self.progress_update.emit(1)
         self.status_message.emit("Applying filter...", 0)
 
-        if self.filter_thread is not None:
-            try:
-                if self.filter_thread.isRunning():
-                    self.log_message.emit("WARNING", "Waiting for previous process...")
-                    self.filter_thread.quit()
-                    self.filter_thread.wait()
-            except RuntimeError:
-                self.filter_thread = None
+        # Önceki iş beklenmez; iptal edilir ve sonucu yok sayılır
+        if self._supersede(self.filter_worker, self._on_filter_finished):
+            self.log_message.emit("WARNING", "Previous filter process cancelled.")
 
         context = self.data_controller.get_layer(file_path)
         input_count = 0
@@ -212,21 +431,51 @@ class ProcessController(QObject):
             else:
                 input_count = len(context.current_render_data)
 
-        self.filter_thread = QThread()
-        self.filter_worker = FilterWorker(file_path, pipeline_config, stage_object, input_count, input_data=input_data)
-        self.filter_worker.moveToThread(self.filter_thread)
-        
-        self.filter_thread.started.connect(self.filter_worker.run)
-        self.filter_worker.finished.connect(self._on_filter_finished)
-        self.filter_worker.error.connect(self._on_worker_error)
-        self.filter_worker.progress.connect(self.progress_update.emit)
+        self.filter_worker = FilterWorker(
+            file_path,
+            pipeline_config,
+            stage_object,
+            input_count,
+            input_data=input_data,
+            result_key=result_key,
+            tiling=tiling,
+        )
         self.filter_worker.stage_progress.connect(self._handle_stage_progress)
-        self.filter_worker.finished.connect(self.filter_thread.quit)
-        self.filter_worker.finished.connect(self.filter_worker.deleteLater)
-        self.filter_thread.finished.connect(self.filter_thread.deleteLater)
-        self.filter_thread.finished.connect(self._cleanup_filter_thread_ref)
-        
-        self.filter_thread.start()
+        self._start_worker(
+            self.filter_worker,
+            self._on_filter_finished,
+            f"Filter: {os.path.basename(file_path)}",
+            JobPriority.INTERACTIVE,
+            file_path,
+        )
+
+    def _start_worker(self, worker, finished_slot, label: str, priority: JobPriority, layer: Optional[str] = None):
+        worker.finished.connect(finished_slot)
+        worker.error.connect(self._on_worker_error)
+        worker.cancelled.connect(self._on_worker_cancelled)
+        worker.progress.connect(self.progress_update.emit)
+        self.scheduler.submit(worker, label, priority, layer)
+
+    def _supersede(self, worker, finished_slot) -> bool:
+        """
+        Aynı türden yeni bir iş başlarken eskisini iptal eder ve arayüz
+        bağlantılarını koparır; eski işin geç gelen sinyalleri yeni işin
+        ilerlemesini ve sonucunu bozmaz. İş parçacığı kendiliğinden kapanır.
+        """
+        if not self.scheduler.is_active(worker) or worker.is_interrupted:
+            return False
+        # Kuyruktaki iş iptalde hemen cancelled yayınlar; önce bağlantılar koparılır
+        worker.finished.disconnect(finished_slot)
+        worker.error.disconnect(self._on_worker_error)
+        worker.cancelled.disconnect(self._on_worker_cancelled)
+        worker.progress.disconnect()
+        if isinstance(worker, FilterWorker):
+            worker.stage_progress.disconnect()
+        self.scheduler.cancel(worker)
+        return True
+
+    def cancel_filter(self) -> bool:
+        return self.scheduler.cancel(self.filter_worker)
 
     def _handle_stage_progress(self, index, tag, in_count, out_count):
         try:
@@ -249,10 +498,11 @@ class ProcessController(QObject):
         except Exception as e:
             print(f"Log parsing error: {e}")
 
-    def _cleanup_filter_thread_ref(self):
-        self.filter_thread = None
-
     def _on_filter_finished(self, file_path: str, result_data: dict, metadata: dict, stage_object: Any, input_count: int):
+        # İptal edilmiş eski bir işin kuyrukta kalmış sonucu uygulanmaz
+        if self.sender() is not self.filter_worker:
+            return
+
         self.progress_update.emit(100)
         self.status_message.emit("Operation completed.", 3000)
 
@@ -260,19 +510,27 @@ class ProcessController(QObject):
         if not context: return
 
         context.current_render_data = result_data
+        result_key = self.filter_worker.result_key if self.filter_worker else None
         
         if isinstance(stage_object, list):
             for stage in stage_object:
                 context.add_stage(stage)
                 self.stage_added.emit(file_path, stage.name, stage.display_text)
+            if stage_object:
+                # Sonuç son aşamanın çıktısıdır; sonraki filtreler buradan devam eder
+                StageCache.store(stage_object[-1], result_data)
+                stage_object[-1].result_key = result_key
 
             self.log_message.emit("INFO", "=== Batch Process Completed ===")
 
         elif stage_object:
             stage_object.cached_data = result_data
+            stage_object.result_key = result_key
+            tiling = self.filter_worker.tiling if self.filter_worker else None
+            stage_object.output_path = tiling["output_path"] if tiling else None
             
             context.add_stage(stage_object)
-            output_count = result_data.get("count", 0)
+            output_count = result_data.get("source_count", result_data.get("count", 0))
             
             clean_details = stage_object.display_text.replace(stage_object.name, "").strip().strip("()")
             
@@ -282,14 +540,37 @@ class ProcessController(QObject):
             self.stage_added.emit(file_path, stage_object.name, clean_details)
         
         else:
-            output_count = result_data.get("count", 0)
+            # Yeniden hesaplanan sonuç son aktif aşamanın çıktısıdır
+            active_stages = [stage for stage in context.stages if stage.is_active]
+            if active_stages:
+                StageCache.store(active_stages[-1], result_data)
+                active_stages[-1].result_key = result_key
+
+            output_count = result_data.get("source_count", result_data.get("count", 0))
             self.log_message.emit("INFO", f"Pipeline refreshed. Current Points: {output_count:,}")
 
         self.layer_updated.emit(file_path)
 
     def _on_stats_finished(self, file_path: str, stats_data: dict):
+        if self._stats_header is not None:
+            stats_data = HeaderStats.merge(stats_data, self._stats_header)
+            self._stats_header = None
+        StatsStore.put(self._stats_pipeline_key, stats_data)
+        self._publish_stats(file_path, stats_data, "Statistics ready.")
+
+    def _publish_stats(self, file_path: str, stats_data: dict, message: str):
+        # Tam veri çizelgeleri katmanda saklanır; renk rampası ve parametre
+        # önerileri aynı zincir için yeniden hesaplama yapmaz
+        sketches = stats_data.pop("sketches", None) or {}
+        context = self.data_controller.get_layer(file_path)
+        if context and sketches:
+            context.set_distributions(
+                self._stats_pipeline_key,
+                {name: DimensionSketch.from_dict(data) for name, data in sketches.items()},
+            )
+
         self.progress_update.emit(100)
-        self.status_message.emit("Statistics ready.", 3000)
+        self.status_message.emit(message, 3000)
         self.stats_ready.emit(file_path, stats_data)
 
     def _on_model_finished(self, message: str, file_path: str):
@@ -298,6 +579,11 @@ class ProcessController(QObject):
         self.status_message.emit(f"Model generated: {file_name}", 5000)
         self.log_message.emit("INFO", message)
 
+    def _on_worker_cancelled(self):
+        self.progress_update.emit(0)
+        self.status_message.emit("Operation cancelled.", 5000)
+        self.log_message.emit("WARNING", "Operation cancelled by user.")
+
     def _on_worker_error(self, error_msg: str):
         self.progress_update.emit(0)
         self.status_message.emit("Error: Process failed.", 5000)
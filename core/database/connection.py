@@ -1,17 +1,22 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from .models import Base
+import os
 
 DB_NAME = "app.db"
 DB_URL = f"sqlite:///{DB_NAME}"
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(DB_NAME)), "cache")
 
 class DatabaseManager:
     def __init__(self):
+        # sqlalchemy yalnızca veritabanı ilk kullanıldığında yüklenir
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+
         self.engine = create_engine(DB_URL, echo=False, connect_args={"check_same_thread": False})
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
 
     def init_db(self):
         """Veritabanı tablolarını oluşturur (yoksa)."""
+        from .models import Base
+
         Base.metadata.create_all(bind=self.engine)
 
     def get_session(self):
@@ -1,18 +1,19 @@
-from sqlalchemy import create_engine, inspect, text
-from sqlalchemy.exc import SAWarning
-import pandas as pd
 import warnings
 
-warnings.filterwarnings("ignore", category=SAWarning, message=".*Did not recognize type 'pcpatch'.*")
-
 class DbInspector:
     
     def __init__(self, conn_info: dict):
+        from sqlalchemy.exc import SAWarning
+        from sqlalchemy import inspect
+
+        warnings.filterwarnings("ignore", category=SAWarning, message=".*Did not recognize type 'pcpatch'.*")
         self.conn_info = conn_info
         self.engine = self._create_engine()
         self.inspector = inspect(self.engine)
 
     def _create_engine(self):
+        from sqlalchemy import create_engine
+
         url = f"postgresql://{self.conn_info['user']}:{self.conn_info['password']}@" \
               f"{self.conn_info['host']}:{self.conn_info['port']}/{self.conn_info['dbname']}"
         return create_engine(url)
@@ -38,6 +39,10 @@ class DbInspector:
             return False
 
     def execute_query(self, sql: str):
+        # pandas yalnızca sorgu sonucu tablo olarak gösterilirken gerekir
+        import pandas as pd
+        from sqlalchemy import text
+
         try:
             with self.engine.connect() as conn:
                 result = pd.read_sql_query(text(sql), conn)
@@ -46,6 +51,8 @@ class DbInspector:
             return {"status": False, "error": str(e)}
 
     def create_schema(self, schema_name: str):
+        from sqlalchemy import text
+
         sql = f'CREATE SCHEMA IF NOT EXISTS "{schema_name}"'
         try:
             with self.engine.connect() as conn:
@@ -56,6 +63,8 @@ class DbInspector:
             return {"status": False, "error": str(e)}
 
     def create_pc_table(self, schema_name: str, table_name: str):
+        from sqlalchemy import text
+
         create_sql = f"""
         CREATE TABLE "{schema_name}"."{table_name}" (
             id SERIAL PRIMARY KEY,
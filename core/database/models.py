@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, BigInteger, String, Text, DateTime
 from sqlalchemy.orm import declarative_base
 from datetime import datetime
 
@@ -36,4 +36,26 @@ class DbConnection(Base):
     created_at = Column(DateTime, default=datetime.now)
 
     def __repr__(self):
-        return f"<DbConnection(name='{self.name}', host='{self.host}')>"
\ No newline at end of file
+        return f"<DbConnection(name='{self.name}', host='{self.host}')>"
+
+
+class PointCloudCacheEntry(Base):
+    """
+    Açılan nokta bulutlarının header/özet metadata'sını, dönüştürülmüş
+    sınırlarını ve diskteki önizleme örneğinin yolunu tutar.
+    """
+    __tablename__ = 'pointcloud_cache'
+
+    cache_key = Column(String(64), primary_key=True)
+    file_path = Column(Text, nullable=False, index=True)
+    file_mtime_ns = Column(BigInteger, nullable=False)
+    file_size = Column(BigInteger, nullable=False)
+    full_metadata = Column(Text, nullable=False)
+    summary_metadata = Column(Text, nullable=False)
+    bounds = Column(Text, nullable=False)
+    preview_path = Column(Text, nullable=False)
+    preview_bytes = Column(BigInteger, default=0)
+    last_access = Column(DateTime, default=datetime.now, index=True)
+
+    def __repr__(self):
+        return f"<PointCloudCacheEntry(file_path='{self.file_path}')>"
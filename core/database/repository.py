@@ -1,5 +1,6 @@
-from .models import BatchPreset, DbConnection
+from .models import BatchPreset, DbConnection, PointCloudCacheEntry
 from .connection import DatabaseManager
+from datetime import datetime
 import json
 
 class Repository:
@@ -125,4 +126,114 @@ class Repository:
             session.rollback()
             return False
         finally:
-            session.close()
\ No newline at end of file
+            session.close()
+
+    def get_cache_entry(self, cache_key: str) -> dict:
+        """Önbellek kaydını döndürür ve son erişim zamanını günceller."""
+        session = self.db_manager.get_session()
+        try:
+            entry = session.query(PointCloudCacheEntry).filter(
+                PointCloudCacheEntry.cache_key == cache_key
+            ).first()
+            if not entry:
+                return None
+
+            entry.last_access = datetime.now()
+            session.commit()
+            return {
+                "cache_key": entry.cache_key,
+                "file_path": entry.file_path,
+                "full_metadata": json.loads(entry.full_metadata),
+                "summary_metadata": json.loads(entry.summary_metadata),
+                "bounds": json.loads(entry.bounds),
+                "preview_path": entry.preview_path,
+                "preview_bytes": entry.preview_bytes,
+            }
+        except Exception as e:
+            print(f"DB Error (Get Cache): {e}")
+            session.rollback()
+            return None
+        finally:
+            session.close()
+
+    def save_cache_entry(self, entry_data: dict) -> list:
+        """
+        Önbellek kaydını ekler/günceller. Aynı dosyanın eski sürümlerine ait
+        kayıtları siler ve silinen önizleme dosyalarının yollarını döndürür.
+        """
+        session = self.db_manager.get_session()
+        try:
+            stale = session.query(PointCloudCacheEntry).filter(
+                PointCloudCacheEntry.file_path == entry_data["file_path"],
+                PointCloudCacheEntry.cache_key != entry_data["cache_key"],
+            ).all()
+            stale_paths = [e.preview_path for e in stale]
+            for e in stale:
+                session.delete(e)
+
+            session.merge(PointCloudCacheEntry(
+                cache_key=entry_data["cache_key"],
+                file_path=entry_data["file_path"],
+                file_mtime_ns=entry_data["file_mtime_ns"],
+                file_size=entry_data["file_size"],
+                full_metadata=json.dumps(entry_data["full_metadata"], default=str),
+                summary_metadata=json.dumps(entry_data["summary_metadata"], default=str),
+                bounds=json.dumps(entry_data["bounds"], default=str),
+                preview_path=entry_data["preview_path"],
+                preview_bytes=entry_data["preview_bytes"],
+                last_access=datetime.now(),
+            ))
+            session.commit()
+            return stale_paths
+        except Exception as e:
+            print(f"DB Error (Save Cache): {e}")
+            session.rollback()
+            return []
+        finally:
+            session.close()
+
+    def evict_cache_entries(self, max_bytes: int) -> list:
+        """
+        Toplam önizleme boyutu sınırı aşılırsa en eski erişilen kayıtları siler
+        (LRU) ve silinen önizleme dosyalarının yollarını döndürür.
+        """
+        session = self.db_manager.get_session()
+        try:
+            entries = session.query(PointCloudCacheEntry).order_by(
+                PointCloudCacheEntry.last_access.asc()
+            ).all()
+            total = sum(e.preview_bytes or 0 for e in entries)
+
+            removed_paths = []
+            for e in entries:
+                if total <= max_bytes:
+                    break
+                total -= e.preview_bytes or 0
+                removed_paths.append(e.preview_path)
+                session.delete(e)
+
+            session.commit()
+            return removed_paths
+        except Exception as e:
+            print(f"DB Error (Evict Cache): {e}")
+            session.rollback()
+            return []
+        finally:
+            session.close()
+
+    def delete_cache_entry(self, cache_key: str) -> bool:
+        session = self.db_manager.get_session()
+        try:
+            entry = session.query(PointCloudCacheEntry).filter(
+                PointCloudCacheEntry.cache_key == cache_key
+            ).first()
+            if entry:
+                session.delete(entry)
+                session.commit()
+                return True
+            return False
+        except Exception:
+            session.rollback()
+            return False
+        finally:
+            session.close()
@@ -1,16 +1,15 @@
+from core.pipeline_process import PipelineProcess, PipelineCancelled
 from PyQt5.QtCore import QThread, pyqtSignal, QObject
-from sqlalchemy import text, create_engine
 from core.render_utils import RenderUtils
 from core.geo_utils import GeoUtils
 import numpy as np
-import pdal
-import json
 import math
 
 class DbWorkerSignals(QObject):
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
     progress = pyqtSignal(int)
+    cancelled = pyqtSignal()
 
 
 class DbImportWorker(QThread):
@@ -35,7 +34,22 @@ class DbImportWorker(QThread):
         self.source_name, self.is_array, self.srid = source_name, is_array, srid
         self.signals = DbWorkerSignals()
 
+    def cancel(self):
+        self.requestInterruption()
+
+    def _remove_partial_import(self):
+        # Bu aktarımın yazdığı yamalar henüz kaynak adı almamıştır
+        from sqlalchemy import text, create_engine
+        url = f"postgresql://{self.conn_info['user']}:{self.conn_info['password']}@{self.conn_info['host']}:{self.conn_info['port']}/{self.conn_info['dbname']}"
+        engine = create_engine(url)
+        with engine.connect() as conn:
+            conn.execute(
+                text(f'DELETE FROM "{self.schema}"."{self.table}" WHERE source IS NULL')
+            )
+            conn.commit()
+
     def run(self):
+        from sqlalchemy import text, create_engine
         try:
             self.signals.progress.emit(-1)
             target_srid = str(self.srid) if self.srid else "4326"
@@ -53,15 +67,15 @@ class DbImportWorker(QThread):
 
             if self.is_array:
                 pipeline_stages = [chipper, writer_config]
-                pipeline = pdal.Pipeline(
-                    json.dumps(pipeline_stages), [self.source_data]
+                process = PipelineProcess(
+                    pipeline_stages, self.source_data, want_arrays=False
                 )
             else:
                 reader_config = {"type": "readers.las", "filename": self.source_data}
                 pipeline_stages = [reader_config, chipper, writer_config]
-                pipeline = pdal.Pipeline(json.dumps(pipeline_stages))
+                process = PipelineProcess(pipeline_stages, want_arrays=False)
 
-            count = pipeline.execute()
+            count = process.run(cancel_callback=self.isInterruptionRequested)["count"]
 
             url = f"postgresql://{self.conn_info['user']}:{self.conn_info['password']}@{self.conn_info['host']}:{self.conn_info['port']}/{self.conn_info['dbname']}"
             engine = create_engine(url)
@@ -92,6 +106,13 @@ class DbImportWorker(QThread):
                 f"Successfully saved {count} points to database. (SRID: {target_srid})"
             )
 
+        except PipelineCancelled:
+            try:
+                self._remove_partial_import()
+            except Exception as e:
+                self.signals.error.emit(f"Cancelled import could not be cleaned up: {e}")
+            self.signals.progress.emit(0)
+            self.signals.cancelled.emit()
         except Exception as e:
             self.signals.error.emit(f"Database write error : {str(e)}")
 
@@ -108,7 +129,11 @@ class DbLoadWorker(QThread):
         )
         self.signals = DbWorkerSignals()
 
+    def cancel(self):
+        self.requestInterruption()
+
     def run(self):
+        from sqlalchemy import text, create_engine
         try:
             self.signals.progress.emit(-1)
             url = f"postgresql://{self.conn_info['user']}:{self.conn_info['password']}@{self.conn_info['host']}:{self.conn_info['port']}/{self.conn_info['dbname']}"
@@ -140,22 +165,24 @@ class DbLoadWorker(QThread):
                 "connection": f"host={self.conn_info['host']} port={self.conn_info['port']} dbname={self.conn_info['dbname']} user={self.conn_info['user']} password={self.conn_info['password']}",
             }
             
-            pipeline = pdal.Pipeline(
-                json.dumps([config, {"type": "filters.decimation", "step": step}])
-            )
-            pipeline.execute()
+            if self.isInterruptionRequested():
+                raise PipelineCancelled()
 
-            if not pipeline.arrays:
+            result = PipelineProcess(
+                [config, {"type": "filters.decimation", "step": step}]
+            ).run(cancel_callback=self.isInterruptionRequested)
+
+            if not result["arrays"]:
                 raise Exception("No points found for the given query.")
 
-            arrays = pipeline.arrays[0]
+            arrays = result["arrays"][0]
             data_dict = {}
             for name in arrays.dtype.names:
                 data_dict[name] = arrays[name]
             
             data_dict["count"] = len(arrays)
             
-            raw_meta = pipeline.metadata.get("metadata", {})
+            raw_meta = result["metadata"].get("metadata", {})
             reader_meta = raw_meta.get("readers.pgpointcloud", {})
             wkt = reader_meta.get("srs", {}).get("wkt")
 
@@ -212,7 +239,7 @@ class DbLoadWorker(QThread):
             self.signals.finished.emit(
                 {
                     "data": data_dict,
-                    "raw_metadata": pipeline.metadata,
+                    "raw_metadata": result["metadata"],
                     "summary_metadata": summary_metadata,
                     "conn": self.conn_info,
                     "bounds": map_bounds,
@@ -220,6 +247,9 @@ class DbLoadWorker(QThread):
                     "query_filter": self.where,
                 }
             )
+        except PipelineCancelled:
+            self.signals.progress.emit(0)
+            self.signals.cancelled.emit()
         except Exception as e:
             self.signals.progress.emit(0)
             self.signals.error.emit(str(e))
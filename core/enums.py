@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 class Dimensions(str, Enum):
     X = "X"
@@ -15,4 +15,11 @@ class ToolNames(str, Enum):
     CROP = "Crop (BBox)"
     MERGE = "Merge"
     MODEL = "Elevation Model"
-    STATS = "Statistics"
\ No newline at end of file
+    STATS = "Statistics"
+
+class JobPriority(IntEnum):
+    # Küçük değer önce çalışır
+    INTERACTIVE = 0
+    STATS = 1
+    EXPORT = 2
+    BACKGROUND = 3
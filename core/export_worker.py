@@ -1,32 +1,48 @@
-from PyQt5.QtCore import QObject, pyqtSignal
-from data.writers import LasWriter
+from core.cancellable_worker import CancellableWorker
+from core.pipeline_process import PipelineCancelled
+from data.writers import WriterFactory
+from PyQt5.QtCore import pyqtSignal
+from typing import Optional
 import traceback
+import os
 
-class ExportWorker(QObject):
+class ExportWorker(CancellableWorker):
     finished = pyqtSignal(str)
     error = pyqtSignal(str)
     progress = pyqtSignal(int)
 
-    def __init__(self, file_path: str, pipeline_config: list):
+    def __init__(
+        self,
+        file_path: str,
+        pipeline_config: list,
+        output_format: Optional[str] = None,
+        writer_options: Optional[dict] = None,
+    ):
         super().__init__()
         self.file_path = file_path
         self.pipeline_config = pipeline_config
-        self.writer = LasWriter()
+        self.writer = WriterFactory.create(output_format, file_path)
+        self.writer_options = writer_options or {}
 
     def run(self):
         try:
             self.progress.emit(-1)
-            result = self.writer.write(self.file_path, self.pipeline_config)
+            # Yazım iptal edilebilsin diye pipeline ayrı işlemde çalışır
+            stages = list(self.pipeline_config)
+            stages.append(self.writer.build_stage(self.file_path, **self.writer_options))
+            result = self.execute_pipeline(stages, want_arrays=False)
 
-            if result.get("status"):
-                self.progress.emit(100)
-                count = result.get("count")
-                msg = f"Export successful!\nFile: {self.file_path}\nPoints Written: {count}"
-                self.finished.emit(msg)
-            else:
-                self.progress.emit(0)
-                self.error.emit(result.get("error"))
+            self.progress.emit(100)
+            count = result.get("count")
+            msg = f"Export successful!\nFile: {self.file_path}\nPoints Written: {count}"
+            self.finished.emit(msg)
 
+        except PipelineCancelled:
+            # Yarım yazılmış dosya geçerli bir LAS/COPC değildir
+            if os.path.exists(self.file_path):
+                os.remove(self.file_path)
+            self.progress.emit(0)
+            self.cancelled.emit()
         except Exception as e:
             self.progress.emit(0)
-            self.error.emit(f"Critical Export Error: {str(e)}\n{traceback.format_exc()}")
\ No newline at end of file
+            self.error.emit(f"Export failed: {str(e)}\n{traceback.format_exc()}")
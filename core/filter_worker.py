@@ -1,17 +1,46 @@
-from PyQt5.QtCore import QObject, pyqtSignal
+from core.cache.stage_result_store import StageResultStore
+from core.cache.stage_output_store import StageOutputStore
+from core.pipeline_process import PipelineCancelled
+from core.cancellable_worker import CancellableWorker
+from core.point_reservoir import PointReservoir
+from core.tiled_executor import TiledExecutor
+from core.merge_engine import MergeEngine
+from PyQt5.QtCore import pyqtSignal
+from core.render_utils import RenderUtils
 from core.enums import Dimensions
+from typing import Optional, Tuple
 import numpy as np
 import traceback
-import pdal
+import tempfile
+import shutil
 import json
+import os
 
 
-class FilterWorker(QObject):
+class FilterWorker(CancellableWorker):
     finished = pyqtSignal(str, dict, dict, object, int)
     error = pyqtSignal(str)
     progress = pyqtSignal(int)
     stage_progress = pyqtSignal(int, str, int, int)
 
+    # Tamamı bu türlerden oluşan pipeline'lar parça parça (akış modunda) çalıştırılır
+    STREAMABLE_STAGES = {
+        "readers.las",
+        "readers.copc",
+        "filters.range",
+        "filters.expression",
+        "filters.assign",
+        "filters.reprojection",
+        "filters.decimation",
+        "filters.crop",
+        "writers.las",
+        "filters.stats",
+    }
+    CHUNK_SIZE = 1_000_000
+
+    # Etiketli aşamaların çıkış sayısını ölçmek için araya eklenen hafif aşama
+    COUNT_PROBE = {"type": "filters.stats", "dimensions": "X"}
+
     def __init__(
         self,
         file_path: str,
@@ -19,6 +48,8 @@ class FilterWorker(QObject):
         stage: object,
         input_count: int,
         input_data: dict = None,
+        result_key: Optional[str] = None,
+        tiling: Optional[dict] = None,
     ):
         super().__init__()
         self.file_path = file_path
@@ -26,7 +57,15 @@ class FilterWorker(QObject):
         self.stage = stage
         self.input_count = input_count
         self.input_data = input_data
-        self.is_interrupted = False
+        self.result_key = result_key
+        self.tiling = tiling
+
+    def _get_input_array(self, data_dict: dict) -> Optional[np.ndarray]:
+        # Önbellekteki orijinal dizi tüm boyutları taşır ve kopyalanmadan kullanılır
+        points = data_dict.get(RenderUtils.POINTS_KEY)
+        if isinstance(points, np.ndarray) and points.dtype.names:
+            return points
+        return self._dict_to_structured_array(data_dict)
 
     def _dict_to_structured_array(self, data_dict: dict):
         if not data_dict:
@@ -68,87 +107,253 @@ class FilterWorker(QObject):
 
         return structured_arr
 
+    @staticmethod
+    def _flatten_stages(pipeline_config: list) -> list:
+        stages = []
+        for stage_conf in pipeline_config:
+            if isinstance(stage_conf, list):
+                stages.extend(stage_conf)
+            else:
+                stages.append(stage_conf)
+        return stages
+
+    def _build_fused_stages(self) -> Tuple[list, list]:
+        """
+        Aşamaları tek bir pipeline listesine açar ve her etiketli aşamanın
+        arkasına sayım probu ekler. (aşamalar, [(indeks, etiket)]) döner.
+        """
+        stages = self._flatten_stages(self.pipeline_config)
+        # Kullanıcının kendi stats aşaması varsa prob metadata'sı ayırt edilemez
+        if any(conf.get("type") == "filters.stats" for conf in stages if isinstance(conf, dict)):
+            return stages, []
+
+        fused, probes = [], []
+        for i, stage_conf in enumerate(self.pipeline_config):
+            confs = stage_conf if isinstance(stage_conf, list) else [stage_conf]
+            fused.extend(confs)
+
+            tag = confs[-1].get("tag") if confs and isinstance(confs[-1], dict) else None
+            if tag:
+                fused.append(dict(self.COUNT_PROBE))
+                probes.append((i, tag))
+        return fused, probes
+
+    def _emit_stage_counts(self, metadata: dict, probes: list):
+        if not probes:
+            return
+
+        if isinstance(metadata, str):
+            metadata = json.loads(metadata)
+        stats_nodes = (metadata or {}).get("metadata", {}).get("filters.stats")
+        if isinstance(stats_nodes, dict):
+            stats_nodes = [stats_nodes]
+        if not stats_nodes or len(stats_nodes) != len(probes):
+            return
+
+        current_count = self.input_count
+        for (index, tag), node in zip(probes, stats_nodes):
+            statistic = node.get("statistic", [])
+            if isinstance(statistic, dict):
+                statistic = [statistic]
+            if not statistic:
+                return
+
+            new_count = int(statistic[0].get("count", 0))
+            self.stage_progress.emit(index, tag, current_count, new_count)
+            current_count = new_count
+
+    def _is_streamable(self) -> bool:
+        # Bellekteki girdi zaten önizleme boyutundadır; akış yalnızca dosyadan okurken anlamlı
+        if self.input_data:
+            return False
+
+        stages = self._flatten_stages(self.pipeline_config)
+        return bool(stages) and all(
+            isinstance(stage_conf, dict)
+            and stage_conf.get("type") in self.STREAMABLE_STAGES
+            for stage_conf in stages
+        )
+
+    def _has_blocking_stage(self) -> bool:
+        # Akışa uygun olmayan aşamalar tüm noktaları bekler ve uzun sürebilir;
+        # bunlar iptal edilebilmesi için ayrı işlemde çalıştırılır
+        return any(
+            not isinstance(stage_conf, dict)
+            or stage_conf.get("type") not in self.STREAMABLE_STAGES
+            for stage_conf in self._flatten_stages(self.pipeline_config)
+        )
+
+    def _run_streaming(self):
+        """
+        Tüm aşamaları tek pipeline'da akış modunda çalıştırır; bellekte yalnızca
+        bir parça ve görüntüleyici için sabit boyutlu örnek tutulur.
+        """
+        import pdal
+        stages, probes = self._build_fused_stages()
+        pipeline = pdal.Pipeline(json.dumps(stages))
+        # Sabit tohum aynı girdi için aynı örneği üretir; içerik anahtarı geçerli kalır
+        reservoir = PointReservoir(RenderUtils.MAX_VISIBLE_POINTS, seed=0)
+
+        iterator = pipeline.iterator(chunk_size=self.CHUNK_SIZE)
+        for chunk in iterator:
+            # PDAL parçayı üretirken kesilemez; iptal parça sınırında uygulanır
+            if self.is_interrupted:
+                raise PipelineCancelled()
+
+            reservoir.add(chunk)
+            if self.input_count:
+                percent = min(89, 10 + int(reservoir.seen / self.input_count * 80))
+                self.progress.emit(percent)
+
+        sample = reservoir.result()
+        if sample is None or len(sample) == 0:
+            raise Exception("Pipeline produced no data.")
+
+        metadata = getattr(iterator, "metadata", {}) or {}
+        if isinstance(metadata, str):
+            metadata = json.loads(metadata)
+        self._emit_stage_counts(metadata, probes)
+
+        extracted_data = RenderUtils.to_render_data(sample)
+        # Örnek boyutu "count"ta kalır; akıştan geçen toplam nokta ayrıca taşınır
+        extracted_data["source_count"] = reservoir.seen
+        StageResultStore.put(self.result_key, extracted_data)
+
+        self.progress.emit(100)
+        self.finished.emit(
+            self.file_path, extracted_data, metadata, self.stage, self.input_count
+        )
+
+    def _run_tiled(self):
+        """
+        Pipeline'ı XY karolarında paralel çalıştırır. Her karonun iç bölgesi
+        diske yazılır ve karolar tek bir LAZ çıktısında birleştirilir; bu
+        dosya aşamanın tam sonucudur. Görüntüleyici için birleştirme
+        sırasında sabit boyutlu örnek alınır.
+        """
+        stages = self._flatten_stages(self.pipeline_config)
+        output_path = self.tiling["output_path"]
+        executor = TiledExecutor(
+            stages[0],
+            stages[1:],
+            self.tiling["bounds"],
+            self.tiling["tile_size"],
+            self.tiling["buffer"],
+            self.tiling.get("max_workers"),
+            self.tiling.get("writer_options"),
+        )
+        tile_files = []
+
+        def on_progress(done: int, total: int):
+            self.progress.emit(10 + int(done / total * 60) if total else 70)
+
+        def on_merged(written: int):
+            total = sum(count for _, count in tile_files)
+            self.progress.emit(min(95, 70 + int(written / total * 25)) if total else 95)
+
+        tile_dir = tempfile.mkdtemp(prefix="tiles_out_", dir=os.path.dirname(output_path))
+        try:
+            completed = executor.run(
+                tile_files.append,
+                progress_callback=on_progress,
+                cancel_callback=lambda: self.is_interrupted,
+                output_dir=tile_dir,
+            )
+            if not completed:
+                raise PipelineCancelled()
+            if not tile_files:
+                raise Exception("Pipeline produced no data.")
+
+            result = MergeEngine(
+                [{"type": "readers.las", "filename": path} for path, _ in tile_files],
+                output_path,
+            ).run(
+                progress_callback=on_merged,
+                cancel_callback=lambda: self.is_interrupted,
+            )
+        finally:
+            shutil.rmtree(tile_dir, ignore_errors=True)
+        StageOutputStore.evict(keep=output_path)
+
+        extracted_data = RenderUtils.to_render_data(result["sample"])
+        extracted_data["source_count"] = result["count"]
+        StageResultStore.put(self.result_key, extracted_data)
+
+        self.progress.emit(100)
+        self.finished.emit(
+            self.file_path, extracted_data, {}, self.stage, self.input_count
+        )
+
     def run(self):
+        import pdal
         try:
             self.progress.emit(10)
 
-            current_arrays = []
+            # Aynı kaynak ve aşama zinciri daha önce çalıştıysa PDAL atlanır
+            stored = StageResultStore.get(self.result_key)
+            # Karolu sonucun tam çıktısı silinmişse önizleme tek başına yetmez
+            if stored is not None and self.tiling:
+                if not StageOutputStore.exists(self.tiling["output_path"]):
+                    stored = None
+            if stored is not None:
+                self.progress.emit(100)
+                self.finished.emit(
+                    self.file_path, stored, {}, self.stage, self.input_count
+                )
+                return
+
+            if self.tiling:
+                self._run_tiled()
+                return
+
+            if self._is_streamable():
+                self._run_streaming()
+                return
 
+            struct_arr = None
             if self.input_data:
-                struct_arr = self._dict_to_structured_array(self.input_data)
-                if struct_arr is not None:
-                    current_arrays = [struct_arr]
-            
-            current_count = self.input_count
-            total_stages = len(self.pipeline_config)
-            last_pipeline = None
-
-            for i, stage_conf in enumerate(self.pipeline_config):
-                if self.is_interrupted:
-                    break
-
-                if isinstance(stage_conf, list):
-                    payload = json.dumps(stage_conf)
-                else:
-                    payload = json.dumps([stage_conf])
+                struct_arr = self._get_input_array(self.input_data)
+
+            # Tüm aşamalar tek seferde çalışır; ara sonuçlar PDAL dışına kopyalanmaz
+            stages, probes = self._build_fused_stages()
+            self.progress.emit(-1)
 
-                if current_arrays:
-                    pipeline = pdal.Pipeline(payload, arrays=current_arrays)
+            if self._has_blocking_stage():
+                result = self.execute_pipeline(stages, struct_arr)
+                result_arrays, metadata = result["arrays"], result["metadata"]
+            else:
+                payload = json.dumps(stages)
+                if struct_arr is not None:
+                    pipeline = pdal.Pipeline(payload, arrays=[struct_arr])
                 else:
                     pipeline = pdal.Pipeline(payload)
-
                 pipeline.execute()
+                result_arrays, metadata = pipeline.arrays, pipeline.metadata
 
-                current_arrays = pipeline.arrays
-                last_pipeline = pipeline
-
-                new_count = (
-                    sum(len(arr) for arr in current_arrays) if current_arrays else 0
-                )
-
-                percent = int((i + 1) / total_stages * 80) + 10
-                self.progress.emit(percent)
+            self.progress.emit(90)
+            if self.is_interrupted:
+                raise PipelineCancelled()
 
-                tag = stage_conf.get("tag")
-                if tag:
-                    self.stage_progress.emit(i, tag, current_count, new_count)
+            if not result_arrays:
+                raise Exception("Pipeline produced no data.")
 
-                current_count = new_count
+            arrays = (
+                result_arrays[0]
+                if len(result_arrays) == 1
+                else np.concatenate(result_arrays)
+            )
+            self._emit_stage_counts(metadata, probes)
 
-            if not last_pipeline or not last_pipeline.arrays:
-                raise Exception("Pipeline produced no data.")
+            extracted_data = RenderUtils.to_render_data(arrays)
+            StageResultStore.put(self.result_key, extracted_data)
 
-            arrays = np.concatenate(last_pipeline.arrays)
-            metadata = last_pipeline.metadata
-
-            extracted_data = {
-                Dimensions.X: arrays[Dimensions.X.value],
-                Dimensions.Y: arrays[Dimensions.Y.value],
-                Dimensions.Z: arrays[Dimensions.Z.value],
-                "count": len(arrays),
-            }
-
-            dims = arrays.dtype.names
-            if Dimensions.INTENSITY.value in dims:
-                extracted_data[Dimensions.INTENSITY] = arrays[Dimensions.INTENSITY.value]
-
-            if (Dimensions.RED.value in dims and 
-                Dimensions.GREEN.value in dims and 
-                Dimensions.BLUE.value in dims):
-                extracted_data[Dimensions.RED] = arrays[Dimensions.RED.value]
-                extracted_data[Dimensions.GREEN] = arrays[Dimensions.GREEN.value]
-                extracted_data[Dimensions.BLUE] = arrays[Dimensions.BLUE.value]
-
-            if Dimensions.CLASSIFICATION.value in dims:
-                extracted_data[Dimensions.CLASSIFICATION] = arrays[Dimensions.CLASSIFICATION.value]
-            
-            extracted_data["status"] = True
-            
             self.progress.emit(100)
             self.finished.emit(
                 self.file_path, extracted_data, metadata, self.stage, self.input_count
             )
 
+        except PipelineCancelled:
+            self.cancelled.emit()
         except Exception as e:
             import traceback
             error_details = f"Worker error : {str(e)}\n{traceback.format_exc()}"
@@ -1,4 +1,3 @@
-from pyproj import CRS, Transformer
 from typing import Dict, Any
 import re
 
@@ -15,6 +14,8 @@ class GeoUtils:
         Bbox koordinatlarını (minx, miny, maxx, maxy) bir EPSG'den
         başka bir EPSG'ye dönüştürür (Varsayılan olarak 4326'ya).
         """
+        from pyproj import Transformer
+
         try:
             transformer = Transformer.from_crs(
                 f"EPSG:{from_epsg}", f"EPSG:{to_epsg}", always_xy=True
@@ -35,12 +36,25 @@ class GeoUtils:
         except Exception as e:
             return {"status": False, "error": f"CRS transformation failed. {e}"}
 
+    @staticmethod
+    def epsg_to_wkt(epsg_code: int) -> str:
+        """
+        GeoTIFF anahtarlarından gelen EPSG kodunu WKT stringine çevirir.
+        """
+        from pyproj import CRS
+
+        try:
+            return CRS.from_epsg(int(epsg_code)).to_wkt()
+        except Exception:
+            return ""
+
     @staticmethod
     def parse_crs_info(spatial_ref: str) -> Dict[str, Any]:
         """
         PDAL'dan gelen WKT stringini ayrıştırarak EPSG kodu
         ve birim bilgisini (Unit) döndürür.
         """
+        from pyproj import CRS
 
         try:
             crs = CRS.from_wkt(spatial_ref)
@@ -0,0 +1,102 @@
+"""
+Başlangıç import sürelerini ölçer. Hedef modül ayrı bir Python işleminde
+`-X importtime` ile içe aktarılır; en yavaş modüller, paket bazında toplam
+süreler ve başlangıçta yüklenmemesi gereken ağır paketler raporlanır.
+
+    python -m core.import_profile            # uygulama girişi (app)
+    python -m core.import_profile core.cli --top 30
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Tuple
+import subprocess
+import argparse
+import sys
+
+# İlk kullanımda yüklenmesi beklenen paketler
+HEAVY_PACKAGES = (
+    "pandas",
+    "pyvista",
+    "pyvistaqt",
+    "vtkmodules",
+    "sqlalchemy",
+    "pyproj",
+    "pdal",
+    "PyQt5.QtWebEngineWidgets",
+)
+
+
+def measure(target: str) -> List[Tuple[str, int, int, int]]:
+    """[(modül, self_us, cumulative_us, derinlik)] döndürür."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        tail = proc.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise RuntimeError(f"Importing '{target}' failed: {tail[0]}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def summarize_packages(rows: List[Tuple[str, int, int, int]]) -> Dict[str, int]:
+    totals: Dict[str, int] = defaultdict(int)
+    for name, self_us, _, _ in rows:
+        totals[name.split(".")[0]] += self_us
+    return dict(totals)
+
+
+def report(target: str, top: int = 20) -> str:
+    rows = measure(target)
+    # En dış seviyedeki importların kümülatif toplamı tüm süreyi verir
+    total_us = sum(cumulative for _, _, cumulative, depth in rows if depth == 0)
+    loaded = {name for name, _, _, _ in rows}
+
+    lines = [f"Import profile for '{target}': {total_us / 1000:.1f} ms, {len(rows)} modules", ""]
+
+    lines.append(f"Slowest modules (cumulative, top {top}):")
+    for name, _, cumulative, _ in sorted(rows, key=lambda r: r[2], reverse=True)[:top]:
+        lines.append(f"  {cumulative / 1000:9.1f} ms  {name}")
+
+    lines.append("")
+    lines.append(f"Packages by own import time (top {top}):")
+    packages = sorted(summarize_packages(rows).items(), key=lambda p: p[1], reverse=True)
+    for package, self_us in packages[:top]:
+        lines.append(f"  {self_us / 1000:9.1f} ms  {package}")
+
+    eager = [name for name in HEAVY_PACKAGES if name in loaded]
+    lines.append("")
+    if eager:
+        lines.append("Heavy packages loaded at import time: " + ", ".join(eager))
+    else:
+        lines.append("No heavy packages loaded at import time.")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m core.import_profile",
+        description="Report module import times for application startup.",
+    )
+    parser.add_argument("target", nargs="?", default="app", help="Module to import.")
+    parser.add_argument("--top", type=int, default=20, help="Rows per section.")
+    args = parser.parse_args(argv)
+
+    try:
+        print(report(args.target, args.top))
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+from core.cancellable_worker import CancellableWorker
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from core.enums import JobPriority
+from collections import deque
+from functools import partial
+import time
+import os
+
+
+@dataclass(eq=False)
+class Job:
+    job_id: int
+    worker: Optional[CancellableWorker]
+    label: str
+    priority: JobPriority
+    layer: Optional[str] = None
+    status: str = "queued"
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    thread: Optional[QThread] = None
+
+    def snapshot(self) -> Dict:
+        now = time.time()
+        started = self.started_at or self.finished_at or now
+        return {
+            "id": self.job_id,
+            "label": self.label,
+            "priority": self.priority.name,
+            "layer": self.layer,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "wait_seconds": started - self.submitted_at,
+            "run_seconds": (
+                (self.finished_at or now) - self.started_at if self.started_at else 0.0
+            ),
+        }
+
+
+class JobScheduler(QObject):
+    """
+    Tüm denetleyicilerin arka plan işlerini tek bir sınırlı havuzda çalıştırır.
+
+    - Aynı anda en fazla max_workers iş çalışır; fazlası kuyrukta bekler.
+    - Kuyruk önceliğe göre (JobPriority: önizleme > istatistik > dışa aktarma)
+      ve aynı öncelikte geliş sırasına göre boşaltılır.
+    - Aynı katmana ait işler sırayla çalışır; farklı katmanlar paraleldir.
+
+    İş bitişi işçinin done sinyaliyle izlenir; sonucun kendisi (finished,
+    error, cancelled) denetleyicilerin bağladığı slotlara gider.
+    """
+
+    job_added = pyqtSignal(dict)
+    job_changed = pyqtSignal(dict)
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    FINISHED = "finished"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    # İş paneli için tutulan tamamlanmış iş sayısı
+    HISTORY_SIZE = 100
+
+    def __init__(self, max_workers: Optional[int] = None, parent=None):
+        super().__init__(parent)
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self._next_id = 1
+        self._queue: List[Job] = []
+        self._running: Dict[int, Job] = {}
+        self._history = deque(maxlen=self.HISTORY_SIZE)
+
+    def submit(
+        self,
+        worker: CancellableWorker,
+        label: str,
+        priority: JobPriority = JobPriority.INTERACTIVE,
+        layer: Optional[str] = None,
+    ) -> Job:
+        job = Job(self._next_id, worker, label, priority, layer)
+        self._next_id += 1
+        self._queue.append(job)
+        self.job_added.emit(job.snapshot())
+        self._dispatch()
+        return job
+
+    def _dispatch(self):
+        busy_layers = {job.layer for job in self._running.values() if job.layer}
+        for job in sorted(self._queue, key=lambda j: (j.priority, j.job_id)):
+            if len(self._running) >= self.max_workers:
+                break
+            if job.layer and job.layer in busy_layers:
+                continue
+            self._queue.remove(job)
+            if job.layer:
+                busy_layers.add(job.layer)
+            self._start(job)
+
+    def _start(self, job: Job):
+        thread = QThread()
+        job.thread = thread
+        job.worker.moveToThread(thread)
+        thread.started.connect(job.worker.execute)
+        job.worker.error.connect(partial(self._set_outcome, job, self.FAILED))
+        job.worker.cancelled.connect(partial(self._set_outcome, job, self.CANCELLED))
+        job.worker.done.connect(thread.quit)
+        job.worker.done.connect(job.worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(partial(self._on_thread_finished, job))
+        # Python referansları Qt nesneleri silinene kadar tutulur; aksi halde
+        # henüz çıkmakta olan iş parçacığı çöp toplayıcı tarafından silinebilir
+        thread.destroyed.connect(partial(self._release, job))
+
+        job.status = self.RUNNING
+        job.started_at = time.time()
+        self._running[job.job_id] = job
+        self.job_changed.emit(job.snapshot())
+        thread.start()
+
+    def _set_outcome(self, job: Job, status: str, *args):
+        job.status = status
+
+    def _on_thread_finished(self, job: Job):
+        self._running.pop(job.job_id, None)
+        if job.status == self.RUNNING:
+            job.status = self.FINISHED
+        self._retire(job)
+        self._dispatch()
+
+    def _retire(self, job: Job):
+        job.finished_at = time.time()
+        self._history.append(job)
+        self.job_changed.emit(job.snapshot())
+
+    def _release(self, job: Job, *args):
+        # deleteLater tamamlandı; geçmişte yalnızca zamanlama bilgisi kalır
+        job.worker = None
+        job.thread = None
+
+    def _find(self, worker: Optional[CancellableWorker]) -> Optional[Job]:
+        if worker is None:
+            return None
+        for job in list(self._running.values()) + self._queue:
+            if job.worker is worker:
+                return job
+        return None
+
+    def is_active(self, worker: Optional[CancellableWorker]) -> bool:
+        return self._find(worker) is not None
+
+    def cancel(self, worker: Optional[CancellableWorker]) -> bool:
+        """
+        Kuyruktaki iş hemen düşürülür ve cancelled yayınlanır; çalışan iş
+        bir sonraki kontrol noktasında durur. İş bulunamazsa False döner.
+        """
+        job = self._find(worker)
+        if job is None or worker.is_interrupted:
+            return False
+
+        worker.cancel()
+        if job in self._queue:
+            self._drop(job)
+            self._dispatch()
+        return True
+
+    def _drop(self, job: Job):
+        self._queue.remove(job)
+        job.status = self.CANCELLED
+        job.worker.cancelled.emit()
+        self._retire(job)
+        # Hiç başlatılmadığı için işçi arayüz iş parçacığındadır; hemen bırakılabilir
+        self._release(job)
+
+    def cancel_all(self, include_background: bool = False) -> int:
+        """
+        Kuyruktaki ve çalışan işleri iptal eder; iptal edilen iş sayısını
+        döndürür. Arka plan işleri (LOD dizini gibi) istenmedikçe sürer.
+        """
+        def selected(jobs):
+            return [
+                job for job in jobs
+                if not job.worker.is_interrupted
+                and (include_background or job.priority != JobPriority.BACKGROUND)
+            ]
+
+        # Önce kuyruk boşaltılır; aksi halde iptal edilen işlerin yerine
+        # kuyruktakiler başlatılıp hemen iptal edilirdi
+        queued = selected(self._queue)
+        for job in queued:
+            job.worker.cancel()
+            self._drop(job)
+
+        running = selected(self._running.values())
+        for job in running:
+            job.worker.cancel()
+        self._dispatch()
+        return len(queued) + len(running)
+
+    def jobs(self) -> List[Dict]:
+        """İş paneli için bekleyen, çalışan ve son tamamlanan işlerin durumu."""
+        active = sorted(
+            list(self._running.values()) + self._queue, key=lambda j: j.job_id
+        )
+        return [job.snapshot() for job in list(self._history) + active]
@@ -1,6 +1,13 @@
-from typing import List, Dict, Any, Optional
+from core.cache.stage_result_store import StageResultStore
+from core.cache.stage_output_store import StageOutputStore
+from core.cache.stage_cache import StageCache
+from core.cache.fingerprint import Fingerprint
+from core.quantile_sketch import DimensionSketch
+from core.enums import Dimensions
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 import numpy as np
+import math
 
 
 @dataclass
@@ -9,7 +16,13 @@ class PipelineStage:
     params: dict
     config: dict
     is_active: bool = True
-    cached_data: Optional[Dict[str, np.ndarray]] = None
+    # Render sözlüğü; RenderUtils.POINTS_KEY altında tüm boyutlu PDAL dizisini taşır
+    cached_data: Optional[Dict[str, Any]] = None
+    # Çıktının içerik anahtarı (StageResultStore); girdi zinciri değişince sıfırlanır
+    result_key: Optional[str] = None
+    # Karolu çalıştırmada aşamanın tam çıktısı (StageOutputStore); tam veri
+    # pipeline'ları kaynağı yeniden işlemek yerine bu dosyadan devam eder
+    output_path: Optional[str] = None
 
     @property
     def display_text(self) -> str:
@@ -19,7 +32,11 @@ class PipelineStage:
 
 class LayerContext:
     
-    MAX_CACHE_SIZE = 2 
+    # Sınır (bounds) seçeneğini destekleyen, hiyerarşik okuma yapan okuyucular
+    SPATIAL_READERS = ("readers.copc", "readers.ept")
+
+    # Tam veri çizelgesi yokken görüntü örneğinden çizelgesi çıkarılan boyutlar
+    SAMPLE_SKETCH_DIMENSIONS = (Dimensions.Z, Dimensions.INTENSITY)
 
     def __init__(
         self,
@@ -41,42 +58,241 @@ class LayerContext:
         self.active_style: str = "Elevation"
 
         self.current_render_data: Optional[Any] = None
+        # Hiç aşama uygulanmamış (okuyucudan gelen) render verisi
+        self.source_render_data: Optional[Any] = None
         self.is_visible: bool = True
         self.bounds: Optional[Dict] = None
         self.is_database: bool = False
 
+        # Görünüme bağlı LOD verisi (yalnızca filtre uygulanmamış büyük dosyalarda)
+        self.octree: Optional[Any] = None
+        self.lod_render_data: Optional[Dict[str, Any]] = None
+        self.lod_node_keys: List[str] = []
+
+        # Boyut dağılım çizelgeleri: tam veri (istatistik) sonuçları zincir
+        # anahtarına göre, görüntü örneğininki ise örnek nesnesiyle birlikte tutulur
+        self._distributions: Dict[str, Dict[str, DimensionSketch]] = {}
+        self._sample_distributions: Optional[Tuple[Any, Dict[str, DimensionSketch]]] = None
+
     def add_stage(self, stage: PipelineStage):
         self.stages.append(stage)
-        self._manage_cache()
+        if stage.cached_data is not None:
+            StageCache.store(stage, stage.cached_data)
 
-    def _manage_cache(self):
-        cached_count = sum(1 for s in self.stages if s.cached_data is not None)
-        
-        if cached_count > self.MAX_CACHE_SIZE:
-            to_remove = cached_count - self.MAX_CACHE_SIZE
-            removed = 0
+    def release_cache(self):
+        for stage in self.stages:
+            StageCache.release(stage)
 
-            for stage in self.stages:
-                if stage.cached_data is not None:
-                    stage.cached_data = None
-                    removed += 1
-                    if removed >= to_remove:
-                        break
+    def invalidate_from(self, index: int):
+        """index ve sonrasındaki aşamaların önbelleğini geçersiz kılar."""
+        for stage in self.stages[max(index, 0):]:
+            StageCache.release(stage)
+            stage.result_key = None
+            stage.output_path = None
 
-    def get_full_pipeline_json(self) -> List[Dict[str, Any]]:
-        pipeline = [self.reader_config]
+    def get_resume_point(
+        self, index: int
+    ) -> Tuple[Optional[Dict[str, Any]], List[PipelineStage], Optional[str]]:
+        """
+        index'ten önceki en yakın önbellekli aktif aşamanın çıktısını, ondan
+        sonra yeniden çalıştırılması gereken aktif aşamaları ve çıktının
+        içerik anahtarını döner. Bellekte olmayan çıktılar kalıcı depodan
+        geri yüklenir; hiçbiri yoksa okuyucudan gelen veriden başlanır.
+        """
+        for i in range(min(index, len(self.stages)) - 1, -1, -1):
+            stage = self.stages[i]
+            if not stage.is_active:
+                continue
+
+            if stage.cached_data is None and stage.result_key:
+                stored = StageResultStore.get(stage.result_key)
+                if stored is not None:
+                    StageCache.store(stage, stored)
+
+            if stage.cached_data is not None:
+                StageCache.touch(stage)
+                downstream = [s for s in self.stages[i + 1:] if s.is_active]
+                return stage.cached_data, downstream, stage.result_key
+
+        return (
+            self.source_render_data,
+            [s for s in self.stages if s.is_active],
+            self.get_source_key(),
+        )
+
+    def get_source_key(self, from_reader: bool = False) -> Optional[str]:
+        """
+        Zincirin kök anahtarı. from_reader=False iken okuyucudan gelen önizleme
+        verisini, True iken dosyanın tamamını okuyan pipeline'ı temsil eder.
+        """
+        # Veritabanı tablolarının içeriği parmak iziyle doğrulanamaz
+        if self.is_database:
+            return None
+
+        file_key = Fingerprint.file_key(self.file_path)
+        if file_key is None:
+            return None
+
+        if from_reader:
+            variant = self.reader_config
+        elif isinstance(self.source_render_data, dict):
+            variant = f"preview:{self.source_render_data.get('count', 0)}"
+        else:
+            return None
+
+        return StageResultStore.chain_key(Fingerprint.key_hash(file_key), [variant])
+
+    def get_latest_key(self) -> Optional[str]:
+        """get_latest_data'nın döndürdüğü verinin içerik anahtarı."""
+        if not self.stages:
+            return self.get_source_key()
+
+        for stage in reversed(self.stages):
+            if stage.is_active and stage.cached_data is not None:
+                return stage.result_key
+        return None
 
+    def get_pipeline_key(self) -> Optional[str]:
+        """get_full_pipeline_json'un (dosyanın tamamı + aktif aşamalar) içerik anahtarı."""
+        return StageResultStore.chain_key(
+            self.get_source_key(from_reader=True), self.get_active_configs()
+        )
+
+    def set_distributions(self, key: Optional[str], sketches: Dict[str, DimensionSketch]):
+        """Tam veri üzerinden hesaplanan çizelgeleri zincir anahtarıyla saklar."""
+        if key and sketches:
+            self._distributions[key] = sketches
+
+    def get_distributions(self) -> Dict[str, DimensionSketch]:
+        """
+        Aktif zincirin boyut dağılımları. Zincir için istatistik hesaplanmışsa
+        tam veri çizelgeleri, yoksa görüntülenen örnekten bir kez çıkarılan
+        çizelgeler döner; örnek değişmedikçe yeniden hesaplanmaz.
+        """
+        full = self._distributions.get(self.get_pipeline_key())
+        if full:
+            return full
+
+        data = self.get_latest_data()
+        if not isinstance(data, dict):
+            return {}
+        if self._sample_distributions and self._sample_distributions[0] is data:
+            return self._sample_distributions[1]
+
+        sketches = {}
+        for dimension in self.SAMPLE_SKETCH_DIMENSIONS:
+            values = data.get(dimension)
+            if isinstance(values, np.ndarray) and values.ndim == 1 and len(values):
+                sketches[dimension.value] = DimensionSketch.from_values(values)
+        self._sample_distributions = (data, sketches)
+        return sketches
+
+    def _get_readers_las(self) -> Dict[str, Any]:
+        return (
+            (self.full_metadata or {})
+            .get("metadata", {})
+            .get("metadata", {})
+            .get("readers.las", {})
+        )
+
+    def get_native_bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        """Başlıktaki (dosya CRS'indeki) XY sınırları; bilinmiyorsa None."""
+        readers_las = self._get_readers_las()
+        try:
+            return tuple(float(readers_las[key]) for key in ("minx", "miny", "maxx", "maxy"))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def get_las_layout(self) -> Dict[str, Any]:
+        """
+        Kaynağın ölçek, ofset ve nokta formatı; ara çıktılar writers.las ile
+        bu değerlerle yazılır, böylece koordinat hassasiyeti korunur.
+        """
+        readers_las = self._get_readers_las()
+        keys = ("scale_x", "scale_y", "scale_z", "offset_x", "offset_y", "offset_z")
+        if not all(key in readers_las for key in keys):
+            return {}
+        layout = {key: readers_las[key] for key in keys}
+        if "dataformat_id" in readers_las:
+            layout["dataformat_id"] = readers_las["dataformat_id"]
+        # Format 6-10 ve extra bytes yalnızca LAS 1.4'te tam desteklenir
+        layout["minor_version"] = 4
+        return layout
+
+    def get_point_spacing(self) -> Optional[float]:
+        """Başlıktaki sınır ve nokta sayısından ortalama XY nokta aralığı."""
+        bounds = self.get_native_bounds()
+        points = (self.metadata or {}).get("points")
+        try:
+            minx, miny, maxx, maxy = bounds
+            area = (maxx - minx) * (maxy - miny)
+            count = int(points)
+        except (TypeError, ValueError):
+            return None
+        if area <= 0 or count <= 0:
+            return None
+        return math.sqrt(area / count)
+
+    def get_active_configs(self) -> List[Any]:
+        return [stage.config for stage in self.stages if stage.is_active]
+
+    def _get_reader_stage(self) -> Dict[str, Any]:
+        if self.reader_config.get("type") not in self.SPATIAL_READERS:
+            return self.reader_config
+
+        # İlk aktif aşama bbox kırpma ise sınırları okuyucuya taşı; böylece
+        # yalnızca kesişen düğümler okunur. Kırpma aşaması olduğu gibi kalır.
         for stage in self.stages:
+            if not stage.is_active:
+                continue
+            config = stage.config
+            if isinstance(config, dict) and config.get("type") == "filters.crop" and "bounds" in config:
+                return {**self.reader_config, "bounds": config["bounds"]}
+            break
+        return self.reader_config
+
+    def _get_materialized_index(self) -> int:
+        """Tam çıktısı diskte duran son aktif aşamanın indeksi; yoksa -1."""
+        for i in range(len(self.stages) - 1, -1, -1):
+            stage = self.stages[i]
+            if stage.is_active and StageOutputStore.exists(stage.output_path):
+                return i
+        return -1
+
+    def get_full_pipeline_json(self) -> List[Dict[str, Any]]:
+        """
+        Çalıştırma için tam veri pipeline'ı. Diskte tam çıktısı olan son
+        aşamadan devam eder; kaydedilecek tanım için get_pipeline_definition.
+        """
+        start = self._get_materialized_index()
+        if start < 0:
+            return self.get_pipeline_definition()
+
+        pipeline = [{"type": "readers.las", "filename": self.stages[start].output_path}]
+        return self._append_active_configs(pipeline, self.stages[start + 1:])
+
+    def get_pipeline_definition(self) -> List[Dict[str, Any]]:
+        """
+        Özgün okuyucu ve tüm aktif aşamalardan oluşan, önbellek dosyalarına
+        bağlı olmayan pipeline; dışarıya kaydedilip yeniden çalıştırılabilir.
+        """
+        return self._append_active_configs([self._get_reader_stage()], self.stages)
+
+    @staticmethod
+    def _append_active_configs(
+        pipeline: List[Dict[str, Any]], stages: List[PipelineStage]
+    ) -> List[Dict[str, Any]]:
+        for stage in stages:
             if stage.is_active:
                 if isinstance(stage.config, list):
                     pipeline.extend(stage.config)
                 else:
                     pipeline.append(stage.config)
-
         return pipeline
 
     def remove_stage(self, index: int):
         if 0 <= index < len(self.stages):
+            StageCache.release(self.stages[index])
             del self.stages[index]
 
     def get_latest_data(self) -> Optional[Dict[str, np.ndarray]]:
@@ -85,6 +301,7 @@ class LayerContext:
         
         for stage in reversed(self.stages):
             if stage.is_active and stage.cached_data is not None:
+                StageCache.touch(stage)
                 return stage.cached_data
         
         return self.current_render_data
\ No newline at end of file
@@ -0,0 +1,131 @@
+from core.pipeline_process import PipelineCancelled, PipelineProcess
+from core.point_reservoir import PointReservoir
+from core.render_utils import RenderUtils
+from data.writers import WriterFactory
+from typing import Callable, Dict, List, Optional
+import numpy as np
+import json
+import os
+
+
+class MergeEngine:
+    """
+    Katmanları diskteki tek bir LAS/LAZ/COPC dosyasında birleştirir. Girdiler
+    akış modunda sırayla okunup yazıcıya aktarılır; bellekte yalnızca bir
+    parça, sabit boyutlu önizleme örneği ve birikimli sınırlar tutulur.
+
+    writers.copc tüm noktaları beklediği için COPC çıktısı önce geçici LAZ'a
+    akıtılır, ardından ayrı işlemde COPC'ye dönüştürülür.
+    """
+
+    CHUNK_SIZE = 1_000_000
+
+    def __init__(
+        self,
+        reader_stages: List[Dict],
+        output_path: str,
+        output_format: Optional[str] = None,
+        sample_size: int = RenderUtils.MAX_VISIBLE_POINTS,
+        threads: Optional[int] = None,
+    ):
+        if not reader_stages:
+            raise ValueError("At least one input is required to merge.")
+        self.reader_stages = reader_stages
+        self.output_path = output_path
+        self.output_format = output_format or WriterFactory.detect_format(output_path)
+        self.sample_size = sample_size
+        # COPC yazıcısının iş parçacığı sayısı (None: tüm çekirdekler)
+        self.threads = threads
+
+    @staticmethod
+    def _temp_path(output_path: str) -> str:
+        # Yarım kalan çıktı tamamlanmış bir dosyayla karışmasın
+        folder, name = os.path.split(output_path)
+        return os.path.join(folder, f".part_{name}")
+
+    def _stream_stages(self, target_path: str) -> list:
+        writer_stage = WriterFactory.create(WriterFactory.LAS).build_stage(target_path)
+        # Girdilerde ortak olan başlık alanları (ölçek, ofset, format, VLR) korunur
+        writer_stage["forward"] = "all"
+        return list(self.reader_stages) + [{"type": "filters.merge"}, writer_stage]
+
+    def run(
+        self,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        cancel_callback: Optional[Callable[[], bool]] = None,
+    ) -> Dict:
+        """
+        {"count", "bounds", "sample", "metadata"} döndürür. bounds
+        (minx, miny, minz, maxx, maxy, maxz) biçimindedir. İptalde yarım
+        dosyalar silinir ve PipelineCancelled fırlatılır.
+        """
+        import pdal
+
+        temp_path = self._temp_path(self.output_path)
+        is_copc = self.output_format == WriterFactory.COPC
+        converting = False
+
+        try:
+            pipeline = pdal.Pipeline(json.dumps(self._stream_stages(temp_path)))
+            # Sabit tohum aynı girdiler için aynı önizlemeyi üretir
+            reservoir = PointReservoir(self.sample_size, seed=0)
+            lower = np.full(3, np.inf)
+            upper = np.full(3, -np.inf)
+
+            iterator = pipeline.iterator(chunk_size=self.CHUNK_SIZE)
+            for chunk in iterator:
+                # Yazıcı parçayı iterator içinde yazar; iptal parça sınırında uygulanır
+                if cancel_callback and cancel_callback():
+                    raise PipelineCancelled()
+                if len(chunk) == 0:
+                    continue
+
+                reservoir.add(chunk)
+                for axis, name in enumerate(("X", "Y", "Z")):
+                    lower[axis] = min(lower[axis], float(chunk[name].min()))
+                    upper[axis] = max(upper[axis], float(chunk[name].max()))
+                if progress_callback:
+                    progress_callback(reservoir.seen)
+
+            if reservoir.seen == 0:
+                raise Exception("Merge produced no points.")
+
+            metadata = getattr(iterator, "metadata", {}) or {}
+            if isinstance(metadata, str):
+                metadata = json.loads(metadata)
+
+            if is_copc:
+                converting = True
+                writer = WriterFactory.create(WriterFactory.COPC)
+                PipelineProcess(
+                    [
+                        {"type": "readers.las", "filename": temp_path},
+                        writer.build_stage(self.output_path, threads=self.threads),
+                    ],
+                    want_arrays=False,
+                ).run(cancel_callback=cancel_callback)
+            else:
+                os.replace(temp_path, self.output_path)
+
+            return {
+                "count": reservoir.seen,
+                "bounds": tuple(float(v) for v in np.concatenate([lower, upper])),
+                "sample": reservoir.result(),
+                "metadata": metadata,
+            }
+        except Exception:
+            # COPC dönüşümü yarıda kaldıysa çıktı da geçersizdir
+            if converting:
+                self._remove(self.output_path)
+            raise
+        finally:
+            self._remove(temp_path)
+
+    @staticmethod
+    def _remove(path: str):
+        # İptal edilen akışın yazıcısı dosyayı henüz bırakmamış olabilir
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except OSError:
+            pass
@@ -1,85 +1,89 @@
-from PyQt5.QtCore import QObject, pyqtSignal
+from data.data_handler import IMetadataExtractor, IDataSampler
+from core.cancellable_worker import CancellableWorker
+from core.pipeline_process import PipelineCancelled
+from core.merge_engine import MergeEngine
 from core.render_utils import RenderUtils
-import numpy as np
+from PyQt5.QtCore import pyqtSignal
+from typing import Dict, List, Optional
 import traceback
-import pdal
-import json
 
 
-class MergeWorker(QObject):
+class MergeWorker(CancellableWorker):
     finished = pyqtSignal(str, dict, dict, dict, dict)
     error = pyqtSignal(str)
     progress = pyqtSignal(int)
 
-    def __init__(self, file_paths, output_name="Merged"):
+    def __init__(
+        self,
+        reader_stages: List[Dict],
+        output_path: str,
+        metadata_extractor: IMetadataExtractor,
+        data_sampler: IDataSampler,
+        total_points: int = 0,
+        output_format: Optional[str] = None,
+        threads: Optional[int] = None,
+    ):
         super().__init__()
-        self.file_paths = file_paths
-        self.output_name = output_name
+        self.reader_stages = reader_stages
+        self.output_path = output_path
+        self.metadata_extractor = metadata_extractor
+        self.data_sampler = data_sampler
+        self.total_points = total_points
+        self.output_format = output_format
+        self.threads = threads
 
-    def run(self):
-        try:
-            self.progress.emit(10)
-            pipeline_config = list(self.file_paths)
-            pipeline_config.append({"type": "filters.merge"})
-
-            self.progress.emit(20)
-
-            json_str = json.dumps(pipeline_config)
-            pipeline = pdal.Pipeline(json_str)
-
-            self.progress.emit(-1)
-            count = pipeline.execute()
+    def _on_progress(self, written: int):
+        if self.total_points:
+            self.progress.emit(min(90, 5 + int(written / self.total_points * 85)))
 
-            self.progress.emit(70)
-            arrays = pipeline.arrays[0]
-            extracted_data = {
-                "x": arrays["X"],
-                "y": arrays["Y"],
-                "z": arrays["Z"],
-                "count": count,
-            }
-            dims = arrays.dtype.names
-            if "Intensity" in dims:
-                extracted_data["intensity"] = arrays["Intensity"]
-            if "Red" in dims:
-                extracted_data["red"] = arrays["Red"]
-                extracted_data["green"] = arrays["Green"]
-                extracted_data["blue"] = arrays["Blue"]
-            if "Classification" in dims:
-                extracted_data["classification"] = arrays["Classification"]
+    def _fallback_layer_info(self, result: dict) -> tuple:
+        # Başlık okunamazsa akış sırasında biriken sınırlar kullanılır
+        minx, miny, minz, maxx, maxy, maxz = result["bounds"]
+        bounds = {"minx": minx, "maxx": maxx, "miny": miny, "maxy": maxy, "status": True}
+        summary_metadata = {
+            "status": True,
+            "points": result["count"],
+            "is_compressed": "N/A",
+            "crs_name": "N/A",
+            "epsg": "N/A",
+            "software_id": "PDAL Merge",
+            "x_range": f"[{minx:.2f} to {maxx:.2f}]",
+            "y_range": f"[{miny:.2f} to {maxy:.2f}]",
+            "z_range": f"[{minz:.2f} to {maxz:.2f}]",
+            "unit": "N/A",
+        }
+        return bounds, {"status": True, "metadata": result["metadata"]}, summary_metadata
 
-            vis_data = RenderUtils.downsample(extracted_data)
-            vis_data["status"] = True
-            minx, maxx = np.min(arrays["X"]), np.max(arrays["X"])
-            miny, maxy = np.min(arrays["Y"]), np.max(arrays["Y"])
-            minz, maxz = np.min(arrays["Z"]), np.max(arrays["Z"])
+    def run(self):
+        try:
+            self.progress.emit(5 if self.total_points else -1)
+            engine = MergeEngine(
+                self.reader_stages, self.output_path, self.output_format, threads=self.threads
+            )
+            result = engine.run(
+                progress_callback=self._on_progress,
+                cancel_callback=lambda: self.is_interrupted,
+            )
 
-            bounds = {
-                "minx": minx,
-                "maxx": maxx,
-                "miny": miny,
-                "maxy": maxy,
-                "status": True,
-            }
+            self.progress.emit(95)
+            vis_data = RenderUtils.to_render_data(result["sample"])
+            vis_data["source_count"] = result["count"]
 
-            summary_metadata = {
-                "points": count,
-                "is_compressed": "N/A",
-                "crs_name": "Merged CRS",
-                "epsg": "N/A",
-                "software_id": "PDAL Merge",
-                "x_range": f"[{minx:.2f} to {maxx:.2f}]",
-                "y_range": f"[{miny:.2f} to {maxy:.2f}]",
-                "z_range": f"[{minz:.2f} to {maxz:.2f}]",
-                "unit": "N/A",
-            }
+            # Çıktı diskte olduğundan metadata diğer katmanlar gibi başlıktan okunur
+            full_metadata = self.metadata_extractor.get_metadata(self.output_path)
+            bounds = self.data_sampler.get_bounds(self.output_path)
+            if full_metadata.get("status") and bounds.get("status"):
+                summary_metadata = self.metadata_extractor.get_summary_metadata(full_metadata)
+            else:
+                bounds, full_metadata, summary_metadata = self._fallback_layer_info(result)
 
-            full_metadata = {"metadata": pipeline.metadata}
             self.progress.emit(100)
             self.finished.emit(
-                self.output_name, bounds, full_metadata, summary_metadata, vis_data
+                self.output_path, bounds, full_metadata, summary_metadata, vis_data
             )
 
+        except PipelineCancelled:
+            self.cancelled.emit()
         except Exception as e:
             self.error.emit(
                 f"Merge operation failed: {str(e)}\n{traceback.format_exc()}"
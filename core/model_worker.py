@@ -1,9 +1,10 @@
-from PyQt5.QtCore import QObject, pyqtSignal
-import pdal
-import json
+from core.cancellable_worker import CancellableWorker
+from core.pipeline_process import PipelineCancelled
+from PyQt5.QtCore import pyqtSignal
 import traceback
+import os
 
-class ModelWorker(QObject):
+class ModelWorker(CancellableWorker):
     finished = pyqtSignal(str, str) 
     error = pyqtSignal(str)
     progress = pyqtSignal(int)
@@ -16,13 +17,17 @@ class ModelWorker(QObject):
     def run(self):
         try:
             self.progress.emit(10)
-            json_str = json.dumps(self.pipeline_config)
-            pipeline = pdal.Pipeline(json_str)
             self.progress.emit(-1)
-            count = pipeline.execute()
+            result = self.execute_pipeline(self.pipeline_config, want_arrays=False)
+            count = result["count"]
             self.progress.emit(100)
             msg = f"Elevation Model generated successfully.\nProcessed {count} points."
             self.finished.emit(msg, self.output_path) 
 
+        except PipelineCancelled:
+            # Sonlandırılan yazıcının yarım bıraktığı raster kullanılamaz
+            if os.path.exists(self.output_path):
+                os.remove(self.output_path)
+            self.cancelled.emit()
         except Exception as e:
             self.error.emit(f"Model generation failed: {str(e)}\n{traceback.format_exc()}")
\ No newline at end of file
@@ -0,0 +1,317 @@
+from typing import Dict, Any, List, Optional, Callable, Tuple
+from collections import OrderedDict
+from core.render_utils import RenderUtils
+from core.enums import Dimensions
+import numpy as np
+import heapq
+import json
+import math
+import os
+
+
+class OctreeIndex:
+    """
+    Diskte tutulan EPT benzeri nokta hiyerarşisini okur ve kameraya göre
+    görünür düğümleri uygun detay seviyesinde seçer.
+
+    Dizin yapısı:
+        hierarchy.json        -> küp sınırları, dtype, düğüm anahtarları ve sayıları
+        nodes/D-X-Y-Z.bin     -> düğüme ait ham nokta kayıtları
+    """
+
+    HIERARCHY_FILE = "hierarchy.json"
+    NODES_DIR = "nodes"
+    VERSION = 1
+
+    # Bir düğümün alt seviyesine inmek için görüş açısındaki minimum boyutu (radyan)
+    REFINE_ANGLE = 0.02
+    NODE_CACHE_POINTS = 4_000_000
+
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+        with open(os.path.join(root_dir, self.HIERARCHY_FILE), "r", encoding="utf-8") as f:
+            self.hierarchy = json.load(f)
+
+        self.cube = self.hierarchy["cube"]
+        self.dtype = np.dtype([tuple(field) for field in self.hierarchy["dtype"]])
+        self.nodes: Dict[str, int] = self.hierarchy["nodes"]
+        self._node_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._cached_points = 0
+
+    @staticmethod
+    def exists(root_dir: str) -> bool:
+        return os.path.exists(os.path.join(root_dir, OctreeIndex.HIERARCHY_FILE))
+
+    @property
+    def point_count(self) -> int:
+        return self.hierarchy["points"]
+
+    @staticmethod
+    def node_key(depth: int, x: int, y: int, z: int) -> str:
+        return f"{depth}-{x}-{y}-{z}"
+
+    def node_bounds(self, key: str) -> Tuple[np.ndarray, np.ndarray]:
+        depth, x, y, z = (int(part) for part in key.split("-"))
+        size = self.cube["size"] / (2 ** depth)
+        origin = np.array(self.cube["min"], dtype=np.float64)
+        node_min = origin + np.array([x, y, z], dtype=np.float64) * size
+        return node_min, node_min + size
+
+    def _children(self, key: str) -> List[str]:
+        depth, x, y, z = (int(part) for part in key.split("-"))
+        children = []
+        for dx in (0, 1):
+            for dy in (0, 1):
+                for dz in (0, 1):
+                    child = self.node_key(depth + 1, 2 * x + dx, 2 * y + dy, 2 * z + dz)
+                    if child in self.nodes:
+                        children.append(child)
+        return children
+
+    @staticmethod
+    def _intersects_frustum(node_min: np.ndarray, node_max: np.ndarray, planes: np.ndarray) -> bool:
+        # VTK frustum düzlemlerinin normalleri içeriye bakar (ax+by+cz+d >= 0)
+        for a, b, c, d in planes:
+            px = node_max[0] if a >= 0 else node_min[0]
+            py = node_max[1] if b >= 0 else node_min[1]
+            pz = node_max[2] if c >= 0 else node_min[2]
+            if a * px + b * py + c * pz + d < 0:
+                return False
+        return True
+
+    def select_nodes(
+        self, frustum_planes: List[float], camera_position: List[float], point_budget: int
+    ) -> List[str]:
+        """
+        Frustum ile kesişen düğümleri, kameraya yakın ve ekranda büyük görünen
+        düğümlere öncelik vererek nokta bütçesi dolana kadar seçer.
+        """
+        planes = np.asarray(frustum_planes, dtype=np.float64).reshape(6, 4)
+        eye = np.asarray(camera_position, dtype=np.float64)
+
+        root = self.node_key(0, 0, 0, 0)
+        if root not in self.nodes:
+            return []
+
+        selected = []
+        used_points = 0
+        queue = [(-math.inf, root)]
+
+        while queue:
+            _, key = heapq.heappop(queue)
+            node_min, node_max = self.node_bounds(key)
+            if not self._intersects_frustum(node_min, node_max, planes):
+                continue
+
+            count = self.nodes[key]
+            if selected and used_points + count > point_budget:
+                continue
+
+            selected.append(key)
+            used_points += count
+
+            size = node_max[0] - node_min[0]
+            center = (node_min + node_max) / 2.0
+            distance = max(np.linalg.norm(center - eye) - size * 0.866, 1e-9)
+            if size / distance < self.REFINE_ANGLE:
+                continue
+
+            for child in self._children(key):
+                child_min, child_max = self.node_bounds(child)
+                child_center = (child_min + child_max) / 2.0
+                child_distance = max(np.linalg.norm(child_center - eye), 1e-9)
+                heapq.heappush(queue, (-(size / 2.0) / child_distance, child))
+
+        return selected
+
+    def _load_node(self, key: str) -> np.ndarray:
+        cached = self._node_cache.get(key)
+        if cached is not None:
+            self._node_cache.move_to_end(key)
+            return cached
+
+        path = os.path.join(self.root_dir, self.NODES_DIR, f"{key}.bin")
+        array = np.fromfile(path, dtype=self.dtype)
+        self._node_cache[key] = array
+        self._cached_points += len(array)
+
+        while self._cached_points > self.NODE_CACHE_POINTS and len(self._node_cache) > 1:
+            _, evicted = self._node_cache.popitem(last=False)
+            self._cached_points -= len(evicted)
+        return array
+
+    def load_render_data(self, keys: List[str]) -> Optional[Dict[str, Any]]:
+        arrays = [self._load_node(key) for key in keys]
+        if not arrays:
+            return None
+
+        render_data = RenderUtils.to_render_data(np.concatenate(arrays))
+        return render_data
+
+
+class OctreeBuilder:
+    """
+    Kaynak dosyayı PDAL akış modunda parça parça okuyarak OctreeIndex
+    dizinini oluşturur; bellekte en fazla FLUSH_POINTS nokta tutulur.
+
+    Her nokta rastgele bir seviyeye atanır: kök düğüm ROOT_POINTS kadar,
+    her alt seviye LEVEL_GROWTH katı kadar nokta alır, kalanlar yapraklara
+    düşer. Böylece her seviye tüm bulutun düzgün bir alt örneği olur.
+    """
+
+    ROOT_POINTS = 100_000
+    LEVEL_GROWTH = 4
+    MAX_DEPTH = 12
+    CHUNK_SIZE = 1_000_000
+    FLUSH_POINTS = 4_000_000
+
+    RENDER_FIELDS = [
+        (Dimensions.X.value, "f8"),
+        (Dimensions.Y.value, "f8"),
+        (Dimensions.Z.value, "f8"),
+        (Dimensions.INTENSITY.value, "u2"),
+        (Dimensions.CLASSIFICATION.value, "u1"),
+        (Dimensions.RED.value, "u2"),
+        (Dimensions.GREEN.value, "u2"),
+        (Dimensions.BLUE.value, "u2"),
+    ]
+
+    def __init__(self, reader_config: Dict[str, Any], bounds: Dict[str, float], total_points: int, root_dir: str):
+        self.reader_config = reader_config
+        self.total_points = max(int(total_points), 1)
+        self.root_dir = root_dir
+
+        extent = max(
+            bounds["maxx"] - bounds["minx"],
+            bounds["maxy"] - bounds["miny"],
+            bounds["maxz"] - bounds["minz"],
+        )
+        # Sınırdaki noktaların küp dışına taşmaması için küçük bir pay bırak
+        self.cube_size = float(extent) * 1.0001 or 1.0
+        self.cube_min = np.array(
+            [bounds["minx"], bounds["miny"], bounds["minz"]], dtype=np.float64
+        )
+
+        self.depth = self._leaf_depth()
+        self.level_probabilities = self._level_probabilities()
+        self._buffers: Dict[int, List[np.ndarray]] = {}
+        self._buffered_points = 0
+        self._node_counts: Dict[int, int] = {}
+        self._rng = np.random.default_rng(0)
+        self._dtype: Optional[np.dtype] = None
+
+    def _leaf_depth(self) -> int:
+        capacity, depth = self.ROOT_POINTS, 0
+        while capacity < self.total_points and depth < self.MAX_DEPTH:
+            depth += 1
+            capacity += self.ROOT_POINTS * self.LEVEL_GROWTH ** depth
+        return depth
+
+    def _level_probabilities(self) -> np.ndarray:
+        expected = [
+            self.ROOT_POINTS * self.LEVEL_GROWTH ** d for d in range(self.depth)
+        ]
+        return np.minimum(np.cumsum(expected) / self.total_points, 1.0)
+
+    def _encode(self, depth: np.ndarray, ijk: np.ndarray) -> np.ndarray:
+        bits = self.MAX_DEPTH
+        code = depth.astype(np.int64)
+        for axis in range(3):
+            code = (code << bits) | ijk[:, axis].astype(np.int64)
+        return code
+
+    def _decode(self, code: int) -> str:
+        mask = (1 << self.MAX_DEPTH) - 1
+        z = code & mask
+        y = (code >> self.MAX_DEPTH) & mask
+        x = (code >> (2 * self.MAX_DEPTH)) & mask
+        depth = code >> (3 * self.MAX_DEPTH)
+        return OctreeIndex.node_key(int(depth), int(x), int(y), int(z))
+
+    def _to_render_array(self, chunk: np.ndarray) -> np.ndarray:
+        if self._dtype is None:
+            names = chunk.dtype.names
+            fields = [(n, t) for n, t in self.RENDER_FIELDS if n in names]
+            if not all(c in names for c in ("Red", "Green", "Blue")):
+                fields = [(n, t) for n, t in fields if n not in ("Red", "Green", "Blue")]
+            self._dtype = np.dtype(fields)
+
+        out = np.empty(len(chunk), dtype=self._dtype)
+        for name in self._dtype.names:
+            out[name] = chunk[name]
+        return out
+
+    def _assign(self, points: np.ndarray):
+        xyz = np.column_stack((points["X"], points["Y"], points["Z"]))
+        levels = np.searchsorted(
+            self.level_probabilities, self._rng.random(len(points)), side="right"
+        )
+
+        cells = 2 ** levels
+        ijk = np.floor((xyz - self.cube_min) / self.cube_size * cells[:, None])
+        ijk = np.clip(ijk, 0, (cells - 1)[:, None]).astype(np.int64)
+
+        codes = self._encode(levels, ijk)
+        order = np.argsort(codes, kind="stable")
+        codes, points = codes[order], points[order]
+        unique_codes, starts = np.unique(codes, return_index=True)
+        ends = np.append(starts[1:], len(codes))
+
+        for code, start, end in zip(unique_codes, starts, ends):
+            self._buffers.setdefault(int(code), []).append(points[start:end])
+        self._buffered_points += len(points)
+
+    def _flush(self):
+        nodes_dir = os.path.join(self.root_dir, OctreeIndex.NODES_DIR)
+        os.makedirs(nodes_dir, exist_ok=True)
+
+        for code, parts in self._buffers.items():
+            key = self._decode(code)
+            with open(os.path.join(nodes_dir, f"{key}.bin"), "ab") as f:
+                for part in parts:
+                    part.tofile(f)
+                    self._node_counts[code] = self._node_counts.get(code, 0) + len(part)
+
+        self._buffers.clear()
+        self._buffered_points = 0
+
+    def build(
+        self,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        cancel_callback: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, Any]:
+        import pdal
+        pipeline = pdal.Pipeline(json.dumps([self.reader_config]))
+        processed = 0
+
+        for chunk in pipeline.iterator(chunk_size=self.CHUNK_SIZE):
+            if cancel_callback and cancel_callback():
+                return {"status": False, "error": "LOD index build cancelled."}
+
+            self._assign(self._to_render_array(chunk))
+            processed += len(chunk)
+
+            if self._buffered_points >= self.FLUSH_POINTS:
+                self._flush()
+            if progress_callback:
+                progress_callback(min(99, int(processed / self.total_points * 100)))
+
+        self._flush()
+
+        hierarchy = {
+            "version": OctreeIndex.VERSION,
+            "cube": {"min": self.cube_min.tolist(), "size": self.cube_size},
+            "dtype": [[name, self._dtype[name].str] for name in self._dtype.names]
+            if self._dtype is not None
+            else [],
+            "points": processed,
+            "depth": self.depth,
+            "nodes": {self._decode(c): n for c, n in self._node_counts.items()},
+        }
+        # hierarchy.json en son yazılır; varlığı dizinin tamamlandığını gösterir
+        temp_path = os.path.join(self.root_dir, f"{OctreeIndex.HIERARCHY_FILE}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(hierarchy, f)
+        os.replace(temp_path, os.path.join(self.root_dir, OctreeIndex.HIERARCHY_FILE))
+
+        return {"status": True, "points": processed, "nodes": len(self._node_counts)}
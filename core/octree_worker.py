@@ -0,0 +1,76 @@
+from core.octree import OctreeBuilder, OctreeIndex
+from core.cancellable_worker import CancellableWorker
+from PyQt5.QtCore import pyqtSignal
+from core.database.connection import CACHE_DIR
+from core.cache.fingerprint import Fingerprint
+from typing import Dict, Any, Optional
+import traceback
+import shutil
+import os
+
+
+class OctreeWorker(CancellableWorker):
+    """
+    Büyük dosyalar için LOD dizinini arka planda bir kez oluşturur.
+    Dizin dosya parmak iziyle saklandığından sonraki açılışlarda yeniden
+    kullanılır.
+    """
+
+    finished = pyqtSignal(str, str)  # file_path, index_dir
+    error = pyqtSignal(str)
+    progress = pyqtSignal(int)
+
+    OCTREE_DIR = os.path.join(CACHE_DIR, "octree")
+
+    def __init__(self, file_path: str, reader_config: Dict[str, Any], readers_las: Dict[str, Any]):
+        super().__init__()
+        self.file_path = file_path
+        self.reader_config = reader_config
+        self.readers_las = readers_las
+
+    @classmethod
+    def index_dir(cls, file_path: str) -> Optional[str]:
+        key = Fingerprint.file_key(file_path)
+        if key is None:
+            return None
+        return os.path.join(cls.OCTREE_DIR, Fingerprint.key_hash(key))
+
+    def run(self):
+        root_dir = self.index_dir(self.file_path)
+        if root_dir is None:
+            self.error.emit(f"LOD index: file not found: {self.file_path}")
+            return
+
+        if OctreeIndex.exists(root_dir):
+            self.finished.emit(self.file_path, root_dir)
+            return
+
+        try:
+            # Yarım kalmış önceki bir denemenin düğüm dosyalarını temizle
+            shutil.rmtree(root_dir, ignore_errors=True)
+            os.makedirs(root_dir, exist_ok=True)
+
+            builder = OctreeBuilder(
+                self.reader_config,
+                self.readers_las,
+                self.readers_las.get("count", 0),
+                root_dir,
+            )
+            result = builder.build(
+                progress_callback=self.progress.emit,
+                cancel_callback=lambda: self.is_interrupted,
+            )
+
+            if not result.get("status"):
+                shutil.rmtree(root_dir, ignore_errors=True)
+                if self.is_interrupted:
+                    self.cancelled.emit()
+                    return
+                self.error.emit(result.get("error", "LOD index build failed."))
+                return
+
+            self.progress.emit(100)
+            self.finished.emit(self.file_path, root_dir)
+        except Exception as e:
+            shutil.rmtree(root_dir, ignore_errors=True)
+            self.error.emit(f"LOD index build failed: {e}\n{traceback.format_exc()}")
@@ -0,0 +1,165 @@
+"""
+Pipeline'ları ayrı yorumlayıcıda çalıştıran uzun ömürlü işlemin giriş
+noktası (python -m core.pipeline_host). Qt veya arayüz modülü içe
+aktarmaz; işler stdin'den okunur, yanıtlar stdout'a yazılır (pickle).
+Nokta dizileri diske değil paylaşımlı belleğe yazılarak aktarılır.
+"""
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+from numpy.lib import recfunctions as rfn
+import numpy as np
+import traceback
+import pickle
+import sys
+import os
+
+
+# İşlem içindeki istatistik hesabında geçici kopyaları sınırlamak için parça boyu
+STATS_CHUNK_SIZE = 1_000_000
+
+
+class SharedArray:
+    """
+    Numpy dizilerini paylaşımlı bellek bölütleriyle işlemler arasında taşır.
+    Bölütü oluşturan taraf dizinin alıcısına sahipliği devreder; bölütü
+    yalnızca alıcı siler (unlink).
+    """
+
+    @staticmethod
+    def export(array: np.ndarray) -> Tuple[Optional[shared_memory.SharedMemory], Dict]:
+        array = np.ascontiguousarray(array)
+        spec = {"name": None, "dtype": array.dtype, "shape": array.shape}
+        if array.nbytes == 0:
+            return None, spec
+
+        block = shared_memory.SharedMemory(create=True, size=array.nbytes)
+        np.ndarray(array.shape, array.dtype, buffer=block.buf)[...] = array
+        spec["name"] = block.name
+        return block, spec
+
+    @staticmethod
+    def attach(spec: Dict) -> Tuple[Optional[shared_memory.SharedMemory], np.ndarray]:
+        if spec["name"] is None:
+            return None, np.empty(spec["shape"], dtype=spec["dtype"])
+        block = shared_memory.SharedMemory(name=spec["name"])
+        return block, np.ndarray(spec["shape"], dtype=spec["dtype"], buffer=block.buf)
+
+    @classmethod
+    def take(cls, spec: Dict) -> np.ndarray:
+        """Dizinin kopyasını döndürür ve bölütü siler."""
+        block, view = cls.attach(spec)
+        if block is None:
+            return view
+        try:
+            return view.copy()
+        finally:
+            del view
+            cls.close(block)
+            block.unlink()
+
+    @classmethod
+    def discard(cls, spec: Dict):
+        """Alınmayacak dizinin bölütünü siler."""
+        if spec["name"] is None:
+            return
+        block = shared_memory.SharedMemory(name=spec["name"])
+        cls.close(block)
+        block.unlink()
+
+    @staticmethod
+    def disown(block: shared_memory.SharedMemory):
+        # Bu işlemin kaynak izleyicisi bölütü kapanışta silmesin; silme karşı tarafta
+        if os.name == "posix":
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(block._name, "shared_memory")
+
+    @staticmethod
+    def close(block: Optional[shared_memory.SharedMemory]):
+        if block is None:
+            return
+        try:
+            block.close()
+        except BufferError:
+            # Bölüte bakan görünüm hâlâ yaşıyor; eşleme çöp toplamada kapanır
+            pass
+
+
+def run_job(job: Dict) -> Dict:
+    """
+    Tek bir pipeline'ı çalıştırır. Çıktı dizileri paylaşımlı belleğe
+    yazılır; stats verilirse istatistikler burada hesaplanır ve noktalar
+    aktarılmaz.
+    """
+    import pdal
+
+    input_block = None
+    created: List[Dict] = []
+    pipeline = None
+    try:
+        if job["input"] is not None:
+            input_block, points = SharedArray.attach(job["input"])
+            SharedArray.disown(input_block)
+            pipeline = pdal.Pipeline(job["payload"], arrays=[points])
+            del points
+        else:
+            pipeline = pdal.Pipeline(job["payload"])
+        count = pipeline.execute()
+
+        fields = job["fields"]
+        if job["want_arrays"]:
+            for arr in pipeline.arrays:
+                if fields:
+                    names = [name for name in fields if name in arr.dtype.names]
+                    arr = rfn.repack_fields(arr[names])
+                block, spec = SharedArray.export(arr)
+                if block is not None:
+                    SharedArray.disown(block)
+                    SharedArray.close(block)
+                created.append(spec)
+
+        summary = None
+        if job["stats"] is not None:
+            from core.stats_engine import StreamingStats
+
+            engine = StreamingStats(**job["stats"])
+            for arr in pipeline.arrays:
+                for start in range(0, len(arr), STATS_CHUNK_SIZE):
+                    engine.add(arr[start:start + STATS_CHUNK_SIZE])
+            summary = engine.result()
+
+        return {
+            "status": True,
+            "count": count,
+            "metadata": pipeline.metadata,
+            "arrays": created,
+            "stats": summary,
+        }
+    except Exception as e:
+        # Alıcıya ulaşmayacak bölütler burada silinir
+        for spec in created:
+            SharedArray.discard(spec)
+        return {"status": False, "error": f"{e}\n{traceback.format_exc()}"}
+    finally:
+        pipeline = None
+        SharedArray.close(input_block)
+
+
+def main():
+    # Yanıt kanalı özgün stdout'tur; PDAL veya kütüphanelerin yazdıkları
+    # kanala karışmasın diye tanımlayıcı 1 stderr'e yönlendirilir
+    channel = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    source = sys.stdin.buffer
+
+    while True:
+        try:
+            job = pickle.load(source)
+        except EOFError:
+            # Uygulama kapandı
+            break
+        pickle.dump(run_job(job), channel, protocol=pickle.HIGHEST_PROTOCOL)
+        channel.flush()
+
+
+if __name__ == "__main__":
+    main()
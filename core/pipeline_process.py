@@ -0,0 +1,203 @@
+from core.pipeline_host import SharedArray
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional
+import numpy as np
+import subprocess
+import threading
+import atexit
+import pickle
+import queue
+import json
+import sys
+import os
+
+
+class PipelineCancelled(Exception):
+    """Çalışan pipeline kullanıcı tarafından iptal edildi."""
+
+
+class PipelineHost:
+    """
+    core.pipeline_host'u çalıştıran uzun ömürlü yorumlayıcı. Uygulamanın
+    ana modülünü (Qt, arayüz) içe aktarmadığından hızlı başlar ve işler
+    arasında yeniden kullanılır.
+    """
+
+    ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    def __init__(self):
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            path for path in (self.ROOT_DIR, env.get("PYTHONPATH")) if path
+        )
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "core.pipeline_host"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=env,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    @property
+    def exitcode(self) -> Optional[int]:
+        return self.process.poll()
+
+    def send(self, job: Dict):
+        pickle.dump(job, self.process.stdin, protocol=pickle.HIGHEST_PROTOCOL)
+        self.process.stdin.flush()
+
+    def receive(
+        self, cancel_callback: Optional[Callable[[], bool]], poll_interval: float
+    ) -> Optional[Dict]:
+        """Yanıtı bekler; işlem kapanırsa None döner, iptalde PipelineCancelled fırlatır."""
+        replies = queue.Queue()
+
+        def read():
+            try:
+                replies.put(pickle.load(self.process.stdout))
+            except Exception:
+                replies.put(None)
+
+        threading.Thread(target=read, daemon=True).start()
+        while True:
+            if cancel_callback and cancel_callback():
+                raise PipelineCancelled()
+            try:
+                return replies.get(timeout=poll_interval)
+            except queue.Empty:
+                continue
+
+    def terminate(self):
+        if self.is_alive():
+            self.process.kill()
+        self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+class PipelineProcess:
+    """
+    Akış modunda çalışamayan (tüm noktaları bekleyen) pipeline'ları ayrı bir
+    işlemde çalıştırır. PDAL'ın execute() çağrısı kesilemediği için iptal
+    istendiğinde işlem sonlandırılır; uygulama iş parçacığı hemen serbest kalır.
+    İşlemler (PipelineHost) işler arasında yeniden kullanılır; girdi ve çıktı
+    dizileri paylaşımlı bellekle aktarılır.
+    """
+
+    POLL_INTERVAL = 0.2
+    # İş bitince yeniden kullanılmak üzere bekletilen en fazla işlem sayısı
+    MAX_IDLE_HOSTS = 2
+
+    _idle_hosts: List[PipelineHost] = []
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        stages: list,
+        input_array: Optional[np.ndarray] = None,
+        want_arrays: bool = True,
+        fields: Optional[List[str]] = None,
+        stats: Optional[Dict] = None,
+    ):
+        self.stages = stages
+        self.input_array = input_array
+        self.want_arrays = want_arrays
+        self.fields = fields
+        # StreamingStats argümanları; verilirse sonuç "stats" altında döner
+        self.stats = stats
+
+    @classmethod
+    def _acquire_host(cls) -> PipelineHost:
+        with cls._lock:
+            while cls._idle_hosts:
+                host = cls._idle_hosts.pop()
+                if host.is_alive():
+                    return host
+        return PipelineHost()
+
+    @classmethod
+    def _release_host(cls, host: PipelineHost):
+        with cls._lock:
+            if host.is_alive() and len(cls._idle_hosts) < cls.MAX_IDLE_HOSTS:
+                cls._idle_hosts.append(host)
+                return
+        host.terminate()
+
+    @classmethod
+    def shutdown(cls):
+        with cls._lock:
+            hosts, cls._idle_hosts = cls._idle_hosts, []
+        for host in hosts:
+            host.terminate()
+
+    def run(self, cancel_callback: Optional[Callable[[], bool]] = None) -> Dict:
+        """
+        {"count", "metadata", "arrays", "stats"} döndürür. İptalde PipelineCancelled,
+        pipeline hatasında veya işlem beklenmedik şekilde kapanırsa Exception
+        fırlatır.
+        """
+        host = self._acquire_host()
+        input_block = None
+        reusable = False
+
+        try:
+            input_spec = None
+            if self.input_array is not None:
+                input_block, input_spec = SharedArray.export(self.input_array)
+
+            host.send({
+                "payload": json.dumps(self.stages),
+                "input": input_spec,
+                "want_arrays": self.want_arrays,
+                "fields": self.fields,
+                "stats": self.stats,
+            })
+            message = host.receive(cancel_callback, self.POLL_INTERVAL)
+
+            if message is None:
+                raise Exception(
+                    f"Pipeline process exited unexpectedly (code {host.exitcode})."
+                )
+            # Pipeline hatası işlemi bozmaz; yalnızca iptal ve çökmede yeniden başlatılır
+            reusable = True
+            if not message["status"]:
+                raise Exception(message["error"])
+
+            return {
+                "count": message["count"],
+                "metadata": message["metadata"],
+                "arrays": [SharedArray.take(spec) for spec in message["arrays"]],
+                "stats": message["stats"],
+            }
+        finally:
+            if reusable:
+                self._release_host(host)
+            else:
+                host.terminate()
+            if input_block is not None:
+                SharedArray.close(input_block)
+                input_block.unlink()
+
+
+atexit.register(PipelineProcess.shutdown)
+
+
+def terminate_pool(executor: ProcessPoolExecutor):
+    """
+    Havuzu bekleyen işleri iptal ederek kapatır ve çalışan işlemleri
+    sonlandırır; shutdown() tek başına çalışan işlerin bitmesini bekler.
+    """
+    # concurrent.futures çalışan işlemleri yalnızca _processes ile açar
+    processes = list((getattr(executor, "_processes", None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+    for process in processes:
+        process.join()
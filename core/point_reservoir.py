@@ -0,0 +1,47 @@
+from typing import Optional
+import numpy as np
+
+
+class PointReservoir:
+    """
+    Akış halinde gelen nokta parçalarından sabit boyutlu, düzgün dağılımlı
+    rastgele örnek tutar (reservoir sampling). Bellek kullanımı toplam
+    nokta sayısından bağımsızdır.
+    """
+
+    def __init__(self, capacity: int, seed: Optional[int] = None):
+        self.capacity = capacity
+        self.seen = 0
+        self._buffer: Optional[np.ndarray] = None
+        self._filled = 0
+        self._rng = np.random.default_rng(seed)
+
+    def add(self, chunk: np.ndarray):
+        if len(chunk) == 0:
+            return
+
+        if self._buffer is None:
+            self._buffer = np.empty(self.capacity, dtype=chunk.dtype)
+
+        # Önce rezervuar dolana kadar noktalar doğrudan alınır
+        free = self.capacity - self._filled
+        if free > 0:
+            take = min(free, len(chunk))
+            self._buffer[self._filled:self._filled + take] = chunk[:take]
+            self._filled += take
+            self.seen += take
+            chunk = chunk[take:]
+            if len(chunk) == 0:
+                return
+
+        # t. nokta k/(t+1) olasılıkla rastgele bir yuvaya yazılır (Algorithm R)
+        positions = np.arange(self.seen, self.seen + len(chunk))
+        slots = (self._rng.random(len(chunk)) * (positions + 1)).astype(np.int64)
+        accepted = slots < self.capacity
+        self._buffer[slots[accepted]] = chunk[accepted]
+        self.seen += len(chunk)
+
+    def result(self) -> Optional[np.ndarray]:
+        if self._buffer is None:
+            return None
+        return self._buffer[:self._filled]
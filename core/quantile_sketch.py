@@ -0,0 +1,323 @@
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
+import math
+
+
+def _finite(values: np.ndarray) -> np.ndarray:
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.floating):
+        values = values[np.isfinite(values)]
+    return values
+
+
+class FixedBinHistogram:
+    """
+    Sabit genişlikli kutulardan oluşan, birleştirilebilir histogram.
+
+    Kutu genişliği ikinin kuvvetidir ve kutular sıfıra hizalıdır ([i*w, (i+1)*w)).
+    Yeni değerler aralığı max_bins'i aşacak kadar genişletirse komşu kutular
+    ikişer birleştirilir (genişlik iki katına çıkar). Hizalama sayesinde farklı
+    parçaların/karoların histogramları aynı genişliğe getirilip kayıpsız toplanır.
+    Sayılar kesindir; çözünürlük aralık / max_bins ile aralık / (max_bins / 2)
+    arasındadır.
+    """
+
+    MAX_BINS = 1024
+
+    def __init__(self, max_bins: int = MAX_BINS):
+        self.max_bins = max(2, int(max_bins))
+        self.width: Optional[float] = None
+        self.start = 0
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    @property
+    def total(self) -> int:
+        return int(self.counts.sum())
+
+    def copy(self) -> "FixedBinHistogram":
+        other = FixedBinHistogram(self.max_bins)
+        other.width = self.width
+        other.start = self.start
+        other.counts = self.counts.copy()
+        return other
+
+    def add(self, values: np.ndarray):
+        values = _finite(values)
+        if len(values) == 0:
+            return
+        values = values.astype(np.float64, copy=False)
+        low, high = float(values.min()), float(values.max())
+        if self.width is None:
+            span = high - low
+            if span <= 0:
+                span = max(abs(high), 1.0) * 2.0 ** -20
+            self.width = 2.0 ** math.ceil(math.log2(span / (self.max_bins / 2)))
+
+        self._cover(math.floor(low / self.width), math.floor(high / self.width))
+        index = np.floor(values / self.width).astype(np.int64) - self.start
+        self.counts += np.bincount(index, minlength=len(self.counts))
+
+    def merge(self, other: "FixedBinHistogram"):
+        if other.width is None or len(other.counts) == 0:
+            return
+        if self.width is None:
+            self.width, self.start, self.counts = other.width, other.start, other.counts.copy()
+            return
+
+        other = other.copy()
+        while other.width < self.width:
+            other._coarsen()
+        while self.width < other.width:
+            self._coarsen()
+        self._cover(other.start, other.start + len(other.counts) - 1)
+        # _cover genişliği artırmış olabilir
+        while other.width < self.width:
+            other._coarsen()
+
+        offset = other.start - self.start
+        self.counts[offset:offset + len(other.counts)] += other.counts
+
+    def _cover(self, first: int, last: int):
+        """Kutu dizisini [first, last] indekslerini kapsayacak şekilde genişletir."""
+        if len(self.counts):
+            first = min(first, self.start)
+            last = max(last, self.start + len(self.counts) - 1)
+        while last - first + 1 > self.max_bins:
+            self._coarsen()
+            # İkinin kuvveti genişlikte floor(v / 2w) == floor(v / w) // 2
+            first //= 2
+            last //= 2
+
+        if len(self.counts) == 0:
+            self.start = first
+            self.counts = np.zeros(last - first + 1, dtype=np.int64)
+            return
+        before = self.start - first
+        after = last - (self.start + len(self.counts) - 1)
+        if before or after:
+            self.counts = np.pad(self.counts, (before, after))
+            self.start = first
+
+    def _coarsen(self):
+        if len(self.counts):
+            index = (self.start + np.arange(len(self.counts))) // 2
+            new_start = int(index[0])
+            self.counts = np.bincount(index - new_start, weights=self.counts).astype(np.int64)
+            self.start = new_start
+        self.width *= 2
+
+    def coarsened(self, max_bins: int) -> "FixedBinHistogram":
+        """Boş uç kutuları atılmış, en fazla max_bins kutulu bir kopya (gösterim için)."""
+        result = self.copy()
+        nonzero = np.flatnonzero(result.counts)
+        if len(nonzero) == 0:
+            result.counts = np.zeros(0, dtype=np.int64)
+            return result
+        result.start += int(nonzero[0])
+        result.counts = result.counts[nonzero[0]:nonzero[-1] + 1]
+        while len(result.counts) > max_bins:
+            result._coarsen()
+        return result
+
+    def edges(self) -> np.ndarray:
+        if self.width is None:
+            return np.zeros(0)
+        return (self.start + np.arange(len(self.counts) + 1)) * self.width
+
+    def to_dict(self) -> Dict:
+        return {
+            "max_bins": self.max_bins,
+            "width": self.width,
+            "start": self.start,
+            "counts": self.counts.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "FixedBinHistogram":
+        histogram = cls(data.get("max_bins", cls.MAX_BINS))
+        histogram.width = data.get("width")
+        histogram.start = int(data.get("start", 0))
+        histogram.counts = np.asarray(data.get("counts", []), dtype=np.int64)
+        return histogram
+
+
+class TDigest:
+    """
+    Birleştirilebilir t-digest (Dunning): değer dağılımını ağırlıklı merkezlerle
+    özetler. Merkez boyutu k2 ölçek fonksiyonuyla sınırlanır; uçlarda merkezler
+    küçük kaldığı için uç yüzdelikler (ör. %0.1, %99.9) de doğru tahmin edilir.
+
+    Parçalar önce kendi aralarında sıkıştırılıp mevcut merkezlerle birleştirilir;
+    tamsayı boyutlarda (sınıf, yoğunluk) sıralama yerine np.bincount kullanılır.
+    """
+
+    COMPRESSION = 200.0
+    # Bu genişliğe kadar tamsayı değerler doğrudan sayılır
+    MAX_INTEGER_SPAN = 1 << 20
+
+    def __init__(self, compression: float = COMPRESSION):
+        self.compression = float(compression)
+        self.means = np.zeros(0)
+        self.weights = np.zeros(0)
+        self.minimum = np.inf
+        self.maximum = -np.inf
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum())
+
+    def add(self, values: np.ndarray):
+        values = _finite(values)
+        if len(values) == 0:
+            return
+
+        if np.issubdtype(values.dtype, np.integer):
+            low, high = int(values.min()), int(values.max())
+            if high - low < self.MAX_INTEGER_SPAN:
+                counts = np.bincount(values.astype(np.int64, copy=False) - low)
+                present = np.flatnonzero(counts)
+                self._absorb(
+                    (present + low).astype(np.float64), counts[present].astype(np.float64)
+                )
+                return
+
+        values = np.sort(values.astype(np.float64, copy=False))
+        self._absorb(values, np.ones(len(values)))
+
+    def merge(self, other: "TDigest"):
+        if len(other.means):
+            self._absorb(other.means, other.weights, other.minimum, other.maximum)
+
+    def _absorb(
+        self,
+        means: np.ndarray,
+        weights: np.ndarray,
+        minimum: Optional[float] = None,
+        maximum: Optional[float] = None,
+    ):
+        self.minimum = min(self.minimum, float(means[0]) if minimum is None else minimum)
+        self.maximum = max(self.maximum, float(means[-1]) if maximum is None else maximum)
+
+        means = np.concatenate([self.means, means])
+        weights = np.concatenate([self.weights, weights])
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+
+        cumulative = np.cumsum(weights)
+        total = cumulative[-1]
+        q = (cumulative - weights / 2) / total
+        # k2(q) = δ / Z(n) · log(q / (1 - q)); her merkez k ekseninde en fazla bir
+        # birim kaplar. Merkez boyutu q(1 - q) ile orantılı olduğundan uçlarda
+        # merkezler çok küçük kalır ve ayrık uç kümeleri ana dağılıma karışmaz.
+        scale = self.compression / (4 * np.log(max(total / self.compression, 1.0)) + 24)
+        k = scale * np.log(q / (1 - q))
+        group = np.floor(k - k[0]).astype(np.int64)
+
+        starts = np.concatenate([[0], np.flatnonzero(np.diff(group)) + 1])
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+    def _positions(self) -> Tuple[np.ndarray, np.ndarray]:
+        # Merkezler kendi ağırlıklarının ortasında kabul edilir; uçlar min/max'a bağlanır
+        cumulative = np.cumsum(self.weights)
+        centers = cumulative - self.weights / 2
+        positions = np.concatenate([[0.0], centers, [cumulative[-1]]])
+        values = np.concatenate([[self.minimum], self.means, [self.maximum]])
+        return positions, values
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        qs = np.clip(np.asarray(qs, dtype=np.float64), 0.0, 1.0)
+        if len(self.means) == 0:
+            return np.full(qs.shape, np.nan)
+        positions, values = self._positions()
+        return np.interp(qs * positions[-1], positions, values)
+
+    def cdf(self, values: Sequence[float]) -> np.ndarray:
+        values = np.asarray(values, dtype=np.float64)
+        if len(self.means) == 0:
+            return np.full(values.shape, np.nan)
+        positions, points = self._positions()
+        return np.interp(values, points, positions) / positions[-1]
+
+    def to_dict(self) -> Dict:
+        return {
+            "compression": self.compression,
+            "means": self.means.tolist(),
+            "weights": self.weights.tolist(),
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TDigest":
+        digest = cls(data.get("compression", cls.COMPRESSION))
+        digest.means = np.asarray(data.get("means", []), dtype=np.float64)
+        digest.weights = np.asarray(data.get("weights", []), dtype=np.float64)
+        digest.minimum = float(data.get("minimum", np.inf))
+        digest.maximum = float(data.get("maximum", -np.inf))
+        return digest
+
+
+class DimensionSketch:
+    """
+    Bir boyutun dağılım özeti: gösterim için sabit kutulu histogram, yüzdelik
+    sorguları için t-digest. Parça, karo veya işlem sonuçları merge() ile
+    birleştirilir; bellek kullanımı nokta sayısından bağımsızdır.
+    """
+
+    def __init__(
+        self,
+        max_bins: int = FixedBinHistogram.MAX_BINS,
+        compression: float = TDigest.COMPRESSION,
+    ):
+        self.histogram = FixedBinHistogram(max_bins)
+        self.digest = TDigest(compression)
+
+    @classmethod
+    def from_values(cls, values: np.ndarray) -> "DimensionSketch":
+        sketch = cls()
+        sketch.add(values)
+        return sketch
+
+    @property
+    def count(self) -> int:
+        return self.histogram.total
+
+    def add(self, values: np.ndarray):
+        self.histogram.add(values)
+        self.digest.add(values)
+
+    def merge(self, other: "DimensionSketch"):
+        self.histogram.merge(other.histogram)
+        self.digest.merge(other.digest)
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """
+        t-digest tahmini, histogramda hedef sıranın düştüğü kutuya sıkıştırılır.
+        Histogram kesin sayımlı olduğundan hata kutu genişliğini aşmaz; uç
+        değerler aralığı genişletip kutuları kabalaştırdığında ise t-digest'in
+        göreli doğruluğu korunur.
+        """
+        qs = np.clip(np.asarray(qs, dtype=np.float64), 0.0, 1.0)
+        estimates = self.digest.quantiles(qs)
+        cumulative = np.cumsum(self.histogram.counts)
+        if len(cumulative) == 0 or cumulative[-1] == 0:
+            return estimates
+
+        edges = self.histogram.edges()
+        target = np.maximum(qs * cumulative[-1], 1)
+        index = np.minimum(np.searchsorted(cumulative, target), len(cumulative) - 1)
+        return np.clip(estimates, edges[index], edges[index + 1])
+
+    def quantile(self, q: float) -> float:
+        return float(self.digest.quantiles([q])[0])
+
+    def to_dict(self) -> Dict:
+        return {"histogram": self.histogram.to_dict(), "digest": self.digest.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "DimensionSketch":
+        sketch = cls()
+        sketch.histogram = FixedBinHistogram.from_dict(data.get("histogram", {}))
+        sketch.digest = TDigest.from_dict(data.get("digest", {}))
+        return sketch
@@ -1,13 +1,18 @@
-from data.data_handler import IBasicReader, IMetadataExtractor, IDataSampler
-from PyQt5.QtCore import QObject, pyqtSignal
+from data.data_handler import IBasicReader, IMetadataExtractor, IDataSampler, IPointCloudOpener
+from core.cache.open_result_cache import OpenResultCache
+from core.cache.preview_cache import PreviewCache
+from core.cancellable_worker import CancellableWorker
+from PyQt5.QtCore import pyqtSignal
+from core.cache.fingerprint import Fingerprint
+from typing import Dict, Any, Tuple
 from core.logger import Logger
-from typing import Union
 import traceback
 
 
-class ReaderWorker(QObject):
+class ReaderWorker(CancellableWorker):
 
     finished = pyqtSignal(str, dict, dict, dict, dict)
+    level_ready = pyqtSignal(str, dict)
     error = pyqtSignal(str)
     progress = pyqtSignal(int)
 
@@ -27,38 +32,104 @@ class ReaderWorker(QObject):
         self.data_sampler = data_sampler
         self.logger = logger
 
+    def _open_progressively(self) -> Tuple[Dict[str, Any], bool]:
+        """
+        İlk (kaba) seviyeyi finished ile, daha yoğun seviyeleri level_ready
+        ile yayınlar. İyileştirme iptal edilir ya da başarısız olursa
+        tamamlanan en yoğun seviyede durulur. (sonuç, finished_yayınlandı_mı)
+        döndürür.
+        """
+        levels = self.basic_reader.get_preview_levels(self.file_path)
+        result = self.basic_reader.open(self.file_path, max_points=levels[0])
+        if not result.get("status") or len(levels) == 1:
+            return result, False
+
+        self.finished.emit(
+            self.file_path,
+            result["bounds"],
+            result["full_metadata"],
+            result["summary_metadata"],
+            result["sample_data"],
+        )
+
+        densest = result["sample_data"]
+        for level in levels[1:]:
+            if self.is_interrupted:
+                break
+            sample_data = self.basic_reader.get_preview_sample(self.file_path, level)
+            if not sample_data.get("status"):
+                self.logger.warning(
+                    f"Preview refinement stopped: {sample_data.get('error')}"
+                )
+                break
+            self.level_ready.emit(self.file_path, sample_data)
+            densest = sample_data
+
+        # Önbelleğe tamamlanan en yoğun seviye yazılır
+        return {**result, "sample_data": densest}, True
+
+    def _open_in_steps(self) -> Dict[str, Any]:
+        result = self.basic_reader.read(self.file_path)
+        if not result.get("status"):
+            return result
+
+        self.progress.emit(25)
+        full_metadata = self.metadata_extractor.get_metadata(self.file_path)
+        self.progress.emit(50)
+        bounds = self.data_sampler.get_bounds(self.file_path)
+        self.progress.emit(75)
+        return {
+            "status": True,
+            "bounds": bounds,
+            "full_metadata": full_metadata,
+            "summary_metadata": self.metadata_extractor.get_summary_metadata(
+                full_metadata
+            ),
+            "sample_data": self.data_sampler.get_sample_data(),
+        }
+
     def run(self):
         try:
             self.progress.emit(10)
-            self.progress.emit(-1)
-            result = self.basic_reader.read(self.file_path)
+            cache_key = Fingerprint.file_key(self.file_path)
+            result = OpenResultCache.get(cache_key)
+
+            if result is None:
+                result = PreviewCache.get(cache_key)
+                if result is not None:
+                    OpenResultCache.put(cache_key, result)
+
+            emitted = False
+            if result is None:
+                self.progress.emit(-1)
+                if isinstance(self.basic_reader, IPointCloudOpener):
+                    result, emitted = self._open_progressively()
+                else:
+                    result = self._open_in_steps()
+
+                if result.get("status"):
+                    OpenResultCache.put(cache_key, result)
+                    PreviewCache.put(cache_key, result)
+
+            if self.is_interrupted:
+                self.cancelled.emit()
+                return
+
             if result.get("status"):
-                self.progress.emit(25)
-                self.bounds = self.data_sampler.get_bounds(self.file_path)
-                self.progress.emit(47)
-                self.full_metadata = self.metadata_extractor.get_metadata(
-                    self.file_path
-                )
-                self.progress.emit(60)
-                self.summary_metadata = self.metadata_extractor.get_summary_metadata(
-                    self.full_metadata
-                )
-                self.progress.emit(75)
-                self.sample_data = self.data_sampler.get_sample_data()
                 self.progress.emit(100)
-                self.finished.emit(
-                    self.file_path,
-                    self.bounds,
-                    self.full_metadata,
-                    self.summary_metadata,
-                    self.sample_data,
-                )
+                if not emitted:
+                    self.finished.emit(
+                        self.file_path,
+                        result["bounds"],
+                        result["full_metadata"],
+                        result["summary_metadata"],
+                        result["sample_data"],
+                    )
             else:
                 self.progress.emit(0)
                 error_message = result.get("error", "An unspecified error occurred while reading the file.")
                 self.error.emit(f"Reader failed: {error_message}") #
         except Exception as e:
-            import traceback
             error_details = (
                 f"Worker thread critical error: {e}\n{traceback.format_exc()}"
             )
@@ -7,6 +7,15 @@ class RenderUtils:
     # Görüntülenecek maksimum nokta sayısı (1 Milyon)
     MAX_VISIBLE_POINTS = 1_000_000
 
+    # Kademeli önizleme seviyeleri (ilk görüntü için kaba örnekten başlar)
+    PREVIEW_LEVELS = (10_000, 100_000)
+
+    # Bu sayının üzerindeki dosyalar için diskte LOD (octree) dizini oluşturulur
+    LOD_MIN_POINTS = 5_000_000
+
+    # Render sözlüğünde tüm boyutları içeren orijinal PDAL dizisinin anahtarı
+    POINTS_KEY = "points"
+
     # ASPRS Standart LAS Sınıflandırma Kodları
     LAS_LABELS = {
         0: "Created, never classified",
@@ -37,4 +46,42 @@ class RenderUtils:
             cid = int(float(class_id))
             return RenderUtils.LAS_LABELS.get(cid, f"Class {cid}")
         except:
-            return str(class_id)
\ No newline at end of file
+            return str(class_id)
+    @staticmethod
+    def to_render_data(points: np.ndarray) -> dict:
+        """
+        PDAL yapılandırılmış dizisinden render sözlüğü üretir. Boyut alanları
+        dizinin görünümleridir (kopya yok); dizinin kendisi tüm boyutlarıyla
+        POINTS_KEY altında saklanır.
+        """
+        names = points.dtype.names
+        render_data = {
+            Dimensions.X: points[Dimensions.X.value],
+            Dimensions.Y: points[Dimensions.Y.value],
+            Dimensions.Z: points[Dimensions.Z.value],
+            "count": len(points),
+        }
+
+        if Dimensions.INTENSITY.value in names:
+            render_data[Dimensions.INTENSITY] = points[Dimensions.INTENSITY.value]
+
+        if all(d.value in names for d in (Dimensions.RED, Dimensions.GREEN, Dimensions.BLUE)):
+            render_data[Dimensions.RED] = points[Dimensions.RED.value]
+            render_data[Dimensions.GREEN] = points[Dimensions.GREEN.value]
+            render_data[Dimensions.BLUE] = points[Dimensions.BLUE.value]
+
+        if Dimensions.CLASSIFICATION.value in names:
+            render_data[Dimensions.CLASSIFICATION] = points[Dimensions.CLASSIFICATION.value]
+
+        render_data[RenderUtils.POINTS_KEY] = points
+        render_data["status"] = True
+        return render_data
+
+    @staticmethod
+    def render_data_nbytes(render_data: dict) -> int:
+        """Render sözlüğünün bellekte kapladığı bayt sayısını döndürür."""
+        # Boyut alanları orijinal dizinin görünümleridir; iki kez sayılmamalı
+        points = render_data.get(RenderUtils.POINTS_KEY)
+        if isinstance(points, np.ndarray):
+            return points.nbytes
+        return sum(v.nbytes for v in render_data.values() if isinstance(v, np.ndarray))
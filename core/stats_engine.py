@@ -0,0 +1,279 @@
+from core.quantile_sketch import DimensionSketch
+from typing import Dict, Iterable, List, Optional, Sequence
+import numpy as np
+
+
+class DimensionStats:
+    """
+    Tek bir boyut için tek geçişte min/max/ortalama/varyans. Her parçanın
+    kendi momentleri hesaplanır ve Chan'ın paralel Welford formülüyle
+    birikime eklenir; noktalar tutulmaz ve toplama sırası sonucu değiştirmez.
+    """
+
+    __slots__ = ("count", "mean", "m2", "minimum", "maximum")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+
+    def add(self, values: np.ndarray):
+        if len(values) == 0:
+            return
+        values = values.astype(np.float64, copy=False)
+        chunk_mean = float(values.mean())
+        deviations = values - chunk_mean
+        self._combine(
+            len(values),
+            chunk_mean,
+            float(np.dot(deviations, deviations)),
+            float(values.min()),
+            float(values.max()),
+        )
+
+    def merge(self, other: "DimensionStats"):
+        if other.count:
+            self._combine(other.count, other.mean, other.m2, other.minimum, other.maximum)
+
+    def _combine(self, count: int, mean: float, m2: float, minimum: float, maximum: float):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.minimum = min(self.minimum, minimum)
+        self.maximum = max(self.maximum, maximum)
+
+    @property
+    def variance(self) -> float:
+        # filters.stats ile aynı şekilde örneklem varyansı
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+
+class StreamingStats:
+    """
+    Nokta parçalarından bellek kullanımı sabit istatistik çıkarır:
+
+    - seçilen boyutlar için min/max/ortalama/varyans (DimensionStats),
+    - sınıf boyutları için np.bincount ile değer sayıları,
+    - her boyut için histogram ve t-digest çizelgesi (DimensionSketch);
+      yüzdelikler ve gösterim histogramı bunlardan çıkarılır.
+
+    result() filters.stats metadata'sıyla aynı biçimi ({"statistic": [...]})
+    döndürür; StatsResultDialog değişmeden kullanır. Çizelgeler ayrıca
+    "sketches" altında döner ve LayerContext'te saklanır. Paralel çalışan
+    parçaların sonuçları merge() ile birleştirilebilir.
+    """
+
+    DEFAULT_PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+    CLASS_DIMENSIONS = ("Classification",)
+    # Sonuçtaki gösterim histogramının en fazla kutu sayısı
+    HISTOGRAM_BINS = 32
+
+    def __init__(
+        self,
+        dimensions: Optional[Sequence[str]] = None,
+        class_dimensions: Sequence[str] = CLASS_DIMENSIONS,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    ):
+        self.dimensions: Optional[List[str]] = list(dimensions) if dimensions else None
+        self.class_dimensions = list(class_dimensions)
+        self.percentiles = list(percentiles)
+        self.count = 0
+        self._stats: Dict[str, DimensionStats] = {}
+        self._class_counts: Dict[str, np.ndarray] = {}
+        self._sketches: Dict[str, DimensionSketch] = {}
+
+    def _resolve_dimensions(self, chunk: np.ndarray):
+        names = chunk.dtype.names or ()
+        if self.dimensions is None:
+            self.dimensions = [
+                name for name in names
+                if np.issubdtype(chunk.dtype[name], np.number)
+            ]
+        else:
+            self.dimensions = [name for name in self.dimensions if name in names]
+        self.class_dimensions = [
+            name for name in self.class_dimensions
+            if name in names and np.issubdtype(chunk.dtype[name], np.integer)
+        ]
+        for name in self.dimensions:
+            self._stats[name] = DimensionStats()
+            self._sketches[name] = DimensionSketch()
+
+    def add(self, chunk: np.ndarray):
+        if chunk is None or len(chunk) == 0:
+            return
+        if self.dimensions is None or not self._stats:
+            self._resolve_dimensions(chunk)
+
+        self.count += len(chunk)
+        for name in self.dimensions:
+            self._stats[name].add(chunk[name])
+            self._sketches[name].add(chunk[name])
+
+        for name in self.class_dimensions:
+            values = chunk[name].astype(np.int64, copy=False)
+            if values.min() < 0:
+                values = values[values >= 0]
+            counts = np.bincount(values)
+            current = self._class_counts.get(name)
+            if current is None:
+                self._class_counts[name] = counts
+            else:
+                size = max(len(current), len(counts))
+                current = np.pad(current, (0, size - len(current)))
+                current[:len(counts)] += counts
+                self._class_counts[name] = current
+
+    def add_all(self, chunks: Iterable[np.ndarray]):
+        for chunk in chunks:
+            self.add(chunk)
+
+    def merge(self, other: "StreamingStats"):
+        if other.count == 0:
+            return
+        if not self._stats:
+            self.dimensions = list(other.dimensions or [])
+            self.class_dimensions = list(other.class_dimensions)
+            self._stats = {name: DimensionStats() for name in self.dimensions}
+            self._sketches = {name: DimensionSketch() for name in self.dimensions}
+
+        self.count += other.count
+        for name, stats in other._stats.items():
+            self._stats.setdefault(name, DimensionStats()).merge(stats)
+        for name, sketch in other._sketches.items():
+            self._sketches.setdefault(name, DimensionSketch()).merge(sketch)
+        for name, counts in other._class_counts.items():
+            current = self._class_counts.get(name, np.zeros(0, dtype=np.int64))
+            size = max(len(current), len(counts))
+            self._class_counts[name] = (
+                np.pad(current, (0, size - len(current)))
+                + np.pad(counts, (0, size - len(counts)))
+            )
+
+    def sketches(self) -> Dict[str, DimensionSketch]:
+        return {name: sketch for name, sketch in self._sketches.items() if sketch.count}
+
+    def result(self) -> Dict:
+        statistic = []
+
+        for position, name in enumerate(self.dimensions or []):
+            stats = self._stats[name]
+            if stats.count == 0:
+                continue
+            entry = {
+                "name": name,
+                "position": position,
+                "count": stats.count,
+                "minimum": stats.minimum,
+                "maximum": stats.maximum,
+                "average": stats.mean,
+                "variance": stats.variance,
+                "stddev": float(np.sqrt(stats.variance)),
+            }
+            sketch = self._sketches.get(name)
+            if sketch is not None and sketch.count:
+                if self.percentiles:
+                    values = sketch.quantiles(np.asarray(self.percentiles) / 100.0)
+                    entry["percentiles"] = {
+                        str(p): float(v) for p, v in zip(self.percentiles, values)
+                    }
+                histogram = sketch.histogram.coarsened(self.HISTOGRAM_BINS)
+                entry["histogram"] = {
+                    "edges": histogram.edges().tolist(),
+                    "counts": histogram.counts.tolist(),
+                }
+            counts = self._class_counts.get(name)
+            if counts is not None:
+                entry["counts"] = [
+                    f"{value}/{int(counts[value])}" for value in np.flatnonzero(counts)
+                ]
+            statistic.append(entry)
+
+        return {
+            "statistic": statistic,
+            "source": "points",
+            "sketches": {name: sketch.to_dict() for name, sketch in self.sketches().items()},
+        }
+
+
+class HeaderStats:
+    """
+    Nokta çözmeden, dosya başlığından (readers.las metadata) cevaplanabilen
+    istatistikler: nokta sayısı, X/Y/Z sınırları, dönüş numarası dağılımı ve
+    CRS. Sonuç StreamingStats ile aynı biçimdedir; ortalama/varyans gibi
+    nokta geçişi gerektiren alanlar yoktur.
+    """
+
+    BOUND_DIMENSIONS = ("X", "Y", "Z")
+    RETURN_DIMENSION = "ReturnNumber"
+
+    @staticmethod
+    def from_metadata(full_metadata: Optional[Dict], summary: Optional[Dict] = None) -> Optional[Dict]:
+        readers_las = (
+            (full_metadata or {})
+            .get("metadata", {})
+            .get("metadata", {})
+            .get("readers.las", {})
+        )
+        count = readers_las.get("count")
+        if not isinstance(count, int) or count <= 0:
+            return None
+
+        statistic = []
+        for position, name in enumerate(HeaderStats.BOUND_DIMENSIONS):
+            axis = name.lower()
+            try:
+                minimum = float(readers_las[f"min{axis}"])
+                maximum = float(readers_las[f"max{axis}"])
+            except (KeyError, TypeError, ValueError):
+                return None
+            statistic.append({
+                "name": name,
+                "position": position,
+                "count": count,
+                "minimum": minimum,
+                "maximum": maximum,
+            })
+
+        by_return = [int(n) for n in readers_las.get("count_by_return") or []]
+        present = [i for i, n in enumerate(by_return) if n]
+        if present:
+            statistic.append({
+                "name": HeaderStats.RETURN_DIMENSION,
+                "position": len(statistic),
+                "count": sum(by_return),
+                "minimum": float(present[0] + 1),
+                "maximum": float(present[-1] + 1),
+                "counts": [f"{i + 1}/{by_return[i]}" for i in present],
+            })
+
+        summary = summary or {}
+        return {
+            "statistic": statistic,
+            "source": "header",
+            "srs": {
+                "name": summary.get("crs_name", "N/A"),
+                "epsg": summary.get("epsg", "N/A"),
+                "wkt": readers_las.get("spatialreference", ""),
+            },
+        }
+
+    @staticmethod
+    def merge(stats_data: Dict, header: Dict) -> Dict:
+        """
+        Nokta geçişi sonucuna yalnızca başlıkta bulunan bilgileri (CRS, dönüş
+        sayıları) ekler; ölçülen değerler başlıktakilerin önüne geçer.
+        """
+        stats_data.setdefault("srs", header.get("srs"))
+        entries = {entry["name"]: entry for entry in stats_data.get("statistic", [])}
+        for entry in header.get("statistic", []):
+            current = entries.get(entry["name"])
+            if current is None:
+                stats_data["statistic"].append(dict(entry, position=len(stats_data["statistic"])))
+            elif "counts" in entry and "counts" not in current:
+                current["counts"] = entry["counts"]
+        return stats_data
@@ -1,66 +1,78 @@
-from PyQt5.QtCore import QObject, pyqtSignal
-import numpy as np
+from core.cancellable_worker import CancellableWorker
+from core.pipeline_process import PipelineCancelled
+from core.stats_engine import StreamingStats
+from core.filter_worker import FilterWorker
+from PyQt5.QtCore import pyqtSignal
+from typing import List, Optional
 import traceback
-import pdal
 import json
 
 
-class StatsWorker(QObject):
+class StatsWorker(CancellableWorker):
     finished = pyqtSignal(str, dict)
     error = pyqtSignal(str)
     progress = pyqtSignal(int)
 
-    def __init__(self, file_path: str, pipeline_config: list):
+    CHUNK_SIZE = 1_000_000
+
+    def __init__(
+        self,
+        file_path: str,
+        pipeline_config: list,
+        total_points: int = 0,
+        dimensions: Optional[List[str]] = None,
+    ):
         super().__init__()
         self.file_path = file_path
         self.pipeline_config = pipeline_config
+        self.total_points = total_points
+        self.dimensions = dimensions
 
-    def run(self):
-        try:
-            self.progress.emit(10)
-
-            json_str = json.dumps(self.pipeline_config)
-            pipeline = pdal.Pipeline(json_str)
-
-            self.progress.emit(-1)
-            count = pipeline.execute()
-            self.progress.emit(80)
-            metadata = pipeline.metadata
-            stats_data = metadata.get("metadata", {}).get("filters.stats", {})
+    def _is_streamable(self) -> bool:
+        return all(
+            isinstance(stage_conf, dict)
+            and stage_conf.get("type") in FilterWorker.STREAMABLE_STAGES
+            for stage_conf in self.pipeline_config
+        )
 
-            try:
-                arrays = pipeline.arrays[0]
-                dims = arrays.dtype.names
+    def _run_streaming(self) -> dict:
+        """
+        Pipeline'ı parça parça okur; istatistikler parçalar üzerinden
+        biriktirilir, bellekte yalnızca bir parça ve sabit boyutlu örnek kalır.
+        """
+        import pdal
+        engine = StreamingStats(self.dimensions)
+        pipeline = pdal.Pipeline(json.dumps(self.pipeline_config))
 
-                if "Classification" in dims:
-                    cls_data = arrays["Classification"]
-                    unique, counts = np.unique(cls_data, return_counts=True)
+        for chunk in pipeline.iterator(chunk_size=self.CHUNK_SIZE):
+            if self.is_interrupted:
+                raise PipelineCancelled()
+            engine.add(chunk)
+            if self.total_points:
+                self.progress.emit(min(95, 10 + int(engine.count / self.total_points * 85)))
+        return engine.result()
 
-                    counts_formatted = [f"{int(u)}/{c}" for u, c in zip(unique, counts)]
-
-                    if "statistic" in stats_data:
-                        found = False
-                        for stat in stats_data["statistic"]:
-                            if stat.get("name") == "Classification":
-                                stat["counts"] = counts_formatted
-                                found = True
-                                break
-
-                        if not found:
-                            stats_data["statistic"].append(
-                                {
-                                    "name": "Classification",
-                                    "counts": counts_formatted,
-                                    "count": count,
-                                }
-                            )
-
-            except Exception as np_err:
-                print(f"Numpy count patch warning: {np_err}")
+    def run(self):
+        try:
+            self.progress.emit(10)
+            if self._is_streamable():
+                stats_data = self._run_streaming()
+            else:
+                # Akışa uygun olmayan aşamalar tüm noktaları bekler; istatistik
+                # ayrı işlemde hesaplanır ve yalnızca sonuç aktarılır
+                self.progress.emit(-1)
+                result = self.execute_pipeline(
+                    self.pipeline_config,
+                    want_arrays=False,
+                    stats={"dimensions": self.dimensions},
+                )
+                stats_data = result["stats"]
 
             self.progress.emit(100)
             self.finished.emit(self.file_path, stats_data)
 
+        except PipelineCancelled:
+            self.cancelled.emit()
         except Exception as e:
             self.error.emit(
                 f"Statistics calculation failed: {str(e)}\n{traceback.format_exc()}"
@@ -6,6 +6,7 @@ from .styles import LightTheme, DarkTheme, HighContrastTheme, OceanicTheme, Fore
 class ThemeManager:
     _themes: Dict[str, Type[BaseTheme]] = {}
     _observers = []
+    _current_theme = None
     _themes[LightTheme.name] = LightTheme
     _themes[DarkTheme.name] = DarkTheme
     _themes[HighContrastTheme.name] = HighContrastTheme
@@ -21,6 +22,12 @@ class ThemeManager:
     @classmethod
     def add_observer(cls, callback_func):
         cls._observers.append(callback_func)
+        # Sonradan oluşturulan bileşenler de mevcut temayı hemen alır
+        if cls._current_theme is not None:
+            try:
+                callback_func(cls._current_theme)
+            except Exception:
+                pass
 
     @classmethod
     def apply_theme(cls, theme_name: str):
@@ -29,6 +36,7 @@ class ThemeManager:
             return
         
         theme_instance = theme_cls()
+        cls._current_theme = theme_instance
         stylesheet = theme_instance.get_stylesheet()
         
         app = QApplication.instance()
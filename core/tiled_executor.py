@@ -0,0 +1,316 @@
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from core.pipeline_process import terminate_pool
+from data.writers import LasWriter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from numpy.lib import recfunctions as rfn
+import multiprocessing
+import numpy as np
+import tempfile
+import shutil
+import math
+import json
+import os
+
+# Noktanın hangi karonun iç bölgesine ait olduğunu işaretleyen geçici boyut
+CORE_DIMENSION = "TileCore"
+
+
+def _process_tile(tile: Dict, stages: list, writer_stage: Optional[Dict] = None):
+    """
+    Tek bir karoyu ayrı bir işlemde çalıştırır: tampon dahil noktalar
+    yüklenir, iç bölge işaretlenir, aşamalar uygulanır ve yalnızca iç
+    bölgedeki noktalar döndürülür. writer_stage verilmişse noktalar
+    döndürülmek yerine o dosyaya yazılır ve (yol, nokta sayısı) döner.
+    """
+    import pdal
+
+    if tile.get("path"):
+        points = np.fromfile(tile["path"], dtype=np.dtype(tile["dtype"]))
+    else:
+        reader = dict(tile["reader"], bounds=TiledExecutor.bounds_string(tile["buffered"]))
+        pipeline = pdal.Pipeline(json.dumps([reader]))
+        pipeline.execute()
+        points = np.concatenate(pipeline.arrays) if pipeline.arrays else None
+
+    if points is None or len(points) == 0:
+        return np.empty(0)
+
+    # İç bölge aşamalardan önce işaretlenir; koordinatı değiştiren aşamalar
+    # (ör. yeniden projeksiyon) ayrımı bozmaz
+    core = TiledExecutor.core_mask(points, tile)
+    points = rfn.append_fields(
+        points, CORE_DIMENSION, core.astype(np.uint8), usemask=False
+    )
+
+    pipeline = pdal.Pipeline(json.dumps(stages), arrays=[points])
+    pipeline.execute()
+    if not pipeline.arrays:
+        return np.empty(0)
+
+    result = np.concatenate(pipeline.arrays)
+    result = result[result[CORE_DIMENSION] == 1]
+    names = [name for name in result.dtype.names if name != CORE_DIMENSION]
+    result = rfn.repack_fields(result[names])
+
+    if writer_stage is None:
+        return result
+    if len(result) == 0:
+        return None
+    pipeline = pdal.Pipeline(json.dumps([writer_stage]), arrays=[result])
+    pipeline.execute()
+    return writer_stage["filename"], len(result)
+
+
+class TiledExecutor:
+    """
+    Komşuluk tabanlı aşamaları (outlier, SMRF, normal vb.) katmanı XY
+    karolarına bölerek paralel işlemlerde çalıştırır. Her karo tampon
+    bölgesiyle birlikte işlenir, sonuçta yalnızca iç bölgedeki noktalar
+    tutulur. Sabit yarıçaplı aşamalarda tampon yeterliyse iç bölgeler karosuz
+    çalıştırmayla aynıdır; k komşulu veya karo geneli eşik kullanan aşamalarda
+    (BaseTool.tiling_exact = False) sonuç yaklaşıktır. Karolar arası kimlik
+    eşleştirmesi yapılmadığından kümeleme aşamaları karolanmaz; önceki
+    aşamalar yalnızca nokta başına çalışıyorsa (POINTWISE_STAGES) karolanır.
+
+    İç bölgeler yarı açık aralıklardır ([min, max)) ve dıştaki karoların
+    dış kenarları sınırsızdır; her nokta tam olarak bir karoya düşer.
+    Uzamsal okuyucularda (COPC/EPT) her karo yalnızca kendi sınırını
+    okur; diğerlerinde dosya bir kez akış halinde okunup karolara ayrılır.
+    """
+
+    DEFAULT_TILE_SIZE = 500.0
+    CHUNK_SIZE = 1_000_000
+
+    SPATIAL_READERS = ("readers.copc", "readers.ept")
+
+    # Her noktayı tek başına işleyen aşamalar; karo başına yeniden
+    # çalıştırılmaları sonucu değiştirmez. Diğerleri (seyreltme, baş/son,
+    # komşuluk aşamaları) nokta sırasına veya bulutun tamamına bağlıdır.
+    POINTWISE_STAGES = {
+        "filters.range",
+        "filters.expression",
+        "filters.assign",
+        "filters.crop",
+        "filters.reprojection",
+        "filters.ferry",
+        "filters.stats",
+    }
+
+    def __init__(
+        self,
+        reader_stage: Dict,
+        stages: list,
+        bounds: Tuple[float, float, float, float],
+        tile_size: float,
+        buffer: float,
+        max_workers: Optional[int] = None,
+        writer_options: Optional[Dict] = None,
+    ):
+        if tile_size <= 0:
+            raise ValueError("Tile size must be positive.")
+        self.reader_stage = reader_stage
+        self.stages = stages
+        self.bounds = bounds
+        self.tile_size = float(tile_size)
+        self.buffer = max(0.0, float(buffer))
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        # Karo dosyalarının ortak başlık alanları (ölçek, ofset, format)
+        self.writer_options = writer_options or {}
+
+        minx, miny, maxx, maxy = bounds
+        self.nx = max(1, math.ceil((maxx - minx) / self.tile_size))
+        self.ny = max(1, math.ceil((maxy - miny) / self.tile_size))
+
+    @classmethod
+    def order_dependent_stages(cls, stages: list) -> List[str]:
+        """
+        Karolu aşamadan önce çalışan ve karo başına yeniden çalıştırıldığında
+        farklı sonuç veren aşamaların türleri; boş değilse karolama yapılmaz.
+        """
+        return [
+            stage_conf.get("type", "?") if isinstance(stage_conf, dict) else "?"
+            for stage_conf in stages
+            if not isinstance(stage_conf, dict)
+            or stage_conf.get("type") not in cls.POINTWISE_STAGES
+        ]
+
+    @staticmethod
+    def bounds_string(rect: Tuple[float, float, float, float]) -> str:
+        minx, miny, maxx, maxy = rect
+        return f"([{minx}, {maxx}], [{miny}, {maxy}])"
+
+    @staticmethod
+    def core_mask(points: np.ndarray, tile: Dict) -> np.ndarray:
+        x, y = points["X"], points["Y"]
+        mask = np.ones(len(points), dtype=bool)
+        minx, miny, maxx, maxy = tile["core"]
+        if tile["ix"] > 0:
+            mask &= x >= minx
+        if tile["ix"] < tile["nx"] - 1:
+            mask &= x < maxx
+        if tile["iy"] > 0:
+            mask &= y >= miny
+        if tile["iy"] < tile["ny"] - 1:
+            mask &= y < maxy
+        return mask
+
+    def tiles(self) -> List[Dict]:
+        minx, miny, _, _ = self.bounds
+        tiles = []
+        for iy in range(self.ny):
+            for ix in range(self.nx):
+                x0 = minx + ix * self.tile_size
+                y0 = miny + iy * self.tile_size
+                core = (x0, y0, x0 + self.tile_size, y0 + self.tile_size)
+                tiles.append({
+                    "index": len(tiles),
+                    "ix": ix,
+                    "iy": iy,
+                    "nx": self.nx,
+                    "ny": self.ny,
+                    "core": core,
+                    "buffered": (
+                        core[0] - self.buffer,
+                        core[1] - self.buffer,
+                        core[2] + self.buffer,
+                        core[3] + self.buffer,
+                    ),
+                })
+        return tiles
+
+    def _tile_index(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        minx, miny, _, _ = self.bounds
+        ix = np.clip(np.floor((x - minx) / self.tile_size), 0, self.nx - 1).astype(np.int64)
+        iy = np.clip(np.floor((y - miny) / self.tile_size), 0, self.ny - 1).astype(np.int64)
+        return ix, iy
+
+    def _partition(
+        self, tiles: List[Dict], work_dir: str, cancel_callback: Optional[Callable[[], bool]]
+    ) -> bool:
+        """
+        Dosyayı bir kez akış halinde okuyup her noktayı tamponu kendisini
+        kapsayan tüm karoların dosyalarına ekler. İptal edilirse False döner.
+        """
+        import pdal
+
+        reach = math.ceil(self.buffer / self.tile_size)
+        rects = np.array([tile["buffered"] for tile in tiles])
+        pipeline = pdal.Pipeline(json.dumps([self.reader_stage]))
+
+        for chunk in pipeline.iterator(chunk_size=self.CHUNK_SIZE):
+            if cancel_callback and cancel_callback():
+                return False
+
+            x, y = chunk["X"], chunk["Y"]
+            base_ix, base_iy = self._tile_index(x, y)
+
+            for dy in range(-reach, reach + 1):
+                for dx in range(-reach, reach + 1):
+                    ix, iy = base_ix + dx, base_iy + dy
+                    valid = (ix >= 0) & (ix < self.nx) & (iy >= 0) & (iy < self.ny)
+                    if not (dx == 0 and dy == 0):
+                        # Komşu karonun tampon dikdörtgenine düşen noktalar
+                        ids = np.where(valid, iy * self.nx + ix, 0)
+                        rect = rects[ids]
+                        valid &= (
+                            (x >= rect[:, 0]) & (x <= rect[:, 2])
+                            & (y >= rect[:, 1]) & (y <= rect[:, 3])
+                        )
+
+                    ids = (iy * self.nx + ix)[valid]
+                    if len(ids) == 0:
+                        continue
+                    selected = chunk[valid]
+                    order = np.argsort(ids, kind="stable")
+                    ids, selected = ids[order], selected[order]
+                    unique_ids, starts = np.unique(ids, return_index=True)
+                    ends = list(starts[1:]) + [len(ids)]
+                    for tile_id, start, end in zip(unique_ids, starts, ends):
+                        tile = tiles[tile_id]
+                        if "path" not in tile:
+                            tile["path"] = os.path.join(work_dir, f"tile_{tile_id}.bin")
+                            tile["dtype"] = selected.dtype.descr
+                        with open(tile["path"], "ab") as f:
+                            f.write(selected[start:end].tobytes())
+        return True
+
+    def _writer_stage(self, tile: Dict, output_dir: Optional[str]) -> Optional[Dict]:
+        if output_dir is None:
+            return None
+        path = os.path.join(output_dir, f"tile_{tile['index']}.las")
+        return {**LasWriter().build_stage(path), **self.writer_options}
+
+    def run(
+        self,
+        consume: Callable[[Any], None],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancel_callback: Optional[Callable[[], bool]] = None,
+        output_dir: Optional[str] = None,
+    ) -> bool:
+        """
+        Karoları işler ve sonuçları karo sırasıyla consume'a verir; böylece
+        aynı girdi her seferinde aynı sırayla birleştirilir. output_dir
+        verilmişse her karonun iç bölgesi orada bir LAS dosyasına yazılır ve
+        consume dizi yerine (yol, nokta sayısı) alır; sonuç belleğe
+        taşınmaz. İptal edilirse False döner.
+        """
+        tiles = self.tiles()
+        spatial = self.reader_stage.get("type") in self.SPATIAL_READERS
+        work_dir = None if spatial else tempfile.mkdtemp(prefix="tiles_")
+
+        try:
+            if spatial:
+                for tile in tiles:
+                    tile["reader"] = self.reader_stage
+            else:
+                if not self._partition(tiles, work_dir, cancel_callback):
+                    return False
+                # Hiç nokta düşmeyen karolar çalıştırılmaz
+                tiles = [tile for tile in tiles if "path" in tile]
+
+            total = len(tiles)
+            done = 0
+            pending = list(tiles)
+            running = {}
+            # Sırası gelmemiş tamamlanmış sonuçlar
+            ready: Dict[int, np.ndarray] = {}
+            next_position = 0
+            positions = {tile["index"]: i for i, tile in enumerate(tiles)}
+            context = multiprocessing.get_context("spawn")
+
+            with ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context) as executor:
+                while pending or running:
+                    if cancel_callback and cancel_callback():
+                        terminate_pool(executor)
+                        return False
+
+                    # Sonuçlar belleğe sığsın diye bekleyen iş ve sonuç sayısı sınırlı tutulur
+                    while pending and len(running) + len(ready) < self.max_workers * 2:
+                        tile = pending.pop(0)
+                        future = executor.submit(
+                            _process_tile,
+                            tile,
+                            self.stages,
+                            self._writer_stage(tile, output_dir),
+                        )
+                        running[future] = tile
+
+                    completed, _ = wait(list(running), timeout=0.5, return_when=FIRST_COMPLETED)
+                    for future in completed:
+                        tile = running.pop(future)
+                        ready[positions[tile["index"]]] = future.result()
+                        if tile.get("path"):
+                            os.remove(tile["path"])
+
+                    while next_position in ready:
+                        result = ready.pop(next_position)
+                        next_position += 1
+                        if result is not None and len(result):
+                            consume(result)
+                        done += 1
+                        if progress_callback:
+                            progress_callback(done, total)
+            return True
+        finally:
+            if work_dir:
+                shutil.rmtree(work_dir, ignore_errors=True)
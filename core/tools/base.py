@@ -1,7 +1,18 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import math
 
 class BaseTool(ABC):
+
+    # Komşuluk tabanlı araçlar karolara bölünüp tamponla çalıştırılabilir
+    neighborhood = False
+    # False ise karolu sonuç karosuz çalıştırmayla yalnızca yaklaşık aynıdır
+    # (komşu sayısına dayalı araçlar, karo geneli eşikler, karo sınırından
+    # kurulan ızgaralar)
+    tiling_exact = True
+    TILE_BUFFER = 10.0
+    # Seyrek bölgelerde k. komşu ortalama mesafenin birkaç katı uzakta olabilir
+    KNN_BUFFER_FACTOR = 3.0
     
     @property
     @abstractmethod
@@ -28,4 +39,31 @@ class BaseTool(ABC):
         pass
 
     def build_config(self, params:Dict[str, Any]) -> Dict[str, Any]:
-        pass
\ No newline at end of file
+        pass
+
+    def get_tile_buffer(
+        self, params: Dict[str, Any], point_spacing: Optional[float] = None
+    ) -> float:
+        """
+        Karo iç bölgesindeki sonucun değişmemesi için gereken tampon (metre).
+        point_spacing katmanın ortalama nokta aralığıdır (bilinmiyorsa None).
+        """
+        return self.TILE_BUFFER
+
+    def _knn_buffer(self, k: int, point_spacing: Optional[float], hops: int = 1) -> float:
+        """
+        k komşulu araçlar için tampon: 2.5B bulutta k. komşu yaklaşık
+        aralık * sqrt(k / pi) uzaktadır; seyrek bölgeler için KNN_BUFFER_FACTOR
+        ile genişletilir. hops, komşuların komşularına bakan araçlar içindir (LOF).
+        """
+        if not point_spacing or point_spacing <= 0:
+            return self.TILE_BUFFER
+        reach = point_spacing * math.sqrt(max(1, k) / math.pi) * self.KNN_BUFFER_FACTOR
+        return max(self.TILE_BUFFER, hops * reach)
+
+    def suggest_params(self, distributions: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Katmanın boyut çizelgelerinden (DimensionSketch) önerilen parametreler.
+        Veriye bağlı önerisi olmayan araçlar boş sözlük döndürür.
+        """
+        return {}
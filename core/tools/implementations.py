@@ -1,6 +1,6 @@
 from core.tools.registry import register_tool
 from core.tools.base import BaseTool
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, Optional, Union
 
 @register_tool
 class OutlierFilter(BaseTool):
@@ -11,6 +11,9 @@ class OutlierFilter(BaseTool):
         "Use 'Clean Data' mode to directly delete noise points."
     )
     supports_batch = True
+    neighborhood = True
+    # Ortalama/sapma eşiği her karonun kendi noktalarından hesaplanır
+    tiling_exact = False
 
     def get_default_params(self) -> Dict[str, Any]:
         return {
@@ -19,6 +22,11 @@ class OutlierFilter(BaseTool):
             "mode": ["Classify Only", "Clean Data"]
         }
 
+    def get_tile_buffer(
+        self, params: Dict[str, Any], point_spacing: Optional[float] = None
+    ) -> float:
+        return self._knn_buffer(int(params.get("mean_k", 8)), point_spacing)
+
     def build_config(self, params: Dict[str, Any]) -> Union[Dict, List]:
         mode = params.get("mode", "Classify Only")
         
@@ -63,18 +71,38 @@ class IqrFilter(BaseTool):
         }
         return iqr_stage
 
+    def suggest_params(self, distributions: Dict[str, Any]) -> Dict[str, Any]:
+        # Çitler %0.1 ve %99.9 yüzdeliklerine oturacak şekilde k seçilir
+        sketch = distributions.get("Z")
+        if sketch is None or sketch.count == 0:
+            return {}
+        low, q1, q3, high = sketch.quantiles([0.001, 0.25, 0.75, 0.999])
+        iqr = q3 - q1
+        if iqr <= 0:
+            return {}
+        k = max((high - q3) / iqr, (q1 - low) / iqr, 0.5)
+        return {"dimension": "Z", "k": round(float(k), 2)}
+
 @register_tool
 class LofFilter(BaseTool):
     name = "LOF (Local Density)"
     group = "Cleaning & Noise"
     description = "Local Outlier Factor (LOF). Detects local outliers based on density."
     supports_batch = True
+    neighborhood = True
+    tiling_exact = False
 
     def get_default_params(self) -> Dict[str, Any]:
         return {
             "minpts": 10
         }
 
+    def get_tile_buffer(
+        self, params: Dict[str, Any], point_spacing: Optional[float] = None
+    ) -> float:
+        # LOF komşuların kendi k-mesafelerini de kullanır
+        return self._knn_buffer(int(params.get("minpts", 10)), point_spacing, hops=2)
+
     def build_config(self, params: Dict[str, Any]) -> Dict[str, Any]:
         return {
             "type": "filters.lof",
@@ -170,6 +198,9 @@ class SmrfFilter(BaseTool):
         "Classifies ground (Class 2). Use 'Extract Ground' to keep only ground points."
     )
     supports_batch = True
+    neighborhood = True
+    # Izgara her karonun kendi sınırlarından kurulur
+    tiling_exact = False
 
     def get_default_params(self) -> Dict[str, Any]:
         return {
@@ -179,6 +210,12 @@ class SmrfFilter(BaseTool):
             "action": ["Classify Only", "Extract Ground"]
         }
 
+    def get_tile_buffer(
+        self, params: Dict[str, Any], point_spacing: Optional[float] = None
+    ) -> float:
+        # Morfolojik pencere karo kenarını aşmamalı
+        return max(self.TILE_BUFFER, float(params.get("window", 18.0)))
+
     def build_config(self, params: Dict[str, Any]) -> Union[Dict, List]:
         action = params.get("action", "Classify Only")
         
@@ -238,6 +275,9 @@ class CsfFilter(BaseTool):
     group = "Ground Classification" 
     description = "Cloth Simulation Filter. Very robust for terrain extraction."
     supports_batch = True
+    neighborhood = True
+    # Kumaş her karonun kendi sınırları üzerinde simüle edilir
+    tiling_exact = False
 
     def get_default_params(self) -> Dict[str, Any]:
         return {
@@ -247,6 +287,11 @@ class CsfFilter(BaseTool):
             "action": ["Classify Only", "Extract Ground"]
         }
 
+    def get_tile_buffer(
+        self, params: Dict[str, Any], point_spacing: Optional[float] = None
+    ) -> float:
+        return max(self.TILE_BUFFER, 20 * float(params.get("resolution", 1.0)))
+
     def build_config(self, params: Dict[str, Any]) -> Union[Dict, List]:
         action = params.get("action", "Classify Only")
 
@@ -343,6 +388,14 @@ class RangeFilter(BaseTool):
             "limits": str(params.get("limits", "Classification![7:7]"))
         }
 
+    def suggest_params(self, distributions: Dict[str, Any]) -> Dict[str, Any]:
+        # Yükseklikte %0.1 - %99.9 dışındaki uç noktaları atan aralık
+        sketch = distributions.get("Z")
+        if sketch is None or sketch.count == 0:
+            return {}
+        low, high = sketch.quantiles([0.001, 0.999])
+        return {"limits": f"Z[{low:.3f}:{high:.3f}]"}
+
 @register_tool
 class ExpressionFilter(BaseTool):
     name = "Expression (Math)"
@@ -506,10 +559,17 @@ class NormalFilter(BaseTool):
     group = "Analysis & Features"
     description = "Calculates surface normal vectors (NormalX, NormalY, NormalZ)."
     supports_batch = True
+    neighborhood = True
+    tiling_exact = False
 
     def get_default_params(self) -> Dict[str, Any]:
         return {"knn": 10}
 
+    def get_tile_buffer(
+        self, params: Dict[str, Any], point_spacing: Optional[float] = None
+    ) -> float:
+        return self._knn_buffer(int(params.get("knn", 10)), point_spacing)
+
     def build_config(self, params: Dict[str, Any]) -> Dict[str, Any]:
         return {
             "type": "filters.normal",
@@ -522,10 +582,17 @@ class EigenvaluesFilter(BaseTool):
     group = "Analysis & Features" 
     description = "Calculates covariance eigenvalues (Linearity, Planarity)."
     supports_batch = True
+    neighborhood = True
+    tiling_exact = False
 
     def get_default_params(self) -> Dict[str, Any]:
         return {"knn": 10}
 
+    def get_tile_buffer(
+        self, params: Dict[str, Any], point_spacing: Optional[float] = None
+    ) -> float:
+        return self._knn_buffer(int(params.get("knn", 10)), point_spacing)
+
     def build_config(self, params: Dict[str, Any]) -> Dict[str, Any]:
         return {
             "type": "filters.eigenvalues",
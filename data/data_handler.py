@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 
 class IBasicReader(ABC):
@@ -35,3 +35,22 @@ class IDataWriter(ABC):
     @abstractmethod
     def write(self, file_path: str, data: Any, **kwargs) -> Dict[str, Any]:
         pass
+
+
+class IPointCloudOpener(ABC):
+
+    @abstractmethod
+    def open(self, file_path: str, max_points: Optional[int] = None) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def get_preview_levels(self, file_path: str) -> List[int]:
+        pass
+
+    @abstractmethod
+    def get_preview_sample(self, file_path: str, max_points: int) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def get_reader_config(self, file_path: str) -> Dict[str, Any]:
+        pass
@@ -0,0 +1,423 @@
+from typing import Dict, Any, List, Optional, BinaryIO
+import struct
+import os
+
+
+class LasHeader:
+    """
+    LAS/LAZ dosyalarının public header, VLR/EVLR ve LAZ chunk table
+    bilgilerini nokta kayıtlarını çözmeden okur.
+    """
+
+    SIGNATURE = b"LASF"
+
+    WKT_RECORD_ID = 2112
+    GEOKEY_RECORD_ID = 34735
+    LASZIP_RECORD_ID = 22204
+    LASZIP_USER_ID = "laszip encoded"
+    PROJECTION_USER_ID = "LASF_Projection"
+    COPC_USER_ID = "copc"
+    COPC_INFO_RECORD_ID = 1
+    SPEC_USER_ID = "LASF_Spec"
+    EXTRA_BYTES_RECORD_ID = 4
+    EXTRA_BYTES_DESCRIPTOR_SIZE = 192
+
+    # Extra bytes data_type -> (numpy tipi, bayt) (LAS 1.4 R15, Tablo 24).
+    # 0 = belgelenmemiş baytlar; 11-30 kullanımdan kalkmış çoklu alanlardır.
+    EXTRA_BYTES_TYPES = {
+        1: ("u1", 1), 2: ("i1", 1), 3: ("<u2", 2), 4: ("<i2", 2), 5: ("<u4", 4),
+        6: ("<i4", 4), 7: ("<u8", 8), 8: ("<i8", 8), 9: ("<f4", 4), 10: ("<f8", 8),
+    }
+
+    # GeoTIFF GeoKey kimlikleri (ProjectedCSType, GeographicType)
+    PROJECTED_CS_KEY = 3072
+    GEOGRAPHIC_CS_KEY = 2048
+
+    # Nokta formatı -> standart kayıt boyutu (extra bytes hariç)
+    POINT_RECORD_SIZES = {
+        0: 20, 1: 28, 2: 26, 3: 34, 4: 57, 5: 63,
+        6: 30, 7: 36, 8: 38, 9: 59, 10: 67,
+    }
+
+    @staticmethod
+    def is_las_file(file_path: str) -> bool:
+        try:
+            with open(file_path, "rb") as f:
+                return f.read(4) == LasHeader.SIGNATURE
+        except OSError:
+            return False
+
+    @staticmethod
+    def read(file_path: str) -> Dict[str, Any]:
+        try:
+            with open(file_path, "rb") as f:
+                header = LasHeader._read_public_header(f)
+                vlrs = LasHeader._read_vlrs(f, header)
+                evlrs = LasHeader._read_evlrs(f, header)
+                header["vlrs"] = vlrs + evlrs
+
+                LasHeader._apply_projection(f, header, header["vlrs"])
+                LasHeader._apply_laszip(f, header, header["vlrs"])
+                LasHeader._apply_copc(f, header, header["vlrs"])
+                LasHeader._apply_extra_bytes(f, header, header["vlrs"])
+
+            return {"status": True, "header": header}
+        except Exception as e:
+            return {"status": False, "error": f"LAS header read failed: {e}"}
+
+    @staticmethod
+    def to_pdal_metadata(header: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Header sözlüğünü readers.las metadata yapısına dönüştürür, böylece
+        mevcut metadata tüketicileri (özet, bounds, SRID tespiti) değişmeden çalışır.
+        """
+        wkt = header.get("wkt", "")
+        readers_las = {
+            "count": header["point_count"],
+            "minx": header["minx"],
+            "miny": header["miny"],
+            "minz": header["minz"],
+            "maxx": header["maxx"],
+            "maxy": header["maxy"],
+            "maxz": header["maxz"],
+            "scale_x": header["scale_x"],
+            "scale_y": header["scale_y"],
+            "scale_z": header["scale_z"],
+            "offset_x": header["offset_x"],
+            "offset_y": header["offset_y"],
+            "offset_z": header["offset_z"],
+            "dataformat_id": header["point_format"],
+            "point_length": header["point_length"],
+            "major_version": header["major_version"],
+            "minor_version": header["minor_version"],
+            "global_encoding": header["global_encoding"],
+            "filesource_id": header["file_source_id"],
+            "project_id": header["project_id"],
+            "system_id": header["system_id"],
+            "software_id": header["software_id"],
+            "creation_doy": header["creation_doy"],
+            "creation_year": header["creation_year"],
+            "header_size": header["header_size"],
+            "dataoffset": header["point_data_offset"],
+            "count_by_return": header["points_by_return"],
+            "compressed": header["compressed"],
+            "spatialreference": wkt,
+            "comp_spatialreference": wkt,
+            "srs": {"wkt": wkt, "json": {}},
+        }
+        if header.get("laszip"):
+            readers_las["laszip"] = header["laszip"]
+        if header.get("copc"):
+            readers_las["copc"] = True
+            readers_las["copc_info"] = header["copc"]
+
+        return {"metadata": {"readers.las": readers_las}}
+
+    @staticmethod
+    def _unpack(f: BinaryIO, fmt: str):
+        size = struct.calcsize(fmt)
+        buffer = f.read(size)
+        if len(buffer) != size:
+            raise ValueError("Unexpected end of file while reading header.")
+        return struct.unpack(fmt, buffer)
+
+    @staticmethod
+    def _decode_text(raw: bytes) -> str:
+        return raw.split(b"\x00", 1)[0].decode("ascii", errors="replace").strip()
+
+    @staticmethod
+    def _read_public_header(f: BinaryIO) -> Dict[str, Any]:
+        signature = f.read(4)
+        if signature != LasHeader.SIGNATURE:
+            raise ValueError("Not a LAS/LAZ file (missing LASF signature).")
+
+        file_source_id, global_encoding = LasHeader._unpack(f, "<HH")
+        guid1, guid2, guid3, guid4 = LasHeader._unpack(f, "<IHH8s")
+        major, minor = LasHeader._unpack(f, "<BB")
+        system_id, software_id = LasHeader._unpack(f, "<32s32s")
+        creation_doy, creation_year, header_size = LasHeader._unpack(f, "<HHH")
+        point_data_offset, vlr_count = LasHeader._unpack(f, "<II")
+        raw_format, point_length = LasHeader._unpack(f, "<BH")
+        legacy_count = LasHeader._unpack(f, "<I")[0]
+        legacy_by_return = list(LasHeader._unpack(f, "<5I"))
+        scale = LasHeader._unpack(f, "<3d")
+        offset = LasHeader._unpack(f, "<3d")
+        maxx, minx, maxy, miny, maxz, minz = LasHeader._unpack(f, "<6d")
+
+        header = {
+            "file_source_id": file_source_id,
+            "global_encoding": global_encoding,
+            "project_id": f"{guid1:08X}-{guid2:04X}-{guid3:04X}-{guid4.hex().upper()}",
+            "major_version": major,
+            "minor_version": minor,
+            "system_id": LasHeader._decode_text(system_id),
+            "software_id": LasHeader._decode_text(software_id),
+            "creation_doy": creation_doy,
+            "creation_year": creation_year,
+            "header_size": header_size,
+            "point_data_offset": point_data_offset,
+            "vlr_count": vlr_count,
+            # LAZ dosyalarında format byte'ının üst bitleri sıkıştırmayı işaretler
+            "point_format": raw_format & 0x3F,
+            "compressed": bool(raw_format & 0xC0),
+            "point_length": point_length,
+            "point_count": legacy_count,
+            "points_by_return": legacy_by_return,
+            "scale_x": scale[0],
+            "scale_y": scale[1],
+            "scale_z": scale[2],
+            "offset_x": offset[0],
+            "offset_y": offset[1],
+            "offset_z": offset[2],
+            "minx": minx,
+            "miny": miny,
+            "minz": minz,
+            "maxx": maxx,
+            "maxy": maxy,
+            "maxz": maxz,
+            "evlr_offset": 0,
+            "evlr_count": 0,
+            "wkt": "",
+            "epsg": None,
+            "laszip": None,
+            "copc": None,
+            "extra_bytes": [],
+        }
+
+        if major == 1 and minor >= 4 and header_size >= 375:
+            LasHeader._unpack(f, "<Q")  # start of waveform data record
+            evlr_offset, evlr_count = LasHeader._unpack(f, "<QI")
+            point_count = LasHeader._unpack(f, "<Q")[0]
+            by_return = list(LasHeader._unpack(f, "<15Q"))
+
+            header["evlr_offset"] = evlr_offset
+            header["evlr_count"] = evlr_count
+            if point_count:
+                header["point_count"] = point_count
+                header["points_by_return"] = by_return
+
+        return header
+
+    @staticmethod
+    def _read_vlr_list(
+        f: BinaryIO, start: int, count: int, extended: bool, limit: int
+    ) -> List[Dict[str, Any]]:
+        records = []
+        f.seek(start)
+        header_fmt = "<H16sHQ32s" if extended else "<H16sHH32s"
+
+        for _ in range(count):
+            if f.tell() >= limit:
+                break
+            _, user_id, record_id, length, description = LasHeader._unpack(
+                f, header_fmt
+            )
+            data_start = f.tell()
+            records.append(
+                {
+                    "user_id": LasHeader._decode_text(user_id),
+                    "record_id": record_id,
+                    "description": LasHeader._decode_text(description),
+                    "length": length,
+                    "data_offset": data_start,
+                }
+            )
+            f.seek(data_start + length)
+
+        return records
+
+    @staticmethod
+    def _read_vlrs(f: BinaryIO, header: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return LasHeader._read_vlr_list(
+            f,
+            header["header_size"],
+            header["vlr_count"],
+            extended=False,
+            limit=header["point_data_offset"],
+        )
+
+    @staticmethod
+    def _read_evlrs(f: BinaryIO, header: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if not header["evlr_offset"] or not header["evlr_count"]:
+            return []
+
+        file_size = os.fstat(f.fileno()).st_size
+        return LasHeader._read_vlr_list(
+            f,
+            header["evlr_offset"],
+            header["evlr_count"],
+            extended=True,
+            limit=file_size,
+        )
+
+    @staticmethod
+    def _read_payload(f: BinaryIO, vlr: Dict[str, Any]) -> bytes:
+        f.seek(vlr["data_offset"])
+        return f.read(vlr["length"])
+
+    @staticmethod
+    def _find_vlr(
+        vlrs: List[Dict[str, Any]], user_id: str, record_id: int
+    ) -> Optional[Dict[str, Any]]:
+        for vlr in vlrs:
+            if vlr["user_id"] == user_id and vlr["record_id"] == record_id:
+                return vlr
+        return None
+
+    @staticmethod
+    def _apply_projection(f: BinaryIO, header: Dict[str, Any], vlrs: List[Dict[str, Any]]):
+        wkt_vlr = LasHeader._find_vlr(
+            vlrs, LasHeader.PROJECTION_USER_ID, LasHeader.WKT_RECORD_ID
+        )
+        if wkt_vlr:
+            payload = LasHeader._read_payload(f, wkt_vlr)
+            header["wkt"] = payload.split(b"\x00", 1)[0].decode(
+                "utf-8", errors="replace"
+            )
+            return
+
+        geokey_vlr = LasHeader._find_vlr(
+            vlrs, LasHeader.PROJECTION_USER_ID, LasHeader.GEOKEY_RECORD_ID
+        )
+        if geokey_vlr:
+            payload = LasHeader._read_payload(f, geokey_vlr)
+            header["epsg"] = LasHeader._parse_geokeys(payload)
+
+    @staticmethod
+    def _parse_geokeys(payload: bytes) -> Optional[int]:
+        if len(payload) < 8:
+            return None
+
+        key_count = struct.unpack_from("<4H", payload, 0)[3]
+        projected, geographic = None, None
+
+        for i in range(key_count):
+            offset = 8 + i * 8
+            if offset + 8 > len(payload):
+                break
+            key_id, location, _, value = struct.unpack_from("<4H", payload, offset)
+            # location == 0 ise değer doğrudan value_offset alanındadır
+            if location != 0:
+                continue
+            if key_id == LasHeader.PROJECTED_CS_KEY:
+                projected = value
+            elif key_id == LasHeader.GEOGRAPHIC_CS_KEY:
+                geographic = value
+
+        code = projected or geographic
+        # 32767 GeoTIFF'te "user-defined" anlamına gelir
+        if code and code != 32767:
+            return int(code)
+        return None
+
+    @staticmethod
+    def _apply_laszip(f: BinaryIO, header: Dict[str, Any], vlrs: List[Dict[str, Any]]):
+        laszip_vlr = LasHeader._find_vlr(
+            vlrs, LasHeader.LASZIP_USER_ID, LasHeader.LASZIP_RECORD_ID
+        )
+        if not laszip_vlr:
+            return
+
+        header["compressed"] = True
+        payload = LasHeader._read_payload(f, laszip_vlr)
+        if len(payload) < 34:
+            return
+
+        compressor, coder, ver_major, ver_minor, revision, options, chunk_size = (
+            struct.unpack_from("<HHBBHII", payload, 0)
+        )
+        laszip = {
+            "compressor": compressor,
+            "version": f"{ver_major}.{ver_minor}r{revision}",
+            "chunk_size": chunk_size,
+            "chunk_table_offset": None,
+            "chunk_count": None,
+        }
+
+        # compressor 0 = sıkıştırılmamış, 1 = pointwise (chunk tablosu yok)
+        if compressor >= 2:
+            laszip.update(LasHeader._read_chunk_table_info(f, header))
+
+        header["laszip"] = laszip
+
+    @staticmethod
+    def _apply_copc(f: BinaryIO, header: Dict[str, Any], vlrs: List[Dict[str, Any]]):
+        # COPC, ilk VLR olarak "copc"/1 info kaydı taşıyan LAZ 1.4 dosyasıdır
+        info_vlr = LasHeader._find_vlr(
+            vlrs, LasHeader.COPC_USER_ID, LasHeader.COPC_INFO_RECORD_ID
+        )
+        if not info_vlr or info_vlr["length"] < 88:
+            return
+
+        payload = LasHeader._read_payload(f, info_vlr)
+        (
+            center_x, center_y, center_z, halfsize, spacing,
+            root_hier_offset, root_hier_size, gpstime_min, gpstime_max,
+        ) = struct.unpack_from("<5d2Q2d", payload, 0)
+
+        header["copc"] = {
+            "center": [center_x, center_y, center_z],
+            "halfsize": halfsize,
+            "spacing": spacing,
+            "root_hier_offset": root_hier_offset,
+            "root_hier_size": root_hier_size,
+            "gpstime_minimum": gpstime_min,
+            "gpstime_maximum": gpstime_max,
+        }
+
+    @staticmethod
+    def _apply_extra_bytes(f: BinaryIO, header: Dict[str, Any], vlrs: List[Dict[str, Any]]):
+        """
+        Extra bytes tanımlarını kayıt içindeki sıralarıyla okur. Her öğe
+        {name, type, size, scale, offset} içerir; type None ise alan
+        belgelenmemiş veya desteklenmeyen tiptedir ve yalnızca boyutu bilinir.
+        """
+        vlr = LasHeader._find_vlr(
+            vlrs, LasHeader.SPEC_USER_ID, LasHeader.EXTRA_BYTES_RECORD_ID
+        )
+        if not vlr:
+            return
+
+        payload = LasHeader._read_payload(f, vlr)
+        size = LasHeader.EXTRA_BYTES_DESCRIPTOR_SIZE
+        fields = []
+        for start in range(0, len(payload) - size + 1, size):
+            data_type, options = struct.unpack_from("<BB", payload, start + 2)
+            name = LasHeader._decode_text(payload[start + 4:start + 36])
+            scale = struct.unpack_from("<d", payload, start + 112)[0]
+            offset = struct.unpack_from("<d", payload, start + 136)[0]
+
+            numpy_type, field_size = LasHeader.EXTRA_BYTES_TYPES.get(data_type, (None, None))
+            if data_type == 0:
+                # Belgelenmemiş alanda options bayt sayısını taşır
+                field_size = options
+
+            fields.append(
+                {
+                    "name": name,
+                    "type": numpy_type,
+                    "size": field_size,
+                    # options bit 3/4: scale/offset alanları geçerlidir
+                    "scale": scale if options & 0x08 else None,
+                    "offset": offset if options & 0x10 else None,
+                    "data_type": data_type,
+                }
+            )
+        header["extra_bytes"] = fields
+
+    @staticmethod
+    def _read_chunk_table_info(f: BinaryIO, header: Dict[str, Any]) -> Dict[str, Any]:
+        f.seek(header["point_data_offset"])
+        table_offset = LasHeader._unpack(f, "<q")[0]
+
+        # -1: yazıcı tablo ofsetini dosyanın son 8 byte'ına yazmıştır
+        if table_offset == -1:
+            f.seek(-8, os.SEEK_END)
+            table_offset = LasHeader._unpack(f, "<q")[0]
+
+        if table_offset <= 0:
+            return {}
+
+        f.seek(table_offset)
+        _, chunk_count = LasHeader._unpack(f, "<II")
+        return {"chunk_table_offset": table_offset, "chunk_count": chunk_count}
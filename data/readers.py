@@ -1,126 +1,142 @@
-from data.data_handler import IBasicReader, IMetadataExtractor, IDataSampler
+from data.data_handler import IBasicReader, IMetadataExtractor, IDataSampler, IPointCloudOpener
 from core.render_utils import RenderUtils
 from core.geo_utils import GeoUtils
-from typing import Dict, Any, Union
-from core.enums import Dimensions
-import pdal
+from typing import Dict, Any, List, Optional, Union
+from data.samplers import LasPointSampler, HierarchySampler
+from data.las_header import LasHeader
+import numpy as np
 import json
 import math
+import os
 
 
-class LasLazReader(IBasicReader, IMetadataExtractor, IDataSampler):
+class LasLazReader(IBasicReader, IMetadataExtractor, IDataSampler, IPointCloudOpener):
 
     def __init__(self):
-        self._analysis_pipeline: Union[pdal.Pipeline, None] = None
-        self._render_pipeline: Union[pdal.Pipeline, None] = None
+        self._analysis_pipeline: Union["pdal.Pipeline", None] = None
+        self._render_sample: Union[np.ndarray, None] = None
         self._file_path: Union[str, None] = None
+        self._header_cache: Dict[str, tuple] = {}
 
-    def _calculate_step(self, file_path:str) -> int:
+    def _read_header(self, file_path: str) -> Dict[str, Any]:
         try:
-            quick_config = {
-                "pipeline": [
-                    {"type":"readers.las", "filename":file_path, "count":10}
-                ]
-            }
-            pipeline = pdal.Pipeline(json.dumps(quick_config))
-            pipeline.execute()
-            metadata =  json.loads(pipeline.metadata)
-            total_points = metadata.get("metadata", {}).get("readers.las", {}).get("count", 0)
-            
-            if total_points <= RenderUtils.MAX_VISIBLE_POINTS:
-                return 1
-            step = math.ceil(total_points / RenderUtils.MAX_VISIBLE_POINTS)
-            return step
-        except Exception as e:
-            return 10
+            stat = os.stat(file_path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError as e:
+            return {"status": False, "error": str(e)}
 
-    def read(self, file_path: str) -> Dict[str, Any]:
-        self._file_path = file_path
-        dynamic_step = self._calculate_step(file_path)
-        try:
-            pipeline_stages = [{"type": "readers.las", "filename": f"{file_path}"}]
-            
-            if dynamic_step > 1:
-                pipeline_stages.append({
-                    "type":"filters.decimation",
-                    "step": dynamic_step
-                })
-            
-            render_config = {
-                "pipeline": pipeline_stages
+        cached = self._header_cache.get(file_path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        result = LasHeader.read(file_path)
+        if result.get("status"):
+            header = result["header"]
+            if not header["wkt"] and header["epsg"]:
+                header["wkt"] = GeoUtils.epsg_to_wkt(header["epsg"])
+            result = {
+                "status": True,
+                "header": header,
+                "metadata": LasHeader.to_pdal_metadata(header),
             }
-            self._render_pipeline = pdal.Pipeline(json.dumps(render_config))
-            count = self._render_pipeline.execute()
-            return {"status": True, "count": count}
-        except Exception as e:
-            return {"status": False, "error": f"PDAL Pipeline Error during read: {e}"}
 
-    def get_metadata(self, file_path: str) -> Dict[str, Any]:
-        if not self._file_path:
-            self._file_path = file_path
+        self._header_cache[file_path] = (stamp, result)
+        return result
 
+    def get_reader_config(self, file_path: str) -> Dict[str, Any]:
+        return {"type": "readers.las", "filename": file_path}
+
+    def _read_pdal_metadata(self, file_path: str) -> Dict[str, Any]:
+        import pdal
         analysis_config = {
             "pipeline": [
-                {"type": "readers.las", "filename": f"{self._file_path}", "count": 10}
+                {"type": "readers.las", "filename": f"{file_path}", "count": 10}
             ]
         }
         try:
             temp_pipeline = pdal.Pipeline(json.dumps(analysis_config))
             temp_pipeline.execute()
-            metadata_dict = temp_pipeline.metadata
             self._analysis_pipeline = temp_pipeline
-            return {"status": True, "metadata": metadata_dict}
+            return {"status": True, "metadata": temp_pipeline.metadata}
         except Exception as e:
             return {"status": False, "error": str(e)}
 
-    def get_summary_metadata(self, full_metadata: Dict) -> Dict[str, Any]:
+    @staticmethod
+    def _step_for_count(total_points: int, max_points: int = RenderUtils.MAX_VISIBLE_POINTS) -> int:
+        if total_points <= max_points:
+            return 1
+        return math.ceil(total_points / max_points)
+
+    @staticmethod
+    def _build_render_pipeline(file_path: str, step: int) -> "pdal.Pipeline":
+        import pdal
+        pipeline_stages = [{"type": "readers.las", "filename": f"{file_path}"}]
+
+        if step > 1:
+            pipeline_stages.append({
+                "type":"filters.decimation",
+                "step": step
+            })
+
+        render_config = {
+            "pipeline": pipeline_stages
+        }
+        return pdal.Pipeline(json.dumps(render_config))
+
+    def _read_render_sample(
+        self,
+        file_path: str,
+        total_points: int,
+        max_points: int = RenderUtils.MAX_VISIBLE_POINTS,
+    ) -> np.ndarray:
+        header_res = self._read_header(file_path)
+        if header_res.get("status"):
+            try:
+                sample = LasPointSampler.sample(
+                    file_path, header_res["header"], max_points
+                )
+                if sample is not None:
+                    return sample
+            except Exception:
+                pass
+
+        # Örnekleyici kullanılamıyorsa tüm dosyayı çözen decimation'a geri dön
+        render_pipeline = self._build_render_pipeline(
+            file_path, self._step_for_count(total_points, max_points)
+        )
+        render_pipeline.execute()
+        return render_pipeline.arrays[0]
+
+    def read(self, file_path: str) -> Dict[str, Any]:
+        self._file_path = file_path
         try:
-            readers_las = (
-                full_metadata.get("metadata", {})
-                .get("metadata", {})
-                .get("readers.las", {})
-            )
-            spatial_ref = readers_las.get("spatialreference", "")
-            crs_result = GeoUtils.parse_crs_info(spatial_ref)
-            epsg_code = crs_result.get("epsg")
-            unit_name = crs_result.get("unit", "N/A")
-
-            minx = readers_las.get("minx")
-            maxx = readers_las.get("maxx")
-            miny = readers_las.get("miny")
-            maxy = readers_las.get("maxy")
-            minz = readers_las.get("minz")
-            maxz = readers_las.get("maxz")
-            x_range = (
-                f"[{minx:.2f} to {maxx:.2f}]"
-                if minx is not None and maxx is not None
-                else "N/A"
-            )
-            y_range = (
-                f"[{miny:.2f} to {maxy:.2f}]"
-                if miny is not None and maxy is not None
-                else "N/A"
-            )
-            z_range = (
-                f"[{minz:.2f} to {maxz:.2f}]"
-                if minz is not None and maxz is not None
-                else "N/A"
+            meta_res = self.get_metadata(file_path)
+            total_points = (
+                self._get_readers_las(meta_res).get("count", 0)
+                if meta_res["status"]
+                else RenderUtils.MAX_VISIBLE_POINTS * 10
             )
+            self._render_sample = self._read_render_sample(file_path, total_points)
+            return {"status": True, "count": len(self._render_sample)}
+        except Exception as e:
+            return {"status": False, "error": f"PDAL Pipeline Error during read: {e}"}
 
-            return {
-                "status": True,
-                "points": readers_las.get("count", "N/A"),
-                "software_id": readers_las.get("software_id", "N/A"),
-                "is_compressed": readers_las.get("compressed", "N/A"),
-                "crs_name": readers_las.get("srs", {})
-                .get("json", {})
-                .get("name", "N/A"),
-                "epsg": epsg_code if epsg_code else "N/A",
-                "unit": unit_name,
-                "x_range": x_range,
-                "y_range": y_range,
-                "z_range": z_range,
-            }
+    def get_metadata(self, file_path: str) -> Dict[str, Any]:
+        if not self._file_path:
+            self._file_path = file_path
+
+        header_res = self._read_header(file_path)
+        if header_res.get("status"):
+            return {"status": True, "metadata": header_res["metadata"]}
+
+        # Header ayrıştırılamazsa (standart dışı dosya) PDAL'a geri dön
+        return self._read_pdal_metadata(file_path)
+
+    def get_summary_metadata(self, full_metadata: Dict) -> Dict[str, Any]:
+        try:
+            readers_las = self._get_readers_las(full_metadata)
+            crs_result = GeoUtils.parse_crs_info(readers_las.get("spatialreference", ""))
+            return self._build_summary(readers_las, crs_result)
         except Exception as e:
             return {"status": False, "error": str(e)}
 
@@ -133,66 +149,149 @@ class LasLazReader(IBasicReader, IMetadataExtractor, IDataSampler):
             return meta_res
 
         try:
-            readers_las = meta_res["metadata"]["metadata"]["readers.las"]
-            bounds = {
-                "minx": readers_las.get("minx"),
-                "miny": readers_las.get("miny"),
-                "maxx": readers_las.get("maxx"),
-                "maxy": readers_las.get("maxy"),
-            }
-
-            spatial_ref = readers_las.get("spatialreference")
-            crs_result = GeoUtils.parse_crs_info(spatial_ref)
-            source_epsg = crs_result.get("epsg")
-
-            if source_epsg:
-                transformed = GeoUtils.transform_bbox(bounds, source_epsg, 4326)
-                return (
-                    {"status": True, **transformed}
-                    if transformed.get("status")
-                    else transformed
-                )
-            return {"status": True, **bounds}
-
+            readers_las = self._get_readers_las(meta_res)
+            crs_result = GeoUtils.parse_crs_info(readers_las.get("spatialreference"))
+            return self._build_bounds(readers_las, crs_result)
         except Exception as e:
             return {"status": False, "error": f"Bounds error: {e}"}
 
     def get_sample_data(self) -> Dict[str, Any]:
-        if not self._render_pipeline:
-            return {"status": False, "error": "Render pipeline is not initialized."}
+        if self._render_sample is None:
+            return {"status": False, "error": "Render sample is not initialized."}
+
+        return self._extract_render_data(self._render_sample)
+
+    def open(self, file_path: str, max_points: Optional[int] = None) -> Dict[str, Any]:
+        meta_res = self.get_metadata(file_path)
+        if not meta_res["status"]:
+            return meta_res
 
         try:
-            raw_data = self._render_pipeline.arrays[0]
+            readers_las = self._get_readers_las(meta_res)
+            crs_result = GeoUtils.parse_crs_info(readers_las.get("spatialreference", ""))
+            summary_metadata = self._build_summary(readers_las, crs_result)
+            bounds = self._build_bounds(readers_las, crs_result)
+
+            render_sample = self._read_render_sample(
+                file_path,
+                readers_las.get("count", 0),
+                max_points or RenderUtils.MAX_VISIBLE_POINTS,
+            )
+            sample_data = self._extract_render_data(render_sample)
+            if not sample_data.get("status"):
+                return sample_data
 
-            extracted_data = {
-                Dimensions.X: raw_data[Dimensions.X.value],
-                Dimensions.Y: raw_data[Dimensions.Y.value],
-                Dimensions.Z: raw_data[Dimensions.Z.value],
-                "count": len(raw_data[Dimensions.X.value]),
+            return {
+                "status": True,
+                "bounds": bounds,
+                "full_metadata": meta_res,
+                "summary_metadata": summary_metadata,
+                "sample_data": sample_data,
             }
-            dims = raw_data.dtype.names
-
-            if Dimensions.INTENSITY.value in dims:
-                extracted_data[Dimensions.INTENSITY] = raw_data[
-                    Dimensions.INTENSITY.value
-                ]
-
-            if (
-                Dimensions.RED.value in dims
-                and Dimensions.GREEN.value in dims
-                and Dimensions.BLUE.value in dims
-            ):
-                extracted_data[Dimensions.RED] = raw_data[Dimensions.RED.value]
-                extracted_data[Dimensions.GREEN] = raw_data[Dimensions.GREEN.value]
-                extracted_data[Dimensions.BLUE] = raw_data[Dimensions.BLUE.value]
-
-            if Dimensions.CLASSIFICATION.value in dims:
-                extracted_data[Dimensions.CLASSIFICATION] = raw_data[
-                    Dimensions.CLASSIFICATION.value
-                ]
-
-            extracted_data["status"] = True
-            return extracted_data
+        except Exception as e:
+            return {"status": False, "error": f"PDAL Pipeline Error during open: {e}"}
+
+    def get_preview_levels(self, file_path: str) -> List[int]:
+        header_res = self._read_header(file_path)
+        if not header_res.get("status") or not LasPointSampler.supports(
+            header_res["header"]
+        ):
+            # Örnekleme tüm dosyayı çözecekse ara seviyeler yalnızca maliyet ekler
+            return [RenderUtils.MAX_VISIBLE_POINTS]
+
+        total_points = header_res["header"]["point_count"]
+        levels = [
+            level
+            for level in RenderUtils.PREVIEW_LEVELS
+            if level < min(total_points, RenderUtils.MAX_VISIBLE_POINTS)
+        ]
+        return levels + [RenderUtils.MAX_VISIBLE_POINTS]
+
+    def get_preview_sample(self, file_path: str, max_points: int) -> Dict[str, Any]:
+        try:
+            meta_res = self.get_metadata(file_path)
+            total_points = self._get_readers_las(meta_res).get("count", 0)
+            render_sample = self._read_render_sample(file_path, total_points, max_points)
+            return self._extract_render_data(render_sample)
+        except Exception as e:
+            return {"status": False, "error": f"Preview sampling failed: {e}"}
+
+    @staticmethod
+    def _get_readers_las(full_metadata: Dict) -> Dict[str, Any]:
+        return (
+            full_metadata.get("metadata", {})
+            .get("metadata", {})
+            .get("readers.las", {})
+        )
+
+    @staticmethod
+    def _build_summary(readers_las: Dict, crs_result: Dict) -> Dict[str, Any]:
+        epsg_code = crs_result.get("epsg")
+        unit_name = crs_result.get("unit", "N/A")
+
+        crs_name = readers_las.get("srs", {}).get("json", {}).get("name")
+        if not crs_name:
+            crs = crs_result.get("crs")
+            crs_name = crs.name if crs is not None else "N/A"
+
+        minx = readers_las.get("minx")
+        maxx = readers_las.get("maxx")
+        miny = readers_las.get("miny")
+        maxy = readers_las.get("maxy")
+        minz = readers_las.get("minz")
+        maxz = readers_las.get("maxz")
+        x_range = (
+            f"[{minx:.2f} to {maxx:.2f}]"
+            if minx is not None and maxx is not None
+            else "N/A"
+        )
+        y_range = (
+            f"[{miny:.2f} to {maxy:.2f}]"
+            if miny is not None and maxy is not None
+            else "N/A"
+        )
+        z_range = (
+            f"[{minz:.2f} to {maxz:.2f}]"
+            if minz is not None and maxz is not None
+            else "N/A"
+        )
+
+        return {
+            "status": True,
+            "points": readers_las.get("count", "N/A"),
+            "software_id": readers_las.get("software_id", "N/A"),
+            "is_compressed": readers_las.get("compressed", "N/A"),
+            "crs_name": crs_name,
+            "epsg": epsg_code if epsg_code else "N/A",
+            "unit": unit_name,
+            "x_range": x_range,
+            "y_range": y_range,
+            "z_range": z_range,
+        }
+
+    @staticmethod
+    def _build_bounds(readers_las: Dict, crs_result: Dict) -> Dict[str, Any]:
+        bounds = {
+            "minx": readers_las.get("minx"),
+            "miny": readers_las.get("miny"),
+            "maxx": readers_las.get("maxx"),
+            "maxy": readers_las.get("maxy"),
+        }
+
+        source_epsg = crs_result.get("epsg")
+        if source_epsg:
+            transformed = GeoUtils.transform_bbox(bounds, source_epsg, 4326)
+            return (
+                {"status": True, **transformed}
+                if transformed.get("status")
+                else transformed
+            )
+        return {"status": True, **bounds}
+
+    @staticmethod
+    def _extract_render_data(raw_data: np.ndarray) -> Dict[str, Any]:
+        try:
+            return RenderUtils.to_render_data(raw_data)
 
         except Exception as e:
             import traceback
@@ -201,3 +300,198 @@ class LasLazReader(IBasicReader, IMetadataExtractor, IDataSampler):
                 "status": False,
                 "error": f"Sampling Error: {str(e)}\n{traceback.format_exc()}",
             }
+
+
+class _HierarchicalReader(LasLazReader):
+    """
+    Octree hiyerarşisi taşıyan kaynaklar (COPC, EPT) için ortak davranış:
+    önizlemeler çözünürlük sınırlı okunur, böylece dosya boyutundan
+    bağımsız olarak yalnızca üst seviye düğümler çözülür.
+    """
+
+    READER_TYPE = ""
+
+    def get_reader_config(self, file_path: str) -> Dict[str, Any]:
+        return {"type": self.READER_TYPE, "filename": file_path}
+
+    def _read_render_sample(
+        self,
+        file_path: str,
+        total_points: int,
+        max_points: int = RenderUtils.MAX_VISIBLE_POINTS,
+    ) -> np.ndarray:
+        readers_las = self._get_readers_las(self.get_metadata(file_path))
+        return HierarchySampler.sample(
+            self.get_reader_config(file_path), readers_las, total_points, max_points
+        )
+
+    def get_preview_levels(self, file_path: str) -> List[int]:
+        meta_res = self.get_metadata(file_path)
+        total_points = self._get_readers_las(meta_res).get("count", 0)
+        levels = [
+            level
+            for level in RenderUtils.PREVIEW_LEVELS
+            if level < min(total_points, RenderUtils.MAX_VISIBLE_POINTS)
+        ]
+        return levels + [RenderUtils.MAX_VISIBLE_POINTS]
+
+
+class CopcReader(_HierarchicalReader):
+    """
+    COPC dosyaları LAZ 1.4 olduğundan metadata header'dan okunur;
+    nokta okuma readers.copc üzerinden yapılır.
+    """
+
+    READER_TYPE = "readers.copc"
+
+    def is_copc(self, file_path: str) -> bool:
+        if file_path.lower().endswith(".copc.laz"):
+            return True
+        header_res = self._read_header(file_path)
+        return bool(header_res.get("status") and header_res["header"].get("copc"))
+
+
+class EptReader(_HierarchicalReader):
+    """
+    Yerel EPT dizinlerini (ept.json) readers.ept ile okur. Metadata,
+    diğer okuyucularla aynı readers.las yapısına dönüştürülür.
+    """
+
+    READER_TYPE = "readers.ept"
+    EPT_FILE = "ept.json"
+
+    @staticmethod
+    def is_ept(file_path: str) -> bool:
+        if os.path.isdir(file_path):
+            return os.path.exists(os.path.join(file_path, EptReader.EPT_FILE))
+        return os.path.basename(file_path).lower() == EptReader.EPT_FILE
+
+    @staticmethod
+    def _ept_json_path(file_path: str) -> str:
+        if os.path.isdir(file_path):
+            return os.path.join(file_path, EptReader.EPT_FILE)
+        return file_path
+
+    def get_reader_config(self, file_path: str) -> Dict[str, Any]:
+        return {"type": self.READER_TYPE, "filename": self._ept_json_path(file_path)}
+
+    def _read_header(self, file_path: str) -> Dict[str, Any]:
+        ept_path = self._ept_json_path(file_path)
+        try:
+            stat = os.stat(ept_path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError as e:
+            return {"status": False, "error": str(e)}
+
+        cached = self._header_cache.get(ept_path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        try:
+            with open(ept_path, "r", encoding="utf-8") as f:
+                ept = json.load(f)
+            result = {"status": True, "metadata": self._to_pdal_metadata(ept)}
+        except Exception as e:
+            result = {"status": False, "error": f"EPT metadata read failed: {e}"}
+
+        self._header_cache[ept_path] = (stamp, result)
+        return result
+
+    @staticmethod
+    def _to_pdal_metadata(ept: Dict[str, Any]) -> Dict[str, Any]:
+        minx, miny, minz, maxx, maxy, maxz = ept.get("boundsConduit") or ept["bounds"]
+
+        srs = ept.get("srs") or {}
+        wkt = srs.get("wkt", "")
+        if not wkt and srs.get("authority", "").upper() == "EPSG" and srs.get("horizontal"):
+            wkt = GeoUtils.epsg_to_wkt(srs["horizontal"])
+
+        readers_las = {
+            "count": ept.get("points", 0),
+            "minx": minx,
+            "miny": miny,
+            "minz": minz,
+            "maxx": maxx,
+            "maxy": maxy,
+            "maxz": maxz,
+            "software_id": f"EPT ({ept.get('dataType', 'N/A')})",
+            "compressed": ept.get("dataType") == "laszip",
+            "spatialreference": wkt,
+            "comp_spatialreference": wkt,
+            "srs": {"wkt": wkt, "json": {}},
+            "ept": {
+                "version": ept.get("version"),
+                "dataType": ept.get("dataType"),
+                "hierarchyType": ept.get("hierarchyType"),
+                "span": ept.get("span"),
+                "schema": ept.get("schema", []),
+            },
+        }
+
+        for dim in ept.get("schema", []):
+            axis = dim.get("name", "").lower()
+            if axis in ("x", "y", "z"):
+                readers_las[f"scale_{axis}"] = dim.get("scale", 1.0)
+                readers_las[f"offset_{axis}"] = dim.get("offset", 0.0)
+
+        return {"metadata": {"readers.las": readers_las}}
+
+    def get_metadata(self, file_path: str) -> Dict[str, Any]:
+        if not self._file_path:
+            self._file_path = file_path
+
+        header_res = self._read_header(file_path)
+        if header_res.get("status"):
+            return {"status": True, "metadata": header_res["metadata"]}
+        return header_res
+
+
+class PointCloudReader(IBasicReader, IMetadataExtractor, IDataSampler, IPointCloudOpener):
+    """
+    Dosya türüne göre (LAS/LAZ, COPC, EPT) uygun okuyucuyu seçen ön yüz.
+    Yol almayan metotlar son kullanılan okuyucuya yönlendirilir.
+    """
+
+    def __init__(self):
+        self._las_reader = LasLazReader()
+        self._copc_reader = CopcReader()
+        self._ept_reader = EptReader()
+        self._active_reader: LasLazReader = self._las_reader
+
+    def _reader_for(self, file_path: str) -> LasLazReader:
+        if EptReader.is_ept(file_path):
+            reader = self._ept_reader
+        elif self._copc_reader.is_copc(file_path):
+            reader = self._copc_reader
+        else:
+            reader = self._las_reader
+
+        self._active_reader = reader
+        return reader
+
+    def get_reader_config(self, file_path: str) -> Dict[str, Any]:
+        return self._reader_for(file_path).get_reader_config(file_path)
+
+    def read(self, file_path: str) -> Dict[str, Any]:
+        return self._reader_for(file_path).read(file_path)
+
+    def get_metadata(self, file_path: str) -> Dict[str, Any]:
+        return self._reader_for(file_path).get_metadata(file_path)
+
+    def get_summary_metadata(self, full_metadata: Dict) -> Dict[str, Any]:
+        return self._active_reader.get_summary_metadata(full_metadata)
+
+    def get_bounds(self, file_path: str) -> Dict[str, Any]:
+        return self._reader_for(file_path).get_bounds(file_path)
+
+    def get_sample_data(self) -> Dict[str, Any]:
+        return self._active_reader.get_sample_data()
+
+    def open(self, file_path: str, max_points: Optional[int] = None) -> Dict[str, Any]:
+        return self._reader_for(file_path).open(file_path, max_points)
+
+    def get_preview_levels(self, file_path: str) -> List[int]:
+        return self._reader_for(file_path).get_preview_levels(file_path)
+
+    def get_preview_sample(self, file_path: str, max_points: int) -> Dict[str, Any]:
+        return self._reader_for(file_path).get_preview_sample(file_path, max_points)
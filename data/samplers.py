@@ -0,0 +1,334 @@
+from data.las_header import LasHeader
+from typing import Dict, Any, Optional
+import numpy as np
+import json
+import math
+
+
+class LasPointSampler:
+    """
+    Önizleme için dosyanın tamamını çözmeden nokta örneği alır.
+    Sıkıştırılmamış LAS'ta sabit boyutlu kayıtlar memory-map üzerinden
+    adımlı (strided) okunur ve readers.las ile aynı boyutlara çözülür; LAZ'da
+    chunk tablosu sayesinde yalnızca seçilen chunk'lar çözülür.
+    """
+
+    # LAZ dosyasında en az bu kadar chunk penceresi örneklenir
+    LAZ_SAMPLE_WINDOWS = 64
+    # Çözülen nokta sayısı örnek boyutunun en fazla bu katı olur; bütçe izin
+    # verdikçe pencere sayısı artar
+    LAZ_DECODE_FACTOR = 4
+    # Örneğin X/Y kapsamı header sınırlarının bu oranından azsa örnek
+    # dosyayı temsil etmiyor sayılır ve decimation'a geri düşülür
+    MIN_COVERAGE = 0.8
+
+    # LAZ chunk boyutu "değişken" olarak işaretlendiğinde kullanılan değer
+    VARIABLE_CHUNK_SIZE = 0xFFFFFFFF
+
+    # LAS 1.4 format 6-10'da tarama açısı 0.006 derece birimindedir
+    EXTENDED_SCAN_ANGLE_SCALE = 0.006
+
+    @staticmethod
+    def _has_fixed_chunks(header: Dict[str, Any]) -> bool:
+        laszip = header.get("laszip") or {}
+        chunk_size = laszip.get("chunk_size")
+        return bool(
+            chunk_size
+            and chunk_size != LasPointSampler.VARIABLE_CHUNK_SIZE
+            and laszip.get("chunk_count")
+        )
+
+    @staticmethod
+    def _decodable_extra_bytes(header: Dict[str, Any]) -> bool:
+        extra = header.get("extra_bytes") or []
+        if any(field["size"] is None for field in extra):
+            return False
+        standard = LasHeader.POINT_RECORD_SIZES[header["point_format"]]
+        return standard + sum(field["size"] for field in extra) <= header["point_length"]
+
+    @staticmethod
+    def supports(header: Dict[str, Any]) -> bool:
+        """Dosyanın tamamı çözülmeden örneklenebiliyorsa True döner."""
+        required = LasHeader.POINT_RECORD_SIZES.get(header["point_format"])
+        if required is None or header["point_length"] < required:
+            return False
+
+        if header["compressed"]:
+            return LasPointSampler._has_fixed_chunks(header)
+        # Kullanımdan kalkmış extra bytes tipleri PDAL'ın ürettiği
+        # boyutlarla eşleştirilemez
+        return LasPointSampler._decodable_extra_bytes(header)
+
+    @staticmethod
+    def _record_dtype(header: Dict[str, Any]) -> np.dtype:
+        """Ham kayıt düzeni; bit alanları bayt olarak okunup sonra ayrıştırılır."""
+        point_format = header["point_format"]
+        fields = [("X", "<i4", 0), ("Y", "<i4", 4), ("Z", "<i4", 8), ("Intensity", "<u2", 12)]
+
+        if point_format <= 5:
+            fields += [
+                ("ReturnByte", "u1", 14), ("ClassByte", "u1", 15),
+                ("ScanAngleRank", "i1", 16), ("UserData", "u1", 17),
+                ("PointSourceId", "<u2", 18),
+            ]
+            time_offset = 20 if point_format in (1, 3, 4, 5) else None
+            rgb_offset = {2: 20, 3: 28, 5: 28}.get(point_format)
+            nir_offset = None
+        else:
+            fields += [
+                ("ReturnByte", "u1", 14), ("FlagByte", "u1", 15),
+                ("Classification", "u1", 16), ("UserData", "u1", 17),
+                ("ScanAngleRank", "<i2", 18), ("PointSourceId", "<u2", 20),
+            ]
+            time_offset = 22
+            rgb_offset = 30 if point_format in (7, 8, 10) else None
+            nir_offset = 36 if point_format in (8, 10) else None
+
+        if time_offset is not None:
+            fields.append(("GpsTime", "<f8", time_offset))
+        if rgb_offset is not None:
+            fields += [
+                ("Red", "<u2", rgb_offset),
+                ("Green", "<u2", rgb_offset + 2),
+                ("Blue", "<u2", rgb_offset + 4),
+            ]
+        if nir_offset is not None:
+            fields.append(("Infrared", "<u2", nir_offset))
+
+        offset = LasHeader.POINT_RECORD_SIZES[point_format]
+        for extra in header.get("extra_bytes") or []:
+            if extra["type"] is not None and extra["name"]:
+                fields.append((extra["name"], extra["type"], offset))
+            offset += extra["size"]
+
+        return np.dtype(
+            {
+                "names": [name for name, _, _ in fields],
+                "formats": [fmt for _, fmt, _ in fields],
+                "offsets": [off for _, _, off in fields],
+                "itemsize": header["point_length"],
+            }
+        )
+
+    @staticmethod
+    def _output_dtype(header: Dict[str, Any]) -> list:
+        """readers.las'ın aynı dosya için ürettiği boyutlar ve tipler."""
+        point_format = header["point_format"]
+        dtype = [
+            ("X", "<f8"), ("Y", "<f8"), ("Z", "<f8"), ("Intensity", "<u2"),
+            ("ReturnNumber", "u1"), ("NumberOfReturns", "u1"),
+            ("ScanDirectionFlag", "u1"), ("EdgeOfFlightLine", "u1"),
+            ("Classification", "u1"), ("Synthetic", "u1"), ("KeyPoint", "u1"),
+            ("Withheld", "u1"), ("Overlap", "u1"), ("ScanAngleRank", "<f4"),
+            ("UserData", "u1"), ("PointSourceId", "<u2"),
+        ]
+        if point_format in (1, 3, 4, 5) or point_format >= 6:
+            dtype.append(("GpsTime", "<f8"))
+        if point_format >= 6:
+            dtype.append(("ScanChannel", "u1"))
+        if point_format in (2, 3, 5, 7, 8, 10):
+            dtype += [("Red", "<u2"), ("Green", "<u2"), ("Blue", "<u2")]
+        if point_format in (8, 10):
+            dtype.append(("Infrared", "<u2"))
+
+        for extra in header.get("extra_bytes") or []:
+            if extra["type"] is None or not extra["name"]:
+                continue
+            # Ölçekli/ofsetli alanlar PDAL'da double olarak okunur
+            scaled = extra["scale"] is not None or extra["offset"] is not None
+            dtype.append((extra["name"], "<f8" if scaled else extra["type"]))
+        return dtype
+
+    @staticmethod
+    def _scale_records(records: np.ndarray, header: Dict[str, Any]) -> np.ndarray:
+        out = np.empty(len(records), dtype=LasPointSampler._output_dtype(header))
+        for axis in ("x", "y", "z"):
+            name = axis.upper()
+            out[name] = records[name] * header[f"scale_{axis}"] + header[f"offset_{axis}"]
+
+        returns = records["ReturnByte"]
+        if header["point_format"] <= 5:
+            out["ReturnNumber"] = returns & 0x07
+            out["NumberOfReturns"] = (returns >> 3) & 0x07
+            out["ScanDirectionFlag"] = (returns >> 6) & 0x01
+            out["EdgeOfFlightLine"] = (returns >> 7) & 0x01
+
+            # LAS 1.0-1.3 formatlarında sınıf kodu byte'ın alt 5 bitidir
+            classes = records["ClassByte"]
+            out["Classification"] = classes & 0x1F
+            out["Synthetic"] = (classes >> 5) & 0x01
+            out["KeyPoint"] = (classes >> 6) & 0x01
+            out["Withheld"] = (classes >> 7) & 0x01
+            out["Overlap"] = 0
+            out["ScanAngleRank"] = records["ScanAngleRank"]
+        else:
+            out["ReturnNumber"] = returns & 0x0F
+            out["NumberOfReturns"] = (returns >> 4) & 0x0F
+
+            flags = records["FlagByte"]
+            out["Synthetic"] = flags & 0x01
+            out["KeyPoint"] = (flags >> 1) & 0x01
+            out["Withheld"] = (flags >> 2) & 0x01
+            out["Overlap"] = (flags >> 3) & 0x01
+            out["ScanChannel"] = (flags >> 4) & 0x03
+            out["ScanDirectionFlag"] = (flags >> 6) & 0x01
+            out["EdgeOfFlightLine"] = (flags >> 7) & 0x01
+            out["Classification"] = records["Classification"]
+            out["ScanAngleRank"] = (
+                records["ScanAngleRank"] * LasPointSampler.EXTENDED_SCAN_ANGLE_SCALE
+            )
+
+        # Ham kayıtla aynı adı taşıyan kalan alanlar (zaman, renk, extra bytes)
+        copied = {"X", "Y", "Z", "ReturnByte", "ClassByte", "FlagByte", "ScanAngleRank"}
+        for name in records.dtype.names:
+            if name not in copied:
+                out[name] = records[name]
+
+        for extra in header.get("extra_bytes") or []:
+            if extra["type"] is None or not extra["name"]:
+                continue
+            if extra["scale"] is not None:
+                out[extra["name"]] *= extra["scale"]
+            if extra["offset"] is not None:
+                out[extra["name"]] += extra["offset"]
+        return out
+
+    @staticmethod
+    def sample_uncompressed(
+        file_path: str, header: Dict[str, Any], max_points: int
+    ) -> np.ndarray:
+        point_length = header["point_length"]
+        offset = header["point_data_offset"]
+
+        mm = np.memmap(file_path, dtype=np.uint8, mode="r")
+        available = (len(mm) - offset) // point_length
+        count = min(int(header["point_count"]), int(available))
+        if count <= 0:
+            raise ValueError("File contains no point records.")
+
+        record_dtype = LasPointSampler._record_dtype(header)
+        records = np.ndarray(
+            shape=(count,), dtype=record_dtype, buffer=mm, offset=offset
+        )
+
+        step = max(1, math.ceil(count / max_points))
+        # Adımlı görünüm yalnızca seçilen kayıtların sayfalarına dokunur
+        return LasPointSampler._scale_records(records[::step], header)
+
+    @staticmethod
+    def _covers_bounds(points: np.ndarray, header: Dict[str, Any]) -> bool:
+        for axis in ("x", "y"):
+            span = header[f"max{axis}"] - header[f"min{axis}"]
+            if span <= 0:
+                continue
+            values = points[axis.upper()]
+            if (values.max() - values.min()) < span * LasPointSampler.MIN_COVERAGE:
+                return False
+        return True
+
+    @staticmethod
+    def sample_compressed(
+        file_path: str, header: Dict[str, Any], max_points: int
+    ) -> Optional[np.ndarray]:
+        import pdal
+        if not LasPointSampler._has_fixed_chunks(header):
+            return None
+
+        laszip = header["laszip"]
+        chunk_size = laszip["chunk_size"]
+        chunk_count = laszip["chunk_count"]
+        total = int(header["point_count"])
+
+        budget = math.ceil(max_points * LasPointSampler.LAZ_DECODE_FACTOR / chunk_size)
+        windows = min(chunk_count, max(LasPointSampler.LAZ_SAMPLE_WINDOWS, budget))
+
+        readers = []
+        for k in range(windows):
+            start = ((k * chunk_count) // windows) * chunk_size
+            if start >= total:
+                break
+            readers.append(
+                {
+                    "type": "readers.las",
+                    "filename": file_path,
+                    "start": start,
+                    "count": min(chunk_size, total - start),
+                }
+            )
+        if not readers:
+            return None
+
+        # Seçilen chunk'lar tümüyle çözülür ve içlerinden adımlı örnek alınır;
+        # böylece örnek chunk başındaki tarama satırlarına yığılmaz
+        decoded = sum(stage["count"] for stage in readers)
+        step = max(1, math.ceil(decoded / max_points))
+        stages = readers + [{"type": "filters.decimation", "step": step}]
+
+        # Tek pipeline akış modunda çalışır; bellekte bir parça ve örnek kalır
+        pipeline = pdal.Pipeline(json.dumps(stages))
+        arrays = [chunk for chunk in pipeline.iterator(chunk_size=chunk_size) if len(chunk)]
+        if not arrays:
+            return None
+
+        points = np.concatenate(arrays)
+        if not LasPointSampler._covers_bounds(points, header):
+            return None
+        return points
+
+    @staticmethod
+    def sample(
+        file_path: str, header: Dict[str, Any], max_points: int
+    ) -> Optional[np.ndarray]:
+        """
+        Örnek alınamıyorsa (değişken chunk boyutu, bilinmeyen format, header
+        sınırlarını kapsamayan örnek) None döner; çağıran taraf decimation
+        pipeline'ına geri düşer.
+        """
+        if not LasPointSampler.supports(header):
+            return None
+
+        if header["compressed"]:
+            return LasPointSampler.sample_compressed(file_path, header, max_points)
+        return LasPointSampler.sample_uncompressed(file_path, header, max_points)
+
+class HierarchySampler:
+    """
+    COPC ve EPT gibi octree hiyerarşisi olan kaynaklarda önizlemeyi
+    çözünürlük sınırlı okur; PDAL yalnızca hedef yoğunluğa yetecek
+    derinlikteki düğümleri çözer.
+    """
+
+    @staticmethod
+    def resolution_for(bounds: Dict[str, Any], total_points: int, max_points: int) -> Optional[float]:
+        if total_points <= max_points:
+            return None
+
+        width = bounds["maxx"] - bounds["minx"]
+        height = bounds["maxy"] - bounds["miny"]
+        if width <= 0 or height <= 0:
+            return None
+
+        # Nokta bulutu yaklaşık 2.5B kabul edilir: nokta sayısı ~ alan / aralık^2
+        return math.sqrt(width * height / max_points)
+
+    @staticmethod
+    def sample(
+        reader_config: Dict[str, Any],
+        bounds: Dict[str, Any],
+        total_points: int,
+        max_points: int,
+    ) -> np.ndarray:
+        import pdal
+        config = dict(reader_config)
+        resolution = HierarchySampler.resolution_for(bounds, total_points, max_points)
+        if resolution is not None:
+            config["resolution"] = resolution
+
+        pipeline = pdal.Pipeline(json.dumps([config]))
+        pipeline.execute()
+        points = pipeline.arrays[0]
+
+        # Seçilen derinlik hedefi aşabilir; fazlası adımlı seyreltilir
+        if len(points) > max_points:
+            points = points[:: math.ceil(len(points) / max_points)]
+        return points
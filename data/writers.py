@@ -1,7 +1,7 @@
 from data.data_handler import IDataWriter
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 import json
-import pdal
+import os
 
 
 class PipelineWriter(IDataWriter):
@@ -22,12 +22,14 @@ class PipelineWriter(IDataWriter):
 
 class LasWriter(IDataWriter):
 
+    def build_stage(self, file_path: str, **kwargs) -> Dict[str, Any]:
+        return {"type": "writers.las", "filename": file_path, "extra_dims": "all"}
+
     def write(self, file_path: str, data: list, **kwargs) -> Dict[str, Any]:
+        import pdal
         try:
             pipeline_config = data.copy()
-            pipeline_config.append(
-                {"type": "writers.las", "filename": file_path, "extra_dims": "all"}
-            )
+            pipeline_config.append(self.build_stage(file_path, **kwargs))
 
             pipeline = pdal.Pipeline(json.dumps(pipeline_config))
             count = pipeline.execute()
@@ -37,5 +39,46 @@ class LasWriter(IDataWriter):
             return {"status": False, "error": f"Export failed: {str(e)}"}
 
 
+class CopcWriter(LasWriter):
+    """
+    Çıktıyı COPC olarak yazar; dosya uzamsal indeksli ve çözünürlük
+    sınırlı okunabilir olur (readers.copc).
+    """
+
+    EXTENSION = ".copc.laz"
+    DEFAULT_THREADS = max(1, os.cpu_count() or 1)
+
+    def build_stage(self, file_path: str, threads: Optional[int] = None, **kwargs) -> Dict[str, Any]:
+        return {
+            "type": "writers.copc",
+            "filename": file_path,
+            "threads": threads or self.DEFAULT_THREADS,
+            "extra_dims": "all",
+        }
+
+
+class WriterFactory:
+    """Çıktı formatına göre nokta bulutu yazıcısını seçer."""
+
+    LAS = "las"
+    COPC = "copc"
+
+    WRITERS = {LAS: LasWriter, COPC: CopcWriter}
+
+    @staticmethod
+    def detect_format(file_path: str) -> str:
+        if file_path.lower().endswith(CopcWriter.EXTENSION):
+            return WriterFactory.COPC
+        return WriterFactory.LAS
+
+    @staticmethod
+    def create(output_format: Optional[str] = None, file_path: str = "") -> LasWriter:
+        output_format = output_format or WriterFactory.detect_format(file_path)
+        writer_cls = WriterFactory.WRITERS.get(output_format)
+        if writer_cls is None:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        return writer_cls()
+
+
 class MetadataWriter(PipelineWriter):
     pass
@@ -16,12 +16,19 @@ from PyQt5.QtWidgets import (
     QFormLayout,
     QLineEdit,
     QDialogButtonBox,
+    QCheckBox,
+    QGroupBox,
+    QSpinBox,
+    QFileDialog,
 )
 from core.pipeline_builder import PipelineBuilder
+from core.batch_engine import BatchEngine
+from data.writers import WriterFactory
 from ui.filter_dialog import FilterParamsDialog
 from core.tools.registry import ToolRegistry
 from PyQt5.QtGui import QIcon
 from PyQt5.QtCore import Qt, QSize
+import os
 
 
 class SavePresetDialog(QDialog):
@@ -137,7 +144,7 @@ class BatchProcessDialog(QDialog):
         super().__init__(parent)
         self.controller = controller
         self.setWindowTitle("Batch Processor")
-        self.resize(400, 500)
+        self.resize(420, 640)
         self.queued_stages = []
         self._setup_ui()
 
@@ -178,7 +185,7 @@ class BatchProcessDialog(QDialog):
         toolbar_layout.addWidget(btn_remove)
 
         btn_run = self._create_icon_button(
-            "Run Batch", QIcon("ui/resources/icons/run.png"), self.accept
+            "Run Batch", QIcon("ui/resources/icons/run.png"), self._on_run
         )
 
         toolbar_layout.addWidget(btn_run)
@@ -238,6 +245,83 @@ class BatchProcessDialog(QDialog):
         )
         layout.addWidget(self.list_widget)
 
+        self.chk_export = QCheckBox("Write result to file (LAS/LAZ/COPC)")
+        layout.addWidget(self.chk_export)
+
+        self._setup_files_group(layout)
+
+    def _setup_files_group(self, layout):
+        self.grp_files = QGroupBox("Apply to folder of LAS/LAZ files")
+        self.grp_files.setCheckable(True)
+        self.grp_files.setChecked(False)
+        self.grp_files.toggled.connect(lambda checked: self.chk_export.setEnabled(not checked))
+
+        form = QFormLayout()
+        self.grp_files.setLayout(form)
+
+        self.le_input_dir = QLineEdit()
+        form.addRow("Input Folder:", self._with_browse(self.le_input_dir, "Select Input Folder"))
+
+        self.chk_recursive = QCheckBox("Include subfolders")
+        form.addRow("", self.chk_recursive)
+
+        self.le_output_dir = QLineEdit()
+        form.addRow("Output Folder:", self._with_browse(self.le_output_dir, "Select Output Folder"))
+
+        self.le_template = QLineEdit(BatchEngine.DEFAULT_TEMPLATE)
+        self.le_template.setToolTip("Fields: {stem}, {name}, {ext}, {index}")
+        form.addRow("File Name:", self.le_template)
+
+        self.cb_format = QComboBox()
+        self.cb_format.addItem("LAS / LAZ", WriterFactory.LAS)
+        self.cb_format.addItem("COPC", WriterFactory.COPC)
+        form.addRow("Format:", self.cb_format)
+
+        self.sb_workers = QSpinBox()
+        self.sb_workers.setRange(1, max(1, os.cpu_count() or 1))
+        self.sb_workers.setValue(self.sb_workers.maximum())
+        form.addRow("Parallel Files:", self.sb_workers)
+
+        # 0: çekirdekler paralel dosyalara bölünür (BatchEngine varsayılanı)
+        self.sb_threads = QSpinBox()
+        self.sb_threads.setRange(0, max(1, os.cpu_count() or 1))
+        self.sb_threads.setSpecialValueText("Auto")
+        self.sb_threads.setToolTip("COPC writer threads per file.")
+        self.sb_threads.setEnabled(False)
+        self.cb_format.currentIndexChanged.connect(
+            lambda: self.sb_threads.setEnabled(
+                self.cb_format.currentData() == WriterFactory.COPC
+            )
+        )
+        form.addRow("COPC Threads:", self.sb_threads)
+
+        self.sb_retries = QSpinBox()
+        self.sb_retries.setRange(0, 5)
+        self.sb_retries.setValue(1)
+        form.addRow("Retries per File:", self.sb_retries)
+
+        self.chk_skip_existing = QCheckBox("Skip files whose output already exists")
+        form.addRow("", self.chk_skip_existing)
+
+        layout.addWidget(self.grp_files)
+
+    def _with_browse(self, line_edit, title):
+        row = QHBoxLayout()
+        row.setContentsMargins(0, 0, 0, 0)
+        row.addWidget(line_edit)
+        btn_browse = QPushButton("...")
+        btn_browse.setFixedWidth(32)
+        btn_browse.clicked.connect(lambda: self._browse_folder(line_edit, title))
+        row.addWidget(btn_browse)
+        container = QFrame()
+        container.setLayout(row)
+        return container
+
+    def _browse_folder(self, line_edit, title):
+        folder = QFileDialog.getExistingDirectory(self, title, line_edit.text())
+        if folder:
+            line_edit.setText(folder)
+
     def _create_icon_button(self, tooltip, icon, slot):
         btn = QPushButton()
         btn.setIcon(icon)
@@ -374,5 +458,42 @@ class BatchProcessDialog(QDialog):
 
         self._update_list()
 
+    def _on_run(self):
+        if self.is_multi_file_requested():
+            input_dir = self.le_input_dir.text().strip()
+            if not os.path.isdir(input_dir):
+                QMessageBox.warning(self, "Invalid Input", "Please select an existing input folder.")
+                return
+            if not self.get_input_files():
+                QMessageBox.warning(self, "No Files", "No LAS/LAZ files found in the input folder.")
+                return
+            if not self.le_output_dir.text().strip():
+                QMessageBox.warning(self, "Missing Output", "Please select an output folder.")
+                return
+
+        self.accept()
+
     def get_pipeline_stages(self):
         return self.queued_stages
+
+    def is_export_requested(self) -> bool:
+        return self.chk_export.isChecked()
+
+    def is_multi_file_requested(self) -> bool:
+        return self.grp_files.isChecked()
+
+    def get_input_files(self) -> list:
+        return BatchEngine.collect_files(
+            self.le_input_dir.text().strip(), self.chk_recursive.isChecked()
+        )
+
+    def get_multi_file_options(self) -> dict:
+        return {
+            "output_dir": self.le_output_dir.text().strip(),
+            "naming_template": self.le_template.text().strip(),
+            "output_format": self.cb_format.currentData(),
+            "max_workers": self.sb_workers.value(),
+            "threads": self.sb_threads.value() or None,
+            "max_retries": self.sb_retries.value(),
+            "skip_existing": self.chk_skip_existing.isChecked(),
+        }
@@ -1,5 +1,5 @@
 from PyQt5.QtWidgets import QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget, QMenu
-from PyQt5.QtGui import QIcon
+from PyQt5.QtGui import QIcon, QBrush, QColor
 from PyQt5.QtCore import Qt, pyqtSignal
 from typing import Optional
 
@@ -14,6 +14,7 @@ class DataSourcesPanel(QWidget):
     save_full_metadata_requested = pyqtSignal(str)
     remove_layer_requested = pyqtSignal(str)
     remove_stage_requested = pyqtSignal(str, int)
+    toggle_stage_requested = pyqtSignal(str, int, bool)  # file_path, index, is_active
     style_changed_requested = pyqtSignal(str, str)
     visibility_changed_requested = pyqtSignal(str, bool)
 
@@ -109,17 +110,32 @@ class DataSourcesPanel(QWidget):
                 self.style_changed_requested.emit(file_path, "Classification")
 
         elif item_type == "stage":
+            is_active = item.data(0, Qt.UserRole + 2) is not False
+            action_toggle_stage = menu.addAction(
+                "Disable Stage" if is_active else "Enable Stage"
+            )
             action_delete_stage = menu.addAction(
                 QIcon("ui/resources/icons/remove.png"), "Delete Stage"
             )
             selected_action = menu.exec_(self.data_tree.mapToGlobal(position))
 
-            if selected_action == action_delete_stage:
+            if selected_action == action_toggle_stage:
+                index = item.parent().indexOfChild(item)
+                self._set_stage_item_active(item, not is_active)
+                self.toggle_stage_requested.emit(file_path, index, not is_active)
+            elif selected_action == action_delete_stage:
                 parent = item.parent()
                 index = parent.indexOfChild(item)
                 parent.removeChild(item)
                 self.remove_stage_requested.emit(file_path, index)
 
+    def _set_stage_item_active(self, item: QTreeWidgetItem, is_active: bool):
+        item.setData(0, Qt.UserRole + 2, is_active)
+        font = item.font(0)
+        font.setItalic(not is_active)
+        item.setFont(0, font)
+        item.setForeground(0, QBrush() if is_active else QBrush(QColor("gray")))
+
     def _on_single_clicked(self, item: QTreeWidgetItem):
         file_path = item.data(0, Qt.UserRole)
         file_name = item.text(0)
@@ -175,6 +191,7 @@ class DataSourcesPanel(QWidget):
         child_item.setIcon(0, stage_icon)
         child_item.setData(0, Qt.UserRole, file_path)
         child_item.setData(0, Qt.UserRole + 1, "stage")
+        child_item.setData(0, Qt.UserRole + 2, True)
         parent_item.setExpanded(True)
 
     def remove_layer(self, file_path: str):
@@ -269,7 +269,7 @@ class DbManagerDialog(QDialog):
 
     def _on_draw_clicked(self):
         main_win = self.parent()
-        if hasattr(main_win, "map_view"):
+        if getattr(main_win, "map_view", None) is not None:
             try:
                 main_win.map_view.bridge.area_drawn.disconnect(self._inject_spatial_sql)
             except:
@@ -299,7 +299,7 @@ class DbManagerDialog(QDialog):
         self.activateWindow()
 
         main_win = self.parent()
-        if hasattr(main_win, "map_view"):
+        if getattr(main_win, "map_view", None) is not None:
             main_win.map_view.page().runJavaScript("window.clearDrawingsJS();")
 
     def _on_item_clicked(self, i, c):
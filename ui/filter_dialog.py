@@ -13,19 +13,34 @@ from PyQt5.QtWidgets import (
     QFrame,
     QMessageBox,
     QComboBox,
+    QPushButton,
 )
 from core.tools.registry import ToolRegistry
+from core.tiled_executor import TiledExecutor
 from PyQt5.QtCore import Qt
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+import os
 
 
 class FilterParamsDialog(QDialog):
 
-    def __init__(self, tool_name: str, parent=None):
+    def __init__(
+        self,
+        tool_name: str,
+        parent=None,
+        distributions: Optional[Dict[str, Any]] = None,
+        point_spacing: Optional[float] = None,
+    ):
         super().__init__(parent)
         self.tool_name = tool_name
+        # Katmanın boyut çizelgeleri; varsa araç veriye göre parametre önerir
+        self.distributions = distributions or {}
+        # Ortalama nokta aralığı; k komşulu araçların karo tamponu buna göre seçilir
+        self.point_spacing = point_spacing
         self.result_params = {}
+        self.result_tiling = None
         self._widgets = {}
+        self.grp_tiling = None
 
         try:
             self.tool_cls = ToolRegistry.get_tool(tool_name)
@@ -86,8 +101,21 @@ class FilterParamsDialog(QDialog):
             self._widgets[key] = widget
             form_layout.addRow(label_widget, widget)
 
+        suggestions = self.tool_instance.suggest_params(self.distributions)
+        if suggestions:
+            btn_suggest = QPushButton("Suggest from Data")
+            btn_suggest.setToolTip(
+                "Fills parameters from the layer's value distribution (0.1% / 99.9% quantiles)."
+            )
+            btn_suggest.clicked.connect(lambda: self._apply_suggestions(suggestions))
+            form_layout.addRow("", btn_suggest)
+
         param_group.setLayout(form_layout)
         main_layout.addWidget(param_group)
+
+        if self.tool_instance.neighborhood:
+            self._setup_tiling_group(main_layout)
+
         main_layout.addStretch()
 
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
@@ -97,6 +125,45 @@ class FilterParamsDialog(QDialog):
 
         main_layout.addWidget(button_box)
 
+    def _setup_tiling_group(self, layout):
+        self.grp_tiling = QGroupBox("Tiled Processing (full file)")
+        self.grp_tiling.setCheckable(True)
+        self.grp_tiling.setChecked(False)
+        if self.tool_instance.tiling_exact:
+            self.grp_tiling.setToolTip(
+                "Runs the tool on XY tiles in parallel processes. Points inside the buffer "
+                "are used as neighbours only, so tile interiors match an untiled run."
+            )
+        else:
+            self.grp_tiling.setToolTip(
+                "Runs the tool on XY tiles in parallel processes. This tool uses k nearest "
+                "neighbours, per-tile thresholds or grids built from each tile's extent, so "
+                "results near tile edges and in sparse areas are approximate. Increase the buffer to reduce differences."
+            )
+
+        form = QFormLayout()
+        form.setLabelAlignment(Qt.AlignRight | Qt.AlignVCenter)
+
+        self.sb_tile_size = QDoubleSpinBox()
+        self.sb_tile_size.setRange(1.0, 100000.0)
+        self.sb_tile_size.setValue(TiledExecutor.DEFAULT_TILE_SIZE)
+        form.addRow("Tile Size:", self.sb_tile_size)
+
+        self.sb_tile_buffer = QDoubleSpinBox()
+        self.sb_tile_buffer.setRange(0.0, 10000.0)
+        self.sb_tile_buffer.setValue(
+            self.tool_instance.get_tile_buffer(self.default_params, self.point_spacing)
+        )
+        form.addRow("Buffer:", self.sb_tile_buffer)
+
+        self.sb_tile_workers = QSpinBox()
+        self.sb_tile_workers.setRange(1, max(1, os.cpu_count() or 1))
+        self.sb_tile_workers.setValue(self.sb_tile_workers.maximum())
+        form.addRow("Parallel Tiles:", self.sb_tile_workers)
+
+        self.grp_tiling.setLayout(form)
+        layout.addWidget(self.grp_tiling)
+
     def _create_widget_for_value(self, value):
 
         if isinstance(value, bool):
@@ -147,6 +214,18 @@ class FilterParamsDialog(QDialog):
             widget = QLineEdit(str(value))
             return widget
 
+    def _apply_suggestions(self, suggestions: Dict[str, Any]):
+        for key, value in suggestions.items():
+            widget = self._widgets.get(key)
+            if isinstance(widget, QCheckBox):
+                widget.setChecked(bool(value))
+            elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
+                widget.setValue(value)
+            elif isinstance(widget, QComboBox):
+                widget.setCurrentText(str(value))
+            elif isinstance(widget, QLineEdit):
+                widget.setText(str(value))
+
     def _on_accept(self):
         for key, widget in self._widgets.items():
             
@@ -161,8 +240,18 @@ class FilterParamsDialog(QDialog):
                 
             elif isinstance(widget, QLineEdit):
                 self.result_params[key] = widget.text()
+
+        if self.grp_tiling is not None and self.grp_tiling.isChecked():
+            self.result_tiling = {
+                "tile_size": self.sb_tile_size.value(),
+                "buffer": self.sb_tile_buffer.value(),
+                "max_workers": self.sb_tile_workers.value(),
+            }
                 
         self.accept()
 
     def get_params(self) -> Dict[str, Any]:
-        return self.result_params
\ No newline at end of file
+        return self.result_params
+
+    def get_tiling(self) -> Optional[Dict[str, Any]]:
+        return self.result_tiling
@@ -8,23 +8,24 @@ from PyQt5.QtWidgets import (
     QFileDialog,
     QProgressBar,
     QMessageBox,
+    QToolButton,
+    QInputDialog,
 )
 from PyQt5.QtGui import QIcon, QColor, QTextCharFormat, QTextCursor
 from core.application_controller import ApplicationController
 from ui.stats_result_dialog import StatsResultDialog
 from ui.data_sources_panel import DataSourcesPanel
-from ui.tab_viewers import GISMapView, ThreeDView
 from core.settings_manager import SettingsManager
 from ui.filter_dialog import FilterParamsDialog
 from ui.batch_dialog import BatchProcessDialog
 from core.themes.manager import ThemeManager
 from ui.metadata_panel import MetadataPanel
-from ui.db_manager import DbManagerDialog
 from ui.toolbox_panel import ToolboxPanel
 from ui.merge_dialog import MergeDialog
 from ui.model_dialog import ModelDialog
 from ui.crop_dialog import CropDialog
 from PyQt5.QtGui import QCloseEvent
+from data.writers import CopcWriter, WriterFactory
 from core.logger import Logger
 from typing import Optional
 from PyQt5.QtCore import Qt, QTimer
@@ -46,9 +47,18 @@ class MainWindow(QMainWindow):
         self.setWindowIcon(QIcon("ui/resources/icons/app.png"))
         self.setGeometry(100, 100, 1200, 800)
         self.settings_manager = SettingsManager()
+        # Katman başına açık istatistik penceresi
+        self._stats_dialogs = {}
+        # Görünümler kurulana kadar gelen görünüm işleri sırayla bekletilir
+        self.map_view = None
+        self.three_d_view = None
+        self._pending_view_calls = []
         self._setup_ui()
         self._restore_settings()
 
+        # Harita (WebEngine) ve 3B görünüm (pyvista/VTK) pencere çizildikten sonra kurulur
+        QTimer.singleShot(0, self._setup_views)
+
         self.resize_timer = QTimer()
         self.resize_timer.setSingleShot(True)
         self.resize_timer.timeout.connect(self._actual_resize_handler)
@@ -58,7 +68,7 @@ class MainWindow(QMainWindow):
         super().resizeEvent(event)
 
     def _actual_resize_handler(self):
-        if hasattr(self, "three_d_view") and self.three_d_view.plotter:
+        if self.three_d_view is not None and self.three_d_view.plotter:
             self.three_d_view.plotter.setUpdatesEnabled(True)
             self.three_d_view.plotter.render()
 
@@ -96,8 +106,6 @@ class MainWindow(QMainWindow):
             self.metadata_panel.clear_metadata
         )
         self.controller.export_success_signal.connect(self._handle_export_success)
-        self.controller.zoom_map_only_signal.connect(self.map_view.zoom_only)
-        self.controller.focus_3d_mesh_signal.connect(self.three_d_view.zoom_to_mesh)
 
         self.action_open_file = QAction(
             QIcon("ui/resources/icons/open.png"), "Open File", self
@@ -110,7 +118,7 @@ class MainWindow(QMainWindow):
             QIcon("ui/resources/icons/export.png"), "Export Layer", self
         )
         self.action_export_layer.setShortcut("Ctrl+E")
-        self.action_export_layer.setStatusTip("Export selected layer to LAS/LAZ.")
+        self.action_export_layer.setStatusTip("Export selected layer to LAS/LAZ/COPC.")
         self.action_export_layer.triggered.connect(self._on_toolbar_export_layer)
 
         self.action_save_pipeline = QAction(
@@ -132,6 +140,13 @@ class MainWindow(QMainWindow):
         self.action_batch_process.setStatusTip("Run multiple tools in sequence.")
         self.action_batch_process.triggered.connect(self._open_batch_dialog)
 
+        self.action_cancel = QAction(
+            QIcon("ui/resources/icons/remove.png"), "Cancel Running Operation", self
+        )
+        self.action_cancel.setShortcut("Esc")
+        self.action_cancel.setStatusTip("Cancel running operations (Esc).")
+        self.action_cancel.triggered.connect(self.controller.cancel_running_operations)
+
         self.action_about = QAction(
             QIcon("ui/resources/icons/about.png"), "About", self
         )
@@ -157,6 +172,8 @@ class MainWindow(QMainWindow):
         self.file_menu.addAction(self.action_export_layer)
         self.file_menu.addAction(self.action_save_pipeline)
         self.file_menu.addAction(self.action_save_metadata)
+        self.file_menu.addSeparator()
+        self.file_menu.addAction(self.action_cancel)
 
         # View Menu
         self.view_menu = menu_bar.addMenu("View")
@@ -190,6 +207,8 @@ class MainWindow(QMainWindow):
 
     def _open_db_manager(self):
         if not hasattr(self, "db_manager_dlg") or self.db_manager_dlg is None:
+            from ui.db_manager import DbManagerDialog
+
             self.db_manager_dlg = DbManagerDialog(self.controller.data_controller, self)
             self.data_sources_panel.file_single_clicked.connect(
                 self.db_manager_dlg.refresh_layer_name
@@ -221,15 +240,41 @@ class MainWindow(QMainWindow):
 
     def _ask_save_export(self, file_path: str):
         file_name = os.path.basename(file_path)
-        save_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Export Layer",
-            f"export_{file_name}",
-            "LAS Files (*.las);;LAZ Files (*.laz)",
+        save_path, output_format, threads = self._ask_point_cloud_save_path(
+            "Export Layer", f"export_{file_name}"
         )
         if save_path:
             self.progressBar.show()
-            self.controller.start_export_process(file_path, save_path)
+            self.controller.start_export_process(file_path, save_path, output_format, threads)
+
+    def _ask_point_cloud_save_path(self, title: str, default_name: str):
+        copc_filter = "COPC Files (*.copc.laz)"
+        save_path, selected_filter = QFileDialog.getSaveFileName(
+            self,
+            title,
+            default_name,
+            f"LAS Files (*.las);;LAZ Files (*.laz);;{copc_filter}",
+        )
+        if not save_path:
+            return None, None, None
+
+        if selected_filter == copc_filter:
+            if not save_path.lower().endswith(CopcWriter.EXTENSION):
+                save_path = os.path.splitext(save_path)[0] + CopcWriter.EXTENSION
+            # writers.copc düğümleri paralel sıkıştırır; diğer işlerle paylaşılan
+            # makinelerde kullanıcı iş parçacığı sayısını sınırlayabilir
+            threads, accepted = QInputDialog.getInt(
+                self,
+                title,
+                "COPC writer threads:",
+                CopcWriter.DEFAULT_THREADS,
+                1,
+                CopcWriter.DEFAULT_THREADS,
+            )
+            if not accepted:
+                return None, None, None
+            return save_path, WriterFactory.COPC, threads
+        return save_path, WriterFactory.LAS, None
 
     def _ask_save_pipeline(self, file_path: str):
         file_name = os.path.basename(file_path)
@@ -297,6 +342,9 @@ class MainWindow(QMainWindow):
         self.data_sources_panel.remove_stage_requested.connect(
             self.controller.handle_remove_stage
         )
+        self.data_sources_panel.toggle_stage_requested.connect(
+            self.controller.handle_toggle_stage
+        )
         self.data_sources_panel.style_changed_requested.connect(
             self.controller.handle_style_change
         )
@@ -315,8 +363,19 @@ class MainWindow(QMainWindow):
         self.metadata_dock.setWidget(self.metadata_panel)
         self.addDockWidget(Qt.LeftDockWidgetArea, self.metadata_dock)
 
+    def _run_when_views_ready(self, callback):
+        if self.three_d_view is None:
+            self._pending_view_calls.append(callback)
+        else:
+            callback()
+
     def _handle_layer_visibility(self, file_path: str, is_visible: bool):
         self.controller.handle_visibility_change(file_path, is_visible)
+        self._run_when_views_ready(
+            lambda: self._update_layer_visibility(file_path, is_visible)
+        )
+
+    def _update_layer_visibility(self, file_path: str, is_visible: bool):
         self.three_d_view.set_layer_visibility(file_path, is_visible)
 
         if is_visible:
@@ -349,21 +408,30 @@ class MainWindow(QMainWindow):
             self._on_toolbar_statistics()
             return
 
-        dialog = FilterParamsDialog(tool_name, self)
+        dialog = FilterParamsDialog(
+            tool_name,
+            self,
+            distributions=self.controller.get_distributions(current_file),
+            point_spacing=self.controller.get_point_spacing(current_file),
+        )
 
         if dialog.exec_():
             user_params = dialog.get_params()
             self.progressBar.show()
-            self.controller.start_filter_process(current_file, tool_name, user_params)
+            self.controller.start_filter_process(
+                current_file, tool_name, user_params, dialog.get_tiling()
+            )
 
     def _open_file_dialog(self):
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select a file", "", "LAS/LAZ Files (*.las *.laz)"
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self, "Select files", "", "Point Cloud Files (*.las *.laz ept.json);;LAS/LAZ/COPC Files (*.las *.laz);;EPT Files (ept.json)"
         )
 
-        if file_path:
+        if file_paths:
             self.progressBar.show()
-            self.controller.start_file_loading(file_path)
+            # Dosyalar ortak iş havuzunda çekirdek sayısı kadar paralel açılır
+            for file_path in file_paths:
+                self.controller.start_file_loading(file_path)
         else:
             self.logger.warning("No file selected.")
 
@@ -373,11 +441,14 @@ class MainWindow(QMainWindow):
 
     def _handle_controller_file_remove(self, file_path: str):
         self.data_sources_panel.remove_layer(file_path)
-        self.three_d_view.remove_layer_actor(file_path)
-        self.map_view.clear_bbox(file_path)
+        self._run_when_views_ready(lambda: self._remove_layer_from_views(file_path))
         self.metadata_panel.clear_metadata()
         self.statusBar().showMessage("Layer removed.", 3000)
 
+    def _remove_layer_from_views(self, file_path: str):
+        self.three_d_view.remove_layer_actor(file_path)
+        self.map_view.clear_bbox(file_path)
+
     def _on_file_single_clicked(self, file_path: str):
         self.controller.handle_layer_selection(file_path)
 
@@ -389,6 +460,12 @@ class MainWindow(QMainWindow):
         self.controller.handle_double_click(file_path, file_name)
 
     def _handle_render_data(self, file_path: str, style_name: str, reset_view: bool):
+        if self.three_d_view is None:
+            self._pending_view_calls.append(
+                lambda: self._handle_render_data(file_path, style_name, reset_view)
+            )
+            return
+
         sample_data = self.controller.get_layer_data(file_path)
 
         if sample_data is None:
@@ -400,15 +477,26 @@ class MainWindow(QMainWindow):
             return
 
         self.three_d_view.render_point_cloud(
-            file_path, sample_data, color_by=style_name, reset_view=reset_view
+            file_path,
+            sample_data,
+            color_by=style_name,
+            reset_view=reset_view,
+            value_range=self.controller.get_color_range(file_path, style_name),
         )
 
     def _handle_draw_bbox(self, bounds: dict):
         active_path = self.controller.data_controller.active_layer_path
         if active_path:
-            self.map_view.draw_bbox(active_path, bounds)
+            self._run_when_views_ready(
+                lambda: self.map_view.draw_bbox(active_path, bounds)
+            )
 
     def _handle_clear_views(self):
+        if self.three_d_view is None:
+            # Henüz çizilmemiş işler de temizlenir
+            self._pending_view_calls.clear()
+            return
+
         if self.three_d_view.plotter:
             self.three_d_view.layer_actors.clear()
             self.three_d_view.plotter.clear()
@@ -438,8 +526,16 @@ class MainWindow(QMainWindow):
         self.progressBar.hide()
         self.statusBar().addPermanentWidget(self.progressBar)
 
+        self.cancelButton = QToolButton(self.statusBar())
+        self.cancelButton.setText("Cancel")
+        self.cancelButton.setToolTip("Cancel running operations (Esc)")
+        self.cancelButton.clicked.connect(self.controller.cancel_running_operations)
+        self.cancelButton.hide()
+        self.statusBar().addPermanentWidget(self.cancelButton)
+
     def _handle_progress(self, value: int):
         is_active = value != 0 and value != 100
+        self.cancelButton.setVisible(is_active)
         if is_active:
             self.progressBar.show()
             if value == -1:
@@ -519,6 +615,9 @@ class MainWindow(QMainWindow):
         self.tab_widget = QTabWidget()
         self.setCentralWidget(self.tab_widget)
 
+    def _setup_views(self):
+        from ui.tab_viewers import GISMapView, ThreeDView
+
         self.map_view = GISMapView()
         self.three_d_view = ThreeDView()
 
@@ -530,10 +629,18 @@ class MainWindow(QMainWindow):
         )
 
         self.three_d_view.right_click_signal.connect(self._on_view_right_clicked)
+        self.three_d_view.camera_changed.connect(self.controller.handle_camera_change)
 
         ThemeManager.add_observer(self.three_d_view.on_theme_change)
         ThemeManager.add_observer(self.map_view.on_theme_change)
 
+        self.controller.zoom_map_only_signal.connect(self.map_view.zoom_only)
+        self.controller.focus_3d_mesh_signal.connect(self.three_d_view.zoom_to_mesh)
+
+        pending, self._pending_view_calls = self._pending_view_calls, []
+        for callback in pending:
+            callback()
+
     def _setup_toolbox_panel(self):
         self.toolbox_dock = QDockWidget("Toolbox", self)
         self.toolbox_dock.setObjectName("ToolboxDock")
@@ -545,6 +652,9 @@ class MainWindow(QMainWindow):
         self.addDockWidget(Qt.RightDockWidgetArea, self.toolbox_dock)
 
     def _activate_crop_drawing(self):
+        if self.three_d_view is None:
+            return
+
         self.tab_widget.setCurrentWidget(self.three_d_view)
 
         if hasattr(self, "crop_dialog"):
@@ -562,7 +672,8 @@ class MainWindow(QMainWindow):
             self.crop_dialog.activateWindow()
 
     def _on_crop_dialog_finished(self, result):
-        self.three_d_view.disable_crop_gizmo()
+        if self.three_d_view is not None:
+            self.three_d_view.disable_crop_gizmo()
 
     def _on_toolbar_crop(self):
         current_file = self._get_active_layer_path()
@@ -595,8 +706,17 @@ class MainWindow(QMainWindow):
         dialog = MergeDialog(layers, self)
         if dialog.exec_():
             selected_files = dialog.get_files()
+            # Birleştirme doğrudan diske yazılır; sonuç yeni bir dosya katmanı olur
+            default_name = os.path.join(os.path.dirname(selected_files[0]), "merged.laz")
+            save_path, output_format, threads = self._ask_point_cloud_save_path(
+                "Save Merged Point Cloud", default_name
+            )
+            if not save_path:
+                return
             self.progressBar.show()
-            self.controller.start_merge_process(selected_files)
+            self.controller.start_merge_process(
+                selected_files, save_path, output_format, threads
+            )
 
     def _on_toolbar_model(self):
         file_path = self._get_active_layer_path()
@@ -616,23 +736,60 @@ class MainWindow(QMainWindow):
             self.controller.start_stats_process(file_path)
 
     def _show_stats_dialog(self, file_path: str, stats_data: dict):
-        self.progressBar.hide()
+        # Başlık sonucu önce gelir; nokta geçişi bitince aynı pencere güncellenir
+        if not stats_data.get("partial"):
+            self.progressBar.hide()
+
+        dialog = self._stats_dialogs.get(file_path)
+        if dialog is not None and dialog.isVisible():
+            dialog.set_stats(stats_data)
+            return
+
         file_name = os.path.basename(file_path)
         dialog = StatsResultDialog(file_name, stats_data, self)
-        dialog.exec_()
+        dialog.finished.connect(
+            lambda _, path=file_path, closed=dialog: self._on_stats_dialog_closed(path, closed)
+        )
+        self._stats_dialogs[file_path] = dialog
+        dialog.show()
 
-    def _open_batch_dialog(self):
-        file_path = self._get_active_layer_path()
-        if not file_path:
-            return
+    def _on_stats_dialog_closed(self, file_path: str, dialog: StatsResultDialog):
+        if self._stats_dialogs.get(file_path) is dialog:
+            del self._stats_dialogs[file_path]
+        dialog.deleteLater()
 
+    def _open_batch_dialog(self):
         dialog = BatchProcessDialog(self.controller, self)
 
         if dialog.exec_():
             stages = dialog.get_pipeline_stages()
-            if stages:
+            if not stages:
+                return
+
+            if dialog.is_multi_file_requested():
                 self.progressBar.show()
-                self.controller.start_batch_process(file_path, stages)
+                self.controller.start_multi_file_batch(
+                    dialog.get_input_files(), stages, dialog.get_multi_file_options()
+                )
+                return
+
+            file_path = self._get_active_layer_path()
+            if not file_path:
+                return
+
+            export_path, output_format, threads = None, None, None
+            if dialog.is_export_requested():
+                file_name = os.path.basename(file_path)
+                export_path, output_format, threads = self._ask_point_cloud_save_path(
+                    "Batch Output", f"batch_{file_name}"
+                )
+                if not export_path:
+                    return
+
+            self.progressBar.show()
+            self.controller.start_batch_process(
+                file_path, stages, export_path, output_format, threads
+            )
 
     def _restore_settings(self):
         saved_theme = self.settings_manager.load_theme()
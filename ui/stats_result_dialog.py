@@ -8,6 +8,9 @@ from PyQt5.QtWidgets import (
     QTextEdit,
     QDialogButtonBox,
     QWidget,
+    QComboBox,
+    QProgressBar,
+    QLabel,
 )
 from core.render_utils import RenderUtils
 from PyQt5.QtGui import QFont
@@ -27,35 +30,76 @@ class StatsResultDialog(QDialog):
         layout = QVBoxLayout()
         self.setLayout(layout)
 
-        tabs = QTabWidget()
+        self.lbl_source = QLabel()
+        self.lbl_source.setWordWrap(True)
+        layout.addWidget(self.lbl_source)
+
+        self.tabs = QTabWidget()
+        layout.addWidget(self.tabs)
+        self._populate()
+
+        btn_box = QDialogButtonBox(QDialogButtonBox.Close)
+        btn_box.rejected.connect(self.accept)
+        layout.addWidget(btn_box)
+
+    def set_stats(self, stats_data):
+        """Başlık sonucunu nokta geçişi bitince yerinde günceller."""
+        self.stats_data = stats_data
+        self._populate()
+
+    def _populate(self):
+        self.lbl_source.setText(self._source_text())
+
+        current = self.tabs.currentIndex()
+        while self.tabs.count():
+            self.tabs.widget(0).deleteLater()
+            self.tabs.removeTab(0)
+
+        names = {d.get("name") for d in self.stats_data.get("statistic", [])}
 
         self.tab_dimensions = QWidget()
         self._setup_dimensions_tab()
-        tabs.addTab(self.tab_dimensions, "Dimensions")
+        self.tabs.addTab(self.tab_dimensions, "Dimensions")
 
-        if "statistic" in self.stats_data and any(
-            d.get("name") == "Classification" for d in self.stats_data["statistic"]
-        ):
+        if "Classification" in names:
             self.tab_classes = QWidget()
             self._setup_classes_tab()
-            tabs.addTab(self.tab_classes, "Classes")
+            self.tabs.addTab(self.tab_classes, "Classes")
+
+        if "ReturnNumber" in names:
+            self.tab_returns = QWidget()
+            self._setup_counts_tab(self.tab_returns, "ReturnNumber", "Return", str)
+            self.tabs.addTab(self.tab_returns, "Returns")
+
+        if any("histogram" in d for d in self.stats_data.get("statistic", [])):
+            self.tab_histogram = QWidget()
+            self._setup_histogram_tab()
+            self.tabs.addTab(self.tab_histogram, "Histogram")
 
         self.tab_json = QWidget()
         self._setup_json_tab()
-        tabs.addTab(self.tab_json, "Raw JSON")
+        self.tabs.addTab(self.tab_json, "Raw JSON")
 
-        layout.addWidget(tabs)
+        self.tabs.setCurrentIndex(max(0, min(current, self.tabs.count() - 1)))
 
-        btn_box = QDialogButtonBox(QDialogButtonBox.Close)
-        btn_box.rejected.connect(self.accept)
-        layout.addWidget(btn_box)
+    def _source_text(self):
+        srs = self.stats_data.get("srs") or {}
+        parts = []
+        if srs:
+            parts.append(f"CRS: {srs.get('name', 'N/A')} (EPSG: {srs.get('epsg', 'N/A')})")
+
+        if self.stats_data.get("partial"):
+            parts.append("Header values; full statistics are being computed...")
+        elif self.stats_data.get("cached"):
+            parts.append("Loaded from the statistics cache.")
+        return "  |  ".join(parts)
 
     def _setup_dimensions_tab(self):
         layout = QVBoxLayout()
         self.tab_dimensions.setLayout(layout)
 
         table = QTableWidget()
-        columns = ["Name", "Min", "Max", "Average", "StdDev", "Variance"]
+        columns = ["Name", "Min", "Max", "Average", "StdDev", "Variance", "Median (approx.)"]
         table.setColumnCount(len(columns))
         table.setHorizontalHeaderLabels(columns)
         table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
@@ -66,52 +110,59 @@ class StatsResultDialog(QDialog):
         for row, stat in enumerate(stats_list):
             name = stat.get("name", "N/A")
             try:
-                min_val = stat.get("minimum", stat.get("min", 0))
-                max_val = stat.get("maximum", stat.get("max", 0))
-                avg_val = stat.get("average", stat.get("mean", 0))
-                std_val = stat.get("stddev", 0)
-                var_val = stat.get("variance", 0)
+                min_val = stat.get("minimum", stat.get("min"))
+                max_val = stat.get("maximum", stat.get("max"))
+                avg_val = stat.get("average", stat.get("mean"))
+                std_val = stat.get("stddev")
+                var_val = stat.get("variance")
+                median = stat.get("percentiles", {}).get("50")
                 table.setItem(row, 0, QTableWidgetItem(str(name)))
-                table.setItem(row, 1, QTableWidgetItem(f"{float(min_val):.4f}"))
-                table.setItem(row, 2, QTableWidgetItem(f"{float(max_val):.4f}"))
-                table.setItem(row, 3, QTableWidgetItem(f"{float(avg_val):.4f}"))
-                table.setItem(row, 4, QTableWidgetItem(f"{float(std_val):.4f}"))
-                table.setItem(row, 5, QTableWidgetItem(f"{float(var_val):.4f}"))
+                # Başlıktan gelen sonuçlarda nokta geçişi gerektiren alanlar boştur
+                for column, value in enumerate(
+                    (min_val, max_val, avg_val, std_val, var_val, median), start=1
+                ):
+                    text = f"{float(value):.4f}" if value is not None else "-"
+                    table.setItem(row, column, QTableWidgetItem(text))
             except Exception as e:
                 print(f"Error parsing row {row}: {e}")
 
         layout.addWidget(table)
 
     def _setup_classes_tab(self):
+        self._setup_counts_tab(
+            self.tab_classes,
+            "Classification",
+            "Class ID",
+            lambda class_id: f"{class_id} ({RenderUtils.get_label(class_id)})",
+        )
+
+    def _setup_counts_tab(self, tab, dimension, id_title, describe):
         layout = QVBoxLayout()
-        self.tab_classes.setLayout(layout)
+        tab.setLayout(layout)
 
         table = QTableWidget()
         table.setColumnCount(3)
-        table.setHorizontalHeaderLabels(["Class ID", "Count", "Percentage"])
+        table.setHorizontalHeaderLabels([id_title, "Count", "Percentage"])
         table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
         stats_list = self.stats_data.get("statistic", [])
-        class_stat = next(
-            (s for s in stats_list if s.get("name") == "Classification"), None
+        count_stat = next(
+            (s for s in stats_list if s.get("name") == dimension), None
         )
 
-        if class_stat and "counts" in class_stat:
-            counts = class_stat["counts"]
+        if count_stat and "counts" in count_stat:
+            counts = count_stat["counts"]
             table.setRowCount(len(counts))
-            total_points = class_stat.get("count", 1)
+            total_points = count_stat.get("count", 1)
 
             for row, item in enumerate(counts):
                 try:
                     parts = item.split("/")
-                    class_id = parts[0]
+                    value_id = parts[0]
                     count = int(float(parts[1]))
                     percent = (count / total_points) * 100
 
-                    label = RenderUtils.get_label(class_id)
-                    display_text = f"{class_id} ({label})"
-
-                    table.setItem(row, 0, QTableWidgetItem(display_text))
+                    table.setItem(row, 0, QTableWidgetItem(describe(value_id)))
                     table.setItem(row, 1, QTableWidgetItem(f"{count:,}"))
                     table.setItem(row, 2, QTableWidgetItem(f"%{percent:.2f}"))
                 except:
@@ -119,6 +170,53 @@ class StatsResultDialog(QDialog):
 
         layout.addWidget(table)
 
+    def _setup_histogram_tab(self):
+        layout = QVBoxLayout()
+        self.tab_histogram.setLayout(layout)
+
+        self.histograms = {
+            stat["name"]: stat["histogram"]
+            for stat in self.stats_data.get("statistic", [])
+            if stat.get("histogram", {}).get("counts")
+        }
+
+        self.cmb_histogram = QComboBox()
+        self.cmb_histogram.addItems(list(self.histograms))
+        layout.addWidget(self.cmb_histogram)
+
+        self.tbl_histogram = QTableWidget()
+        self.tbl_histogram.setColumnCount(3)
+        self.tbl_histogram.setHorizontalHeaderLabels(["Range", "Count", "Distribution"])
+        self.tbl_histogram.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.tbl_histogram.verticalHeader().setVisible(False)
+        layout.addWidget(self.tbl_histogram)
+
+        self.cmb_histogram.currentTextChanged.connect(self._show_histogram)
+        if "Z" in self.histograms:
+            self.cmb_histogram.setCurrentText("Z")
+        self._show_histogram(self.cmb_histogram.currentText())
+
+    def _show_histogram(self, name):
+        histogram = self.histograms.get(name)
+        if not histogram:
+            self.tbl_histogram.setRowCount(0)
+            return
+
+        edges, counts = histogram["edges"], histogram["counts"]
+        peak = max(counts) or 1
+        self.tbl_histogram.setRowCount(len(counts))
+
+        for row, count in enumerate(counts):
+            self.tbl_histogram.setItem(
+                row, 0, QTableWidgetItem(f"{edges[row]:.4f} – {edges[row + 1]:.4f}")
+            )
+            self.tbl_histogram.setItem(row, 1, QTableWidgetItem(f"{count:,}"))
+            bar = QProgressBar()
+            bar.setRange(0, 1000)
+            bar.setValue(int(count / peak * 1000))
+            bar.setTextVisible(False)
+            self.tbl_histogram.setCellWidget(row, 2, bar)
+
     def _setup_json_tab(self):
         layout = QVBoxLayout()
         self.tab_json.setLayout(layout)
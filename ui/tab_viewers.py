@@ -4,12 +4,14 @@ from PyQt5.QtCore import (
     pyqtSlot,
     QObject,
     pyqtSignal,
+    QTimer,
     QUrl,
 )
 from PyQt5.QtWidgets import QVBoxLayout, QFrame
 from core.render_utils import RenderUtils
 from pyvistaqt import QtInteractor
 from core.enums import Dimensions
+from typing import Optional, Tuple
 import pyvista as pv
 import numpy as np
 import json
@@ -93,6 +95,10 @@ class GISMapView(QWebEngineView):
 class ThreeDView(QFrame):
 
     right_click_signal = pyqtSignal()
+    camera_changed = pyqtSignal(dict)  # {"planes": [24 float], "position": [x, y, z]}
+
+    # Kamera hareketi bittikten sonra LOD güncellemesi için bekleme süresi (ms)
+    CAMERA_DEBOUNCE_MS = 250
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -113,12 +119,19 @@ class ThreeDView(QFrame):
 
         self.plotter.iren.add_observer("RightButtonPressEvent", self._on_right_click)
 
+        self._last_camera_signature = None
+        self._camera_timer = QTimer(self)
+        self._camera_timer.setSingleShot(True)
+        self._camera_timer.timeout.connect(self._emit_camera_state)
+        self.plotter.renderer.AddObserver("EndEvent", self._on_render_end)
+
     def render_point_cloud(
         self,
         file_path: str,
         data_dict: dict,
         color_by: str = "Elevation",
         reset_view: bool = True,
+        value_range: Optional[Tuple[float, float]] = None,
     ):
         point_cloud = self._create_point_cloud(data_dict)
         if point_cloud is None:
@@ -130,7 +143,9 @@ class ThreeDView(QFrame):
         
         self._cleanup_scene_for_layer(file_path)
 
-        clim = self._calculate_robust_clim(point_cloud, scalars, rgb, style_params["is_categorical"])
+        clim = self._calculate_robust_clim(
+            point_cloud, scalars, rgb, style_params["is_categorical"], value_range
+        )
 
         self._add_mesh_to_scene(
             file_path, 
@@ -223,10 +238,14 @@ class ThreeDView(QFrame):
         if file_path in self.layer_actors:
             self.plotter.remove_actor(self.layer_actors[file_path])
 
-    def _calculate_robust_clim(self, point_cloud, scalars, rgb, is_categorical):
+    def _calculate_robust_clim(self, point_cloud, scalars, rgb, is_categorical, value_range=None):
         if rgb or is_categorical or scalars not in point_cloud.point_data:
             return None
-            
+
+        # Katman çizelgelerinden gelen aralık varsa örnek üzerinde yeniden hesaplanmaz
+        if value_range is not None:
+            return list(value_range)
+
         values = point_cloud.point_data[scalars]
         try:
             low, high = np.percentile(values, [2, 98])
@@ -334,4 +353,28 @@ class ThreeDView(QFrame):
             self.plotter.render()
 
     def _on_right_click(self, obj, event):
-        self.right_click_signal.emit()
\ No newline at end of file
+        self.right_click_signal.emit()
+
+    def _on_render_end(self, obj, event):
+        self._camera_timer.start(self.CAMERA_DEBOUNCE_MS)
+
+    def _emit_camera_state(self):
+        camera = self.plotter.camera
+        aspect = self.plotter.renderer.GetTiledAspectRatio()
+        signature = (
+            camera.GetPosition(),
+            camera.GetFocalPoint(),
+            camera.GetViewUp(),
+            camera.GetViewAngle(),
+            aspect,
+        )
+        # LOD güncellemesinin tetiklediği render'lar aynı kamerayı tekrar yayınlamasın
+        if signature == self._last_camera_signature:
+            return
+        self._last_camera_signature = signature
+
+        planes = [0.0] * 24
+        camera.GetFrustumPlanes(aspect, planes)
+        self.camera_changed.emit(
+            {"planes": planes, "position": list(camera.GetPosition())}
+        )
\ No newline at end of file